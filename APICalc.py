@@ -1,6 +1,11 @@
 # Pure implementation - no external library dependencies for core functionality
 import sys
+import math
 import fractions
+import itertools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 
 # Import matrix operations
 try:
@@ -10,206 +15,716 @@ except ImportError:
     Matrix = None
 
 class AdvancedPrecisionNumber:
+    # Values are immutable once constructed, so instances are shared rather than copied. Rarely
+    # set attributes (max_precision, precision_loss_warning, ratio) live in `_extras`, which
+    # stays None for the ordinary numbers that arithmetic creates.
+    __slots__ = ('base', 'precision', 'negative', '_mantissa', '_exponent', '_extras')
+    _EXTRA_DEFAULTS = {'max_precision': 1000, 'precision_loss_warning': False, 'ratio': None}
+
     # Predefined precision modes
     PRECISION_MODES = {
         'standard': 50,     # Default precision
         'high': 200,        # More precise calculations
-        'extreme': 1000     # For scientific/mathematical computations
+        'extreme': 1000,    # For scientific/mathematical computations
+        'exact': 50         # Exact rationals; precision only sets the displayed digits
     }
     
-    # Cache for mathematical constants to avoid recalculation
-    _pi_cache = {}
-    _e_cache = {}
+    # Multiplication dispatch, in 30-bit limbs of the smaller operand. Below the Karatsuba
+    # threshold the interpreter's native limb product is used. Measured with
+    # calibrate_thresholds.py (CPython 3.11.7, one Intel Xeon core under Linux): recursive Toom-3
+    # beats the native product from 1024 limbs (0.50 vs 0.60 ms; 1.6 vs 2.0 ms at 2048, 93 vs
+    # 175 ms at 32768), and Karatsuba on top of the native product, which is itself Karatsuba
+    # inside CPython, never wins by more than timing noise, so its band is empty. NTT only ties
+    # Toom-3 at 2^20 limbs (17.0 vs 17.2 s). Recalibrate on the serving host and override these
+    # attributes there.
+    LIMB_BITS = 30
+    KARATSUBA_THRESHOLD = 1024
+    TOOM3_THRESHOLD = 1024
+    NTT_THRESHOLD = 1 << 20
+
+    # Division dispatch, in 30-bit limbs of the divisor: native long division below the
+    # Burnikel-Ziegler threshold, recursive division up to the Newton threshold, then a
+    # Newton-Raphson reciprocal. Measured with calibrate_thresholds.py on the same host, over the
+    # multiplication thresholds above: Burnikel-Ziegler beats native division from 512 limbs
+    # (0.42 vs 0.49 ms; 1.4 vs 1.8 ms at 1024). Newton never won up to 2^20 limbs (66 vs 39 s),
+    # so its threshold is the calibrator's "no crossover in range" value of twice that size.
+    BURNIKEL_ZIEGLER_THRESHOLD = 512
+    NEWTON_DIVISION_THRESHOLD = 1 << 21
+    # Square roots of radicands below this many limbs use math.isqrt; above it the
+    # precision-doubling Newton kernel built on the dispatched multiply and divide
+    NEWTON_ROOT_THRESHOLD = 4096
+    # Real powers x**(p/q) with q up to this limit are taken exactly as a q-th root of x**p,
+    # as long as that radicand stays below ROOT_POWER_MAX_BITS; others go through exp(y * ln x)
+    ROOT_POWER_MAX_DENOMINATOR = 1000
+    ROOT_POWER_MAX_BITS = 1 << 22
+    # Modular powers with moduli below this many limbs use the interpreter's pow(); above it
+    # Montgomery (odd moduli) or Barrett reduction on the dispatched multiplication kernels
+    MODULAR_REDUCTION_THRESHOLD = 128
+    # GCD dispatch, in 30-bit limbs of the smaller operand. math.gcd runs Lehmer's algorithm in C
+    # and wins up to very large operands; above HALF_GCD_THRESHOLD the subquadratic half-GCD
+    # reduces them first. Extended GCDs have no native kernel, so Lehmer's algorithm in Python
+    # hands over to the half-GCD much earlier, at HALF_XGCD_THRESHOLD, below which modular
+    # inverses use pow(a, -1, m). Half-GCD recursion ends in plain Euclid steps below the leaf size.
+    HALF_GCD_THRESHOLD = 1 << 15
+    HALF_XGCD_THRESHOLD = 128
+    HALF_GCD_LEAF_LIMBS = 32
+
+    # Number-theoretic transform layout: operands are cut into NTT_LIMB_BITS-bit coefficients and
+    # convolved modulo NTT_PRIME_COUNT primes of the form c*2^k + 1, then recombined by CRT.
+    NTT_LIMB_BITS = 512
+    NTT_PRIME_COUNT = 3
+    NTT_MAX_LOG_LENGTH = 27
+    _ntt_primes = None
+
+    # Cache for mathematical constants to avoid recalculation: name -> {precision: value}
+    _constant_cache = {}
+    # Extra decimal digits each constant kernel carries and then truncates away
+    CONSTANT_GUARD_DIGITS = 10
+    # Interned integers in [-limit, limit], keyed by (value, base, precision) for the precisions of
+    # the named modes only, so the pool holds at most (2 * limit + 1) * 35 * 3 numbers; filled by from_int
+    SMALL_INT_POOL_LIMIT = 256
+    _POOLED_PRECISIONS = frozenset(PRECISION_MODES.values())
+    _small_int_pool = {}
+    # Memoised powers of each base used to align and truncate scaled mantissas
+    _power_cache = {}
+    # Recently computed factorials, n -> n! as an int, least recently used first
+    FACTORIAL_MEMO_SIZE = 16
+    _factorial_memo = OrderedDict()
+    # The Flask servers compute on several threads; the memo is only read or changed under this lock
+    _factorial_lock = threading.Lock()
+    # Prime sieve shared by the factorial engine, grown on demand (entry i is 1 when i is prime)
+    _sieve = bytearray()
+    # Optional process-pool mode for huge factorials and their range products: None or 1 keeps
+    # everything in-process; otherwise the number of worker processes used at or above the thresholds
+    PARALLEL_WORKERS = None
+    PARALLEL_FACTORIAL_THRESHOLD = 200000
+    PARALLEL_PRODUCT_THRESHOLD = 20000
     
     # Mathematical constants for pure implementation
+    @classmethod
+    def _get_constant(cls, name, precision=50):
+        """A named constant to `precision` decimal places, from the cache when possible"""
+        cache = cls._constant_cache.setdefault(name, {})
+        if precision in cache:
+            return cache[precision]
+
+        # A value cached at higher precision only needs truncating
+        higher = [p for p in cache if p > precision]
+        if higher:
+            source = cache[min(higher)]
+            value = cls._from_parts(source._mantissa, source._exponent, False, 10, precision)
+        else:
+            guard = cls.CONSTANT_GUARD_DIGITS
+            kernel = getattr(cls, cls._CONSTANT_KERNELS[name])
+            mantissa = kernel(precision + guard) // cls._base_power(10, guard)
+            value = cls._from_parts(mantissa, -precision, False, 10, precision)
+        cache[precision] = value
+        return value
+
     @classmethod
     def _get_pi(cls, precision=50):
-        """Calculate Pi using Chudnovsky algorithm (simplified) - non-recursive approach"""
-        # Check cache first
-        if precision in cls._pi_cache:
-            return cls._pi_cache[precision]
-        
-        # Use a simple but effective series for pi: π = 4 * Σ((-1)^k / (2k+1))
-        # This is the Leibniz formula, slower but non-recursive
-        result = cls('0', 10, 'standard')
-        result.precision = precision
-        
-        one = cls('1', 10, 'standard')
-        one.precision = precision
-        
-        # Use more iterations for better precision
-        for k in range(precision * 20):
-            # Calculate (-1)^k / (2k+1)
-            denominator = cls(str(2*k + 1), 10, 'standard')
-            denominator.precision = precision
-            
-            term = one / denominator
-            
-            if k % 2 == 0:
-                result = result + term
-            else:
-                result = result - term
-            
-            # Early termination check
-            if k > 10 and abs(term._base_to_decimal()) < 10**(-precision-5):
-                break
-        
-        # Multiply by 4 to get pi
-        four = cls('4', 10, 'standard')
-        four.precision = precision
-        pi = four * result
-        
-        # Cache the result
-        cls._pi_cache[precision] = pi
-        return pi
-    
+        """Pi by the Chudnovsky series with binary splitting"""
+        return cls._get_constant('pi', precision)
+
     @classmethod
     def _get_e(cls, precision=50):
-        """Calculate e using Taylor series: e = Σ(1/n!) for n=0 to infinity"""
-        # Check cache first
-        if precision in cls._e_cache:
-            return cls._e_cache[precision]
-        
-        result = cls('1', 10, 'standard')  # Start with 1
-        result.precision = precision
-        factorial = cls('1', 10, 'standard')
-        factorial.precision = precision
-        
-        for n in range(1, min(precision * 2, 100)):  # Limit iterations to prevent overflow
-            n_num = cls(str(n), 10, 'standard')
-            n_num.precision = precision
-            factorial = factorial * n_num
-            
-            one = cls('1', 10, 'standard')
-            one.precision = precision
-            term = one / factorial
-            result = result + term
-            
-            # Early termination if term becomes negligible
-            try:
-                if term._base_to_decimal() < 10**(-precision-5):
-                    break
-            except:
-                break
-        
-        # Cache the result
-        cls._e_cache[precision] = result
-        return result
-    
+        """e = sum of 1/k! by binary splitting"""
+        return cls._get_constant('e', precision)
+
     @classmethod
-    def _arctan_taylor_simple(cls, x, precision=50):
-        """Simple arctan calculation without recursion for small values |x| < 1"""
-        result = cls('0', 10, 'standard')
-        result.precision = precision
-        x_squared = x * x
-        x_power = x
-        sign = 1
-        
-        # Use fewer terms to avoid deep recursion
-        max_terms = min(precision, 50)
-        for n in range(1, max_terms * 2, 2):  # Odd terms only
-            n_num = cls(str(n), 10, 'standard')
-            n_num.precision = precision
-            term = x_power / n_num
-            
-            if sign > 0:
-                result = result + term
-            else:
-                result = result - term
-            
-            x_power = x_power * x_squared
-            sign *= -1
-            
-            # Early termination
-            try:
-                if abs(term._base_to_decimal()) < 10**(-precision):
-                    break
-            except:
-                break
-        
-        return result
-    
+    def _get_ln2(cls, precision=50):
+        """Natural logarithm of 2 from a Machin-like atanh formula"""
+        return cls._get_constant('ln2', precision)
+
     @classmethod
-    def _arctan_taylor(cls, x, precision=50):
-        """Calculate arctan(x) using Taylor series with improved convergence"""
-        x_val = abs(x._base_to_decimal())
-        
-        # For large values, use the identity arctan(x) = π/2 - arctan(1/x)
-        # But avoid recursion by using approximation
-        if x_val >= 1:
-            # Use approximation: arctan(x) ≈ π/2 - 1/x for large x
-            pi = cls._get_pi(precision)
-            pi_half = pi / cls('2', 10, 'standard')
-            
-            one = cls('1', 10, 'standard')
-            one.precision = precision
-            reciprocal = one / x
-            
-            # Use simple series for arctan(1/x) where 1/x is small
-            arctan_recip = cls._arctan_taylor_simple(reciprocal, precision)
-            
-            if x._base_to_decimal() > 0:
-                result = pi_half - arctan_recip
+    def _get_ln10(cls, precision=50):
+        """Natural logarithm of 10 from the same atanh series as ln 2"""
+        return cls._get_constant('ln10', precision)
+
+    @classmethod
+    def _get_euler_gamma(cls, precision=50):
+        """Euler-Mascheroni constant by the Brent-McMillan algorithm"""
+        return cls._get_constant('euler_gamma', precision)
+
+    @classmethod
+    def _get_sqrt2(cls, precision=50):
+        """Square root of 2"""
+        return cls._get_constant('sqrt2', precision)
+
+    # Kernels return floor(constant * 10**digits), give or take a unit or two
+    _CONSTANT_KERNELS = {
+        'pi': '_chudnovsky_pi',
+        'e': '_e_digits',
+        'ln2': '_ln2_digits',
+        'ln10': '_ln10_digits',
+        'euler_gamma': '_euler_gamma_digits',
+        'sqrt2': '_sqrt2_digits',
+    }
+
+    @classmethod
+    def _chudnovsky_pi(cls, digits):
+        """floor(pi * 10**digits) (to within one unit) from a single final division"""
+        # Each term of the series adds about 14.18 digits
+        terms = digits // 14 + 2
+        _, q, t = cls._chudnovsky_split(0, terms)
+        one = cls._base_power(10, digits)
+        sqrt_10005 = cls._int_iroot(10005 * cls._int_square(one), 2)
+        numerator = cls._int_multiply(cls._int_multiply(q, 426880), sqrt_10005)
+        return cls._int_divmod(numerator, t)[0]
+
+    @classmethod
+    def _chudnovsky_split(cls, a, b):
+        """Binary splitting of the Chudnovsky terms a..b-1 into the integers P, Q and T"""
+        if b - a == 1:
+            if a == 0:
+                p = q = 1
             else:
-                result = -pi_half - arctan_recip
-            
-            return result
-        else:
-            # For small values, use direct Taylor series
-            return cls._arctan_taylor_simple(x, precision)
+                p = (6 * a - 5) * (2 * a - 1) * (6 * a - 1)
+                q = a * a * a * 10939058860032000  # 640320**3 / 24
+            t = p * (13591409 + 545140134 * a)
+            return p, q, -t if a & 1 else t
+        m = (a + b) // 2
+        p1, q1, t1 = cls._chudnovsky_split(a, m)
+        p2, q2, t2 = cls._chudnovsky_split(m, b)
+        return (cls._int_multiply(p1, p2), cls._int_multiply(q1, q2),
+                cls._signed_multiply(t1, q2) + cls._signed_multiply(p1, t2))
+
+    @classmethod
+    def _e_digits(cls, digits):
+        """floor(e * 10**digits): 1 + P/Q where P/Q = sum of 1/k! for k = 1..N"""
+        # Enough terms that N! exceeds 10**digits
+        terms = 2
+        while math.lgamma(terms + 1) < digits * math.log(10):
+            terms *= 2
+        p, q = cls._e_split(0, terms)
+        one = cls._base_power(10, digits)
+        return one + cls._int_divmod(cls._int_multiply(p, one), q)[0]
+
+    @classmethod
+    def _e_split(cls, a, b):
+        """Binary splitting of sum 1/((a+1)(a+2)...k) for k = a+1..b into P/Q, with Q = (a+1)...b"""
+        if b - a == 1:
+            return 1, b
+        m = (a + b) // 2
+        p1, q1 = cls._e_split(a, m)
+        p2, q2 = cls._e_split(m, b)
+        return cls._int_multiply(p1, q2) + p2, cls._int_multiply(q1, q2)
 
+    @classmethod
+    def _atanh_inverse_digits(cls, q, digits):
+        """floor(atanh(1/q) * 10**digits) for an integer q > 1, by binary splitting"""
+        # The k-th term 1/((2k+1) q**(2k+1)) shrinks by a factor q**2 per step
+        terms = int(digits * math.log(10) / (2 * math.log(q))) + 2
+        q_squared = q * q
+
+        def split(a, b):
+            # Returns Q = q**(2(b-a)), B = product of (2k+1), T with sum = T / (B * Q) * q**(-2a-1)
+            if b - a == 1:
+                return q_squared, 2 * a + 1, 1
+            m = (a + b) // 2
+            q1, b1, t1 = split(a, m)
+            q2, b2, t2 = split(m, b)
+            return (cls._int_multiply(q1, q2), cls._int_multiply(b1, b2),
+                    cls._int_multiply(cls._int_multiply(b2, q2), t1) + cls._int_multiply(b1, t2))
+
+        big_q, big_b, t = split(0, terms)
+        # Leaves use q**2 throughout, so the sum carries an extra factor q
+        numerator = cls._int_multiply(cls._int_multiply(t, q), cls._base_power(10, digits))
+        return cls._int_divmod(numerator, cls._int_multiply(big_b, big_q))[0]
+
+    @classmethod
+    def _ln2_digits(cls, digits):
+        """ln 2 = 14 atanh(1/31) + 10 atanh(1/49) + 6 atanh(1/161)"""
+        return (14 * cls._atanh_inverse_digits(31, digits) + 10 * cls._atanh_inverse_digits(49, digits)
+                + 6 * cls._atanh_inverse_digits(161, digits))
+
+    @classmethod
+    def _ln10_digits(cls, digits):
+        """ln 10 = 46 atanh(1/31) + 34 atanh(1/49) + 20 atanh(1/161)"""
+        return (46 * cls._atanh_inverse_digits(31, digits) + 34 * cls._atanh_inverse_digits(49, digits)
+                + 20 * cls._atanh_inverse_digits(161, digits))
+
+    @classmethod
+    def _euler_gamma_digits(cls, digits):
+        """floor(gamma * 10**digits) by the Brent-McMillan Bessel-function algorithm in fixed point"""
+        # Each of the O(digits) fixed-point steps truncates, so carry enough extra digits to absorb that
+        extra = len(str(digits)) + 1
+        digits += extra
+        one = cls._base_power(10, digits)
+        # The method's error is about exp(-4n); a power of two for n makes ln(n) a multiple of ln 2
+        log2_n = max(1, math.ceil(math.log2(digits * math.log(10) / 4 + 1)))
+        n_squared = 1 << (2 * log2_n)
+        a = u = -log2_n * cls._ln2_digits(digits)
+        b = v = one
+        k = 1
+        while True:
+            b = b * n_squared // (k * k)
+            a = (a * n_squared // k + b) // k
+            if not b and not a:
+                break
+            u += a
+            v += b
+            k += 1
+        return cls._int_divmod(cls._int_multiply(u, one), v)[0] // cls._base_power(10, extra)
+
+    @classmethod
+    def _sqrt2_digits(cls, digits):
+        """floor(sqrt(2) * 10**digits) by the integer root kernel"""
+        return cls._int_iroot(2 * cls._int_square(cls._base_power(10, digits)), 2)
+    
     def __init__(self, value='0', base=10, precision_mode='standard', max_precision=1000, fraction=None):
         # Initialize basic attributes directly
         self.precision = self.PRECISION_MODES.get(precision_mode, precision_mode)
         # Ensure precision is always an integer
         if not isinstance(self.precision, int):
             self.precision = 50  # Default fallback
-        self.max_precision = max_precision
-        self.precision_loss_warning = False
+        self._extras = None
+        if max_precision != 1000:
+            self._set_extra('max_precision', max_precision)
         self.base = base
         self.negative = False
-        self.whole_digits = [0]
-        self.fractional_digits = [0] * self.precision
-        self.fraction = None
+        # Magnitude is stored as a scaled big integer: |value| = _mantissa * base**_exponent,
+        # with no trailing zero digits below the point. Python ints are arrays of 30-bit limbs,
+        # so arithmetic runs on whole limbs in C instead of one base-b digit at a time.
+        self._mantissa = 0
+        self._exponent = 0
 
+        exact = precision_mode == 'exact'
         try:
-            # Handle fraction input first - pure implementation
-            if fraction is not None:
-                if isinstance(fraction, tuple) and len(fraction) == 2:
-                    # fraction as (numerator, denominator)
-                    num, den = fraction
-                    decimal_value = float(num) / float(den)
-                    value = str(decimal_value)
-                elif isinstance(fraction, str) and '/' in fraction:
-                    # fraction as "3/4"
-                    parts = fraction.split('/')
-                    if len(parts) == 2:
-                        num, den = int(parts[0]), int(parts[1])
-                        decimal_value = float(num) / float(den)
-                        value = str(decimal_value)
-
-            # Parse input
+            # Parse input; fractions are held exactly as a numerator/denominator pair
             if isinstance(value, AdvancedPrecisionNumber):
                 self._copy_from(value)
+            elif fraction is not None:
+                self._parse_fraction(fraction)
+            elif exact and isinstance(value, str) and '/' in value:
+                self._parse_fraction(value)
             else:
                 self._parse_input(value)
+            if exact and not self._is_rational():
+                self._set_ratio(*self._as_ratio())
 
+        except ValueError:
+            # Malformed input (stray digits, a second radix point, a bad base) is an error,
+            # not a number that merely lost precision
+            raise
         except Exception as e:
             print(f"Warning: Potential precision issue: {e}")
-            self.precision_loss_warning = True
-    
+            self._set_extra('precision_loss_warning', True)
+
+    @classmethod
+    def _from_parts(cls, mantissa, exponent, negative, base, precision):
+        """Build a number straight from its scaled-integer parts, skipping string parsing.
+
+        Digits beyond ``precision`` fractional places are truncated, matching the
+        behaviour of the digit-list arithmetic this representation replaced.
+        """
+        if exponent < -precision:
+            mantissa //= cls._base_power(base, -precision - exponent)
+            exponent = -precision
+        if exponent < 0 and mantissa % base == 0:
+            mantissa, exponent = cls._strip_zeros(mantissa, exponent, base)
+        result = cls.__new__(cls)
+        result.precision = precision
+        result.base = base
+        result.negative = bool(negative) and mantissa != 0
+        result._mantissa = mantissa
+        result._exponent = exponent
+        result._extras = None
+        return result
+
+    @classmethod
+    def from_int(cls, n, base=10, precision_mode='standard'):
+        """Exact number for a Python int without going through the string parser.
+
+        Small values are interned per base at the precisions of PRECISION_MODES: numbers are
+        immutable, so the literals that loops keep building are one shared instance each.
+        """
+        if not isinstance(base, int) or not 2 <= base <= 36:
+            raise ValueError(f"Base must be an integer between 2 and 36, got {base}")
+        precision = cls.PRECISION_MODES.get(precision_mode, precision_mode)
+        if not isinstance(precision, int):
+            precision = 50  # Default fallback, as in the constructor
+        # Other precisions are not pooled: they vary freely, and would grow the pool without bound
+        if not -cls.SMALL_INT_POOL_LIMIT <= n <= cls.SMALL_INT_POOL_LIMIT \
+                or precision not in cls._POOLED_PRECISIONS:
+            return cls._from_parts(abs(n), 0, n < 0, base, precision)
+        key = (n, base, precision)
+        number = cls._small_int_pool.get(key)
+        if number is None:
+            number = cls._small_int_pool[key] = cls._from_parts(abs(n), 0, n < 0, base, precision)
+        return number
+
+    @classmethod
+    def _strip_zeros(cls, mantissa, exponent, base):
+        """Drop trailing zero digits below the point, in power-of-two runs so long runs cost few divisions"""
+        if mantissa == 0:
+            return 0, 0
+        if base == 2:
+            zeros = min((mantissa & -mantissa).bit_length() - 1, -exponent)
+            return mantissa >> zeros, exponent + zeros
+        step = 1
+        while 2 * step <= -exponent and mantissa % cls._base_power(base, 2 * step) == 0:
+            step *= 2
+        while step:
+            if step <= -exponent:
+                high, low = divmod(mantissa, cls._base_power(base, step))
+                if low == 0:
+                    mantissa, exponent = high, exponent + step
+            step //= 2
+        return mantissa, exponent
+
+    @property
+    def max_precision(self):
+        return self._extra('max_precision')
+
+    @property
+    def precision_loss_warning(self):
+        return self._extra('precision_loss_warning')
+
+    @property
+    def fraction(self):
+        """The exact value as a Fraction for rational numbers, else None"""
+        if not self._is_rational():
+            return None
+        numerator, denominator = self._reduced_ratio()
+        return fractions.Fraction(-numerator if self.negative else numerator, denominator)
+
+    def _is_rational(self):
+        """Whether the number is held as an exact ratio rather than as truncated digits"""
+        return self._extras is not None and 'ratio' in self._extras
+
+    def _parse_fraction(self, fraction):
+        """Set the value from a Fraction, a (numerator, denominator) pair or a 'p/q' string"""
+        if isinstance(fraction, fractions.Fraction):
+            parts = (fraction.numerator, fraction.denominator)
+        elif isinstance(fraction, tuple) and len(fraction) == 2:
+            parts = fraction
+        elif isinstance(fraction, str) and fraction.count('/') == 1:
+            parts = fraction.split('/')
+        else:
+            raise ValueError(f"Invalid fraction {fraction!r}")
+        # Each part may itself be any number in this base; its exact ratio is used
+        (a, b), (c, d) = [(part, 1) if isinstance(part, int) else
+                          AdvancedPrecisionNumber(str(part).strip(), self.base, self.precision)._as_ratio()
+                          for part in parts]
+        if c == 0:
+            raise ZeroDivisionError("Fraction denominator is zero")
+        self._set_ratio(a * d, b * c)
+
+    def _set_ratio(self, numerator, denominator, bound=0, reduced=False):
+        """Hold the value as numerator/denominator; only for use while the number is being built.
+
+        The GCD is taken lazily: only once the terms outgrow twice their size at the last
+        reduction, so chained operations do not pay for a reduction on every step.
+        """
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        magnitude = abs(numerator)
+        if magnitude == 0:
+            self._mantissa, self._exponent, self.negative = 0, 0, False
+            return
+        if max(magnitude.bit_length(), denominator.bit_length()) > 2 * bound + 64:
+            g = self._int_gcd(magnitude, denominator)
+            magnitude //= g
+            denominator //= g
+            bound = max(magnitude.bit_length(), denominator.bit_length())
+            reduced = True
+        self.negative = numerator < 0
+        self._set_extra('ratio', (magnitude, denominator, bound, reduced))
+        # The digits are only expanded from the ratio if something asks for them
+        for name in ('_mantissa', '_exponent'):
+            try:
+                delattr(self, name)
+            except AttributeError:
+                pass
+
+    @classmethod
+    def _from_ratio(cls, numerator, denominator, base, precision, bound=0, reduced=False):
+        """Build a rational number from a signed numerator and a nonzero denominator"""
+        result = cls.__new__(cls)
+        result.precision = precision
+        result.base = base
+        result._extras = None
+        result._set_ratio(numerator, denominator, bound, reduced)
+        return result
+
+    def _reduced_ratio(self):
+        """(|numerator|, denominator) of a rational number in lowest terms"""
+        numerator, denominator, _, reduced = self._extras['ratio']
+        if not reduced:
+            g = self._int_gcd(numerator, denominator)
+            numerator //= g
+            denominator //= g
+            # Same value, so the reduced terms can replace the stored ones
+            self._extras['ratio'] = (numerator, denominator, max(numerator.bit_length(), denominator.bit_length()),
+                                     True)
+        return numerator, denominator
+
+    def __getattr__(self, name):
+        # Only a rational number's digit slots are ever unset: expand them on first use
+        if name in ('_mantissa', '_exponent') and self._is_rational():
+            numerator, denominator = self._extras['ratio'][:2]
+            if denominator == 1:
+                mantissa, exponent = numerator, 0
+            else:
+                scaled = self._int_multiply(numerator, self._base_power(self.base, self.precision))
+                mantissa, exponent = self._strip_zeros(self._int_divmod(scaled, denominator)[0],
+                                                       -self.precision, self.base)
+            self._mantissa = mantissa
+            self._exponent = exponent
+            return mantissa if name == '_mantissa' else exponent
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def _extra(self, name):
+        extras = self._extras
+        if extras is None or name not in extras:
+            return self._EXTRA_DEFAULTS[name]
+        return extras[name]
+
+    def _set_extra(self, name, value):
+        """Set a rarely used attribute; only for use while the number is being built"""
+        if self._extras is None:
+            self._extras = {}
+        self._extras[name] = value
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    @classmethod
+    def _base_power(cls, base, k):
+        """Return base**k, memoised because the same scale factors recur in every operation"""
+        key = (base, k)
+        power = cls._power_cache.get(key)
+        if power is None:
+            power = base ** k
+            if len(cls._power_cache) < 4096:
+                cls._power_cache[key] = power
+        return power
+
     def _copy_from(self, other):
-        """Copy constructor helper"""
+        """Copy constructor helper; the mantissa is shared, the extras dict is the copy's own"""
         self.base = other.base
         self.precision = other.precision
         self.negative = other.negative
-        self.whole_digits = other.whole_digits.copy()
-        self.fractional_digits = other.fractional_digits.copy()
-        self.fraction = other.fraction
-        self.precision_loss_warning = other.precision_loss_warning
-    
+        # _set_extra writes into the dict, so sharing it would change the source number too;
+        # extras already given to this constructor (max_precision) win over the source's
+        extras = dict(other._extras) if other._extras else {}
+        if self._extras:
+            extras.update(self._extras)
+        self._extras = extras or None
+        if other._is_rational():
+            del self._mantissa, self._exponent
+            return
+        self._mantissa = other._mantissa
+        self._exponent = other._exponent
+
+    @property
+    def whole_digits(self):
+        """Digits of the integer part, materialised on demand from the mantissa"""
+        return list(self._int_to_str(self._whole_int(), self.base).encode().translate(self._DIGIT_VALUES))
+
+    @property
+    def fractional_digits(self):
+        """Fractional digits padded to ``precision`` places, materialised on demand"""
+        frac_len = -self._exponent
+        if frac_len <= 0:
+            return [0] * self.precision
+        frac = self._mantissa % self._base_power(self.base, frac_len)
+        digits = list(''.join(self._iter_int_digits(frac, self.base, frac_len)).encode().translate(self._DIGIT_VALUES))
+        return (digits + [0] * self.precision)[:self.precision]
+
+    def _whole_int(self):
+        """Integer part of the magnitude as a Python int"""
+        if self._is_rational():
+            numerator, denominator = self._extras['ratio'][:2]
+            return numerator // denominator
+        if self._exponent >= 0:
+            return self._mantissa * self._base_power(self.base, self._exponent)
+        return self._mantissa // self._base_power(self.base, -self._exponent)
+
+    def _to_int(self):
+        """Truncate towards zero and return a signed Python int"""
+        whole = self._whole_int()
+        return -whole if self.negative else whole
+
+    def _is_integer(self):
+        if self._is_rational():
+            numerator, denominator = self._extras['ratio'][:2]
+            return numerator % denominator == 0
+        return self._exponent >= 0 or self._mantissa % self._base_power(self.base, -self._exponent) == 0
+
+    def _scaled_mantissa(self, exponent):
+        """Mantissa re-expressed at a lower (or equal) exponent"""
+        return self._mantissa * self._base_power(self.base, self._exponent - exponent)
+
+    def _aligned_mantissas(self, other):
+        """Both magnitudes as integers sharing the smaller of the two exponents"""
+        exponent = min(self._exponent, other._exponent)
+        return self._scaled_mantissa(exponent), other._scaled_mantissa(exponent), exponent
+
+    # Digit counts below which base conversion runs digit-chunk by digit-chunk; above them the
+    # digits are split in two at a power of the base and each half is converted recursively
+    CONVERSION_LEAF_DIGITS = 512
+
+    @classmethod
+    def _conversion_power(cls, base, level):
+        """Power-table entry base**(leaf * 2**level), built by squaring and memoised"""
+        digits = cls.CONVERSION_LEAF_DIGITS << level
+        key = (base, digits)
+        power = cls._power_cache.get(key)
+        if power is None:
+            if level == 0:
+                power = base ** cls.CONVERSION_LEAF_DIGITS
+            else:
+                power = cls._int_square(cls._conversion_power(base, level - 1))
+            cls._power_cache[key] = power
+        return power
+
+    @classmethod
+    def _digits_to_int(cls, digits, base):
+        """Fold a list of base-b digits into an int, splitting long lists at table powers"""
+        if len(digits) <= 2 * cls.CONVERSION_LEAF_DIGITS:
+            return cls._fold_digits(digits, base)
+        # Largest table power whose digit count is below the length: the low part gets that many digits
+        level = 0
+        while cls.CONVERSION_LEAF_DIGITS << (level + 1) < len(digits):
+            level += 1
+        split = len(digits) - (cls.CONVERSION_LEAF_DIGITS << level)
+        high = cls._digits_to_int(digits[:split], base)
+        low = cls._digits_to_int(digits[split:], base)
+        return cls._int_multiply(high, cls._conversion_power(base, level)) + low
+
+    @classmethod
+    def _fold_digits(cls, digits, base):
+        """Fold a short list of base-b digits into an int, one machine-sized chunk at a time"""
+        chunk = cls._chunk_digits(base)
+        chunk_power = cls._base_power(base, chunk)
+        value = 0
+        for start in range(0, len(digits), chunk):
+            part = digits[start:start + chunk]
+            piece = 0
+            for d in part:
+                piece = piece * base + d
+            if len(part) == chunk:
+                value = value * chunk_power + piece
+            else:
+                value = value * cls._base_power(base, len(part)) + piece
+        return value
+
+    @classmethod
+    def _str_to_int(cls, text, base):
+        """Int value of a string of valid base-b digits, splitting long strings at table powers"""
+        if len(text) <= 2 * cls.CONVERSION_LEAF_DIGITS:
+            return int(text, base)
+        level = 0
+        while cls.CONVERSION_LEAF_DIGITS << (level + 1) < len(text):
+            level += 1
+        split = len(text) - (cls.CONVERSION_LEAF_DIGITS << level)
+        high = cls._str_to_int(text[:split], base)
+        low = cls._str_to_int(text[split:], base)
+        return cls._int_multiply(high, cls._conversion_power(base, level)) + low
+
+    @classmethod
+    def _int_to_str(cls, n, base):
+        """Render a non-negative int in the given base without a prefix"""
+        if base == 2:
+            return format(n, 'b')
+        if base == 8:
+            return format(n, 'o')
+        if base == 16:
+            return format(n, 'x')
+        return ''.join(cls._iter_int_digits(n, base))
+
+    @classmethod
+    def _iter_int_digits(cls, n, base, width=None):
+        """Digits of n as a stream of strings, most significant first, zero-padded to width if given"""
+        # Divide and conquer: split at the largest table power not above sqrt(n)
+        level = -1
+        while cls._conversion_power(base, level + 1).bit_length() * 2 <= n.bit_length() + 1:
+            level += 1
+        return cls._iter_int_digits_split(n, base, level, width)
+
+    @classmethod
+    def _iter_int_digits_split(cls, n, base, level, width):
+        """Digits of n by recursive splitting at table powers of at most `level`"""
+        # Largest table power no longer than about sqrt(n)
+        while level >= 0 and 2 * cls._conversion_power(base, level).bit_length() > n.bit_length() + 1:
+            level -= 1
+        if level < 0:
+            yield cls._leaf_int_to_str(n, base).rjust(width or 0, '0')
+            return
+        high, low = cls._int_divmod(n, cls._conversion_power(base, level))
+        low_width = cls.CONVERSION_LEAF_DIGITS << level
+        yield from cls._iter_int_digits_split(high, base, level, width and width - low_width)
+        yield from cls._iter_int_digits_split(low, base, level - 1, low_width)
+
+    @classmethod
+    def _leaf_int_to_str(cls, n, base):
+        """Digits of an int below the first table power"""
+        if base == 10:
+            return str(n)
+        if base in (2, 8, 16):
+            return cls._int_to_str(n, base)
+        # Peel off word-sized limbs of digits, then expand each limb a table group at a time
+        group, table = cls._digit_group_table(base)
+        chunk = cls._chunk_digits(base) // group * group
+        chunk_power = cls._base_power(base, chunk)
+        group_power = base ** group
+        groups = []
+        while n:
+            n, limb = divmod(n, chunk_power)
+            for _ in range(0, chunk, group):
+                limb, d = divmod(limb, group_power)
+                groups.append(table[d])
+        return ''.join(reversed(groups)).lstrip('0') or '0'
+
+    DIGIT_CHARS = '0123456789abcdefghijklmnopqrstuvwxyz'
+    # bytes.translate table from digit characters to digit values
+    _DIGIT_VALUES = bytes.maketrans(DIGIT_CHARS.encode(), bytes(range(36)))
+    # Per base: (g, the base**g strings of g digits), so formatting looks up g digits at once
+    _digit_group_tables = {}
+    # Per base: str.translate table deleting every valid digit, so whatever survives is invalid
+    _digit_delete_tables = {}
+
+    @classmethod
+    def _digit_group_table(cls, base):
+        entry = cls._digit_group_tables.get(base)
+        if entry is None:
+            group = 1
+            while base ** (group + 1) <= 1 << 16:
+                group += 1
+            table = ['']
+            for _ in range(group):
+                table = [prefix + c for prefix in table for c in cls.DIGIT_CHARS[:base]]
+            entry = cls._digit_group_tables[base] = (group, table)
+        return entry
+
+    @classmethod
+    def _invalid_digits(cls, text, base):
+        """Characters of a lower-case digit string that are not digits in the base"""
+        table = cls._digit_delete_tables.get(base)
+        if table is None:
+            table = cls._digit_delete_tables[base] = str.maketrans('', '', cls.DIGIT_CHARS[:base])
+        return text.translate(table)
+
+    @staticmethod
+    def _chunk_digits(base):
+        """Number of base-b digits that fit in a 60-bit word"""
+        digits = 0
+        value = 1
+        while value * base < (1 << 60):
+            value *= base
+            digits += 1
+        return digits
+
     def _parse_input(self, value):
-        base = 10
+        # Unprefixed digits are read in the base the number was constructed with
+        base = self.base
+        if not isinstance(base, int) or not 2 <= base <= 36:
+            raise ValueError(f"Base must be an integer between 2 and 36, got {base}")
 
         if isinstance(value, AdvancedPrecisionNumber):
             self._copy_from(value)
@@ -233,126 +748,113 @@ class AdvancedPrecisionNumber:
             elif value.lower().startswith('0o'):
                 base = 8
                 value = value[2:]
+            elif value.lower().startswith('[base') and ']' in value:
+                # The prefix __str__ writes for bases without a 0b/0o/0x form
+                prefix, value = value[1:].split(']', 1)
+                base = int(prefix[4:])
         
             self.base = base
 
-            # Handle scientific notation
-            if 'e' in value.lower():
-                parts = value.lower().split('e')
-                if len(parts) == 2:
-                    mantissa = float(parts[0])
-                    exponent = int(parts[1])
-                    value = str(mantissa * (10 ** exponent))
+            # Scientific notation (from base 15 up 'e' is a digit) only moves the point: no float round trip
+            value = value.lower()
+            exponent = 0
+            if base == 10 and 'e' in value:
+                value, exponent_text = value.split('e', 1)
+                unsigned = exponent_text[1:] if exponent_text[:1] in ('-', '+') else exponent_text
+                if not (unsigned.isascii() and unsigned.isdigit()):
+                    raise ValueError(f"Invalid exponent in '{value}e{exponent_text}'")
+                exponent = int(exponent_text)
 
             parts = value.split('.')
-            whole = parts[0] or '0'
-            fractional = parts[1] if len(parts) > 1 else ''
+            if len(parts) > 2:
+                raise ValueError(f"More than one radix point in '{value}'")
+            whole = self._digit_string(parts[0], base)
+            fractional = self._digit_string(parts[1], base) if len(parts) > 1 else ''
+            digits = (whole + fractional).lstrip('0')
+            point = len(whole) + exponent - (len(whole + fractional) - len(digits))
 
-            # FIXED: Better handling of large numbers
-            whole_digits = []
-            for c in whole.replace('_', ''):
-                if c.isalnum():
-                    try:
-                        whole_digits.append(self._char_to_digit(c))
-                    except ValueError:
-                        raise ValueError(f"Invalid digit '{c}' for base {base}")
-            
-            frac_digits = []
-            for c in fractional.replace('_', ''):
-                if c.isalnum():
-                    try:
-                        frac_digits.append(self._char_to_digit(c))
-                    except ValueError:
-                        raise ValueError(f"Invalid digit '{c}' for base {base}")
-        
             # FIXED: Increase precision for large numbers automatically
-            if len(whole_digits) > self.precision or len(frac_digits) > self.precision:
-                new_precision = max(len(whole_digits), len(frac_digits), self.precision)
+            whole_len = max(point, 0)
+            frac_len = max(len(digits) - point, 0)
+            if whole_len > self.precision or frac_len > self.precision:
+                new_precision = max(whole_len, frac_len, self.precision)
                 new_precision = min(new_precision * 2, self.max_precision)
                 self.precision = new_precision
 
-            self.whole_digits = whole_digits if whole_digits else [0]
-            self.fractional_digits = frac_digits[:self.precision]
-        
-            while len(self.fractional_digits) < self.precision:
-                self.fractional_digits.append(0)
+            kept = min(frac_len, self.precision)
+            if point >= len(digits):
+                mantissa = self._str_to_int(digits or '0', base) * self._base_power(base, point - len(digits))
+            else:
+                kept_digits = digits[:point + kept] if point + kept > 0 else ''
+                mantissa = self._str_to_int(kept_digits or '0', base)
+            self._mantissa, self._exponent = self._strip_zeros(mantissa, -kept, base)
+            if self._mantissa == 0:
+                self.negative = False
+
+    @classmethod
+    def _digit_string(cls, text, base):
+        """Lower-case digits of text with '_' separators dropped; any other non-digit is an error"""
+        invalid = cls._invalid_digits(text, base)
+        if invalid:
+            for c in invalid:
+                if c != '_':
+                    raise ValueError(f"Invalid digit '{c}' for base {base}")
+            text = text.replace('_', '')
+        return text
 
     def _increase_precision(self):
         new_precision = min(self.precision * 2, self.max_precision)
         if new_precision > self.precision:
             self.precision = new_precision
-            self.fractional_digits.extend([0] * (new_precision - len(self.fractional_digits)))
-            self.precision_loss_warning = True
-
-    def _check_numeric_limits(self, value):
-        """Enhanced numeric limit checking - Pure implementation"""
-        # Use approximate values instead of sys.float_info
-        max_float = 1.7976931348623157e+308  # approximate sys.float_info.max
-        min_float = 2.2250738585072014e-308  # approximate sys.float_info.min
-        
-        if abs(value) > max_float:
-            print("Warning: Number exceeds maximum representable value")
-            self._increase_precision()
-        
-        if 0 < abs(value) < min_float:
-            print("Warning: Number is extremely close to zero, precision may be compromised")
-
-    def _char_to_digit(self, char):
-        # FIXED: Better error handling for invalid characters
-        if char.isdigit():
-            digit = int(char)
-            if digit >= self.base:
-                raise ValueError(f"Digit {digit} not valid in base {self.base}")
-            return digit
-        
-        if char.isalpha():
-            digit = ord(char.lower()) - ord('a') + 10
-            if digit >= self.base:
-                raise ValueError(f"Character '{char}' not valid in base {self.base}")
-            return digit
-        
-        raise ValueError(f"Invalid character '{char}'")
-
-    def _digit_to_char(self, digit):
-        if 0 <= digit < 10:
-            return str(digit)
-        if 10 <= digit < 36:
-            return chr(digit - 10 + ord('a'))
-        raise ValueError(f"Cannot represent digit {digit} in base {self.base}")
-    
+            self._set_extra('precision_loss_warning', True)
+
     def _abs_compare(self, other):
-        if len(self.whole_digits) != len(other.whole_digits):
-            return len(self.whole_digits) - len(other.whole_digits)
-        
-        for d1, d2 in zip(self.whole_digits, other.whole_digits):
-            if d1 != d2:
-                return d1 - d2
-        
-        for d1, d2 in zip(self.fractional_digits, other.fractional_digits):
-            if d1 != d2:
-                return d1 - d2
-        
-        return 0
-    
-    def _abs_compare_with_other(self, other_num, epsilon):
-        """Compare absolute values of two numbers with a third number (epsilon)"""
-        # Compare other_num with epsilon
-        return other_num._abs_compare(epsilon)
+        """-1, 0 or 1 as |self| is below, equal to or above |other|, exactly and in any bases"""
+        if self._is_rational() or other._is_rational():
+            (a, b), (c, d) = self._as_ratio(), other._as_ratio()
+            a, c = self._int_multiply(abs(a), d), self._int_multiply(abs(c), b)
+            return (a > c) - (a < c)
+        if self._mantissa == 0 or other._mantissa == 0:
+            return (self._mantissa != 0) - (other._mantissa != 0)
+        # Early exit on magnitude: |x| lies in [2**(bits - 1), 2**bits) * base**exponent
+        order = self._log2_upper_bound() - other._log2_upper_bound()
+        slack = 1 + 1e-9 * (abs(self._exponent) + abs(other._exponent))
+        if order > 1 + slack:
+            return 1
+        if order < -1 - slack:
+            return -1
+        if self.base == other.base:
+            a, b, _ = self._aligned_mantissas(other)
+        else:
+            # Exact cross-multiplication; negative exponents move to the other side
+            a = self._mantissa * self._base_power(self.base, max(self._exponent, 0)) \
+                * self._base_power(other.base, max(-other._exponent, 0))
+            b = other._mantissa * self._base_power(other.base, max(other._exponent, 0)) \
+                * self._base_power(self.base, max(-self._exponent, 0))
+        return (a > b) - (a < b)
+
+    def _log2_upper_bound(self):
+        """Approximate log2 of the exclusive upper bound 2**bits * base**exponent of the magnitude"""
+        return self._mantissa.bit_length() + self._exponent * math.log2(self.base)
+
+    def _compare(self, other):
+        """-1, 0 or 1 as self is below, equal to or above other"""
+        self_sign = 0 if self._is_zero() else (-1 if self.negative else 1)
+        other_sign = 0 if other._is_zero() else (-1 if other.negative else 1)
+        if self_sign != other_sign:
+            return (self_sign > other_sign) - (self_sign < other_sign)
+        return self_sign * self._abs_compare(other)
     
-    def _numbers_equal(self, num1, num2):
-        """Check if two numbers are equal without decimal conversion"""
-        return (num1.negative == num2.negative and 
-                num1.whole_digits == num2.whole_digits and 
-                num1.fractional_digits == num2.fractional_digits)
           
     def _base_to_decimal(self):
-        # FIXED: Better precision handling for large numbers
+        # Integers come back exact; fractions are rounded once from the exact ratio
+        if self._exponent >= 0:
+            return self._to_int()
+        denominator = self._base_power(self.base, -self._exponent)
+        if self._mantissa % denominator == 0:
+            return self._to_int()
         try:
-            whole = sum(digit * (self.base ** power) 
-                        for power, digit in enumerate(reversed(self.whole_digits)))
-            frac = sum(digit * (self.base ** -(power+1)) 
-                       for power, digit in enumerate(self.fractional_digits) if digit != 0)
-            total = whole + frac
+            total = self._mantissa / denominator
             return -total if self.negative else total
         except OverflowError:
             # For very large numbers, use string-based calculation
@@ -361,169 +863,58 @@ class AdvancedPrecisionNumber:
     def _large_number_to_decimal(self):
         """Handle very large numbers that cause overflow"""
         # Use decimal module for high precision
-        from decimal import Decimal, getcontext
-        getcontext().prec = max(100, self.precision)
-        
-        result = Decimal(0)
-        base_decimal = Decimal(self.base)
-        
-        # Calculate whole part
-        for power, digit in enumerate(reversed(self.whole_digits)):
-            result += Decimal(digit) * (base_decimal ** power)
-        
-        # Calculate fractional part
-        for power, digit in enumerate(self.fractional_digits):
-            if digit != 0:
-                result += Decimal(digit) * (base_decimal ** -(power + 1))
-        
-        if self.negative:
-            result = -result
-            
-        return float(result)
+        from decimal import Decimal, localcontext
+        with localcontext() as ctx:
+            ctx.prec = max(100, self.precision)
+            result = Decimal(self._mantissa) * (Decimal(self.base) ** self._exponent)
+            if self.negative:
+                result = -result
+            return float(result)
 
-    def _decimal_to_base(self, decimal_value, preserve_sign=True):
-        """Unified method to convert decimal to any base with automatic precision handling"""
-        new_num = AdvancedPrecisionNumber('0', self.base, self.precision)
-        
-        # Preserve sign
-        if preserve_sign:
-            new_num.negative = decimal_value < 0
-        decimal_value = abs(decimal_value)
-        
-        # Use high precision for large numbers
-        use_decimal = abs(decimal_value) > 1e15 or self.precision > 50
-        
-        if use_decimal:
-            from decimal import Decimal, getcontext
-            getcontext().prec = max(100, self.precision)
-            decimal_value = Decimal(str(decimal_value))
-            base_decimal = Decimal(self.base)
-        
-        # Convert whole part
-        whole_part = int(decimal_value)
-        new_num.whole_digits = []
-        while whole_part > 0:
-            new_num.whole_digits.insert(0, whole_part % self.base)
-            whole_part //= self.base
-        if not new_num.whole_digits:
-            new_num.whole_digits = [0]
-        
-        # Convert fractional part
-        frac_part = decimal_value - int(decimal_value)
-        new_num.fractional_digits = []
-        
-        for _ in range(self.precision):
-            if use_decimal:
-                frac_part *= base_decimal
-            else:
-                frac_part *= self.base
-            digit = int(frac_part)
-            new_num.fractional_digits.append(digit)
-            frac_part -= digit
-            
-            # Early termination if remaining fraction is negligible
-            if abs(float(frac_part)) < 1e-15:
-                new_num.fractional_digits.extend([0] * (self.precision - len(new_num.fractional_digits)))
-                break
-        
-        return new_num
-    
     def _convert_to_base(self, new_base):
-        """FIXED: Convert number to a different base with better precision"""
-        decimal_value = self._base_to_decimal()
-        result = AdvancedPrecisionNumber('0', new_base, self.precision)
-        result.negative = self.negative
-        
-        # Handle very large numbers
-        if abs(decimal_value) > sys.float_info.max:
-            return self._large_base_conversion(new_base)
-        
-        # Convert whole part
-        whole_part = int(abs(decimal_value))
-        result.whole_digits = []
-        while whole_part > 0:
-            result.whole_digits.insert(0, whole_part % new_base)
-            whole_part //= new_base
-        if not result.whole_digits:
-            result.whole_digits = [0]
-        
-        # Convert fractional part
-        frac_part = abs(decimal_value) - int(abs(decimal_value))
-        result.fractional_digits = []
-        for _ in range(self.precision):
-            frac_part *= new_base
-            digit = int(frac_part)
-            result.fractional_digits.append(digit)
-            frac_part -= digit
-        
-        return result
+        """Convert number to a different base exactly, by rescaling the integer mantissa"""
+        if not isinstance(new_base, int) or not 2 <= new_base <= 36:
+            raise ValueError(f"Base must be an integer between 2 and 36, got {new_base}")
+        if new_base == self.base:
+            return self
+        if self._exponent >= 0:
+            return AdvancedPrecisionNumber._from_parts(self._whole_int(), 0, self.negative, new_base, self.precision)
+        # Keep the same number of fractional places, now counted in the new base
+        mantissa = self._int_divmod(self._int_multiply(self._mantissa, self._base_power(new_base, self.precision)),
+                                    self._base_power(self.base, -self._exponent))[0]
+        return AdvancedPrecisionNumber._from_parts(mantissa, -self.precision, self.negative, new_base, self.precision)
 
-    def _large_base_conversion(self, new_base):
-        """Handle base conversion for very large numbers"""
-        from decimal import Decimal, getcontext
-        getcontext().prec = max(100, self.precision)
-        
-        # Convert current number to decimal using high precision
-        decimal_value = Decimal(0)
-        base_decimal = Decimal(self.base)
-        
-        # Calculate whole part
-        for power, digit in enumerate(reversed(self.whole_digits)):
-            decimal_value += Decimal(digit) * (base_decimal ** power)
-        
-        # Calculate fractional part
-        for power, digit in enumerate(self.fractional_digits):
-            if digit != 0:
-                decimal_value += Decimal(digit) * (base_decimal ** -(power + 1))
-        
-        if self.negative:
-            decimal_value = -decimal_value
-        
-        # Convert to new base
-        result = AdvancedPrecisionNumber('0', new_base, self.precision)
-        result.negative = decimal_value < 0
-        decimal_value = abs(decimal_value)
-        
-        # Convert whole part
-        whole_part = int(decimal_value)
-        result.whole_digits = []
-        while whole_part > 0:
-            result.whole_digits.insert(0, whole_part % new_base)
-            whole_part //= new_base
-        if not result.whole_digits:
-            result.whole_digits = [0]
-        
-        # Convert fractional part
-        frac_part = decimal_value - int(decimal_value)
-        result.fractional_digits = []
-        new_base_decimal = Decimal(new_base)
-        for _ in range(self.precision):
-            frac_part *= new_base_decimal
-            digit = int(frac_part)
-            result.fractional_digits.append(digit)
-            frac_part -= digit
-        
-        return result
-    
     def _is_zero(self):
-        return all(d == 0 for d in self.whole_digits) and all(d == 0 for d in self.fractional_digits)
-
-    def _abs_value_as_digits(self):
-        return self.whole_digits + self.fractional_digits
+        # Rationals are never zero; a zero result is built as a plain number
+        return not self._is_rational() and self._mantissa == 0
 
     def __str__(self):
         """FIXED: Enhanced string representation for different bases"""
+        return ''.join(self._str_pieces())
+
+    def to_string_chunks(self, chunk_size=65536):
+        """Yield str(self) in pieces of chunk_size characters, without building the whole string"""
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        pending = []
+        pending_len = 0
+        for piece in self._str_pieces():
+            pending.append(piece)
+            pending_len += len(piece)
+            if pending_len >= chunk_size:
+                text = ''.join(pending)
+                cut = len(text) - len(text) % chunk_size
+                for start in range(0, cut, chunk_size):
+                    yield text[start:start + chunk_size]
+                pending = [text[cut:]]
+                pending_len = len(pending[0])
+        if pending_len:
+            yield ''.join(pending)
+
+    def _str_pieces(self):
+        """The pieces of str(self) in order; digits are produced a table-power block at a time"""
         # Determine sign
         sign = '-' if self.negative else ''
-    
-        # Convert whole digits to string
-        whole = ''.join(self._digit_to_char(d) for d in self.whole_digits)
-        whole = whole.lstrip('0') or '0'
-    
-        # Trim trailing zeros from fractional part
-        frac_digits = [self._digit_to_char(d) for d in self.fractional_digits]
-        while frac_digits and frac_digits[-1] == '0':
-            frac_digits.pop()
 
         # FIXED: Base prefix handling
         if self.base == 2:
@@ -536,30 +927,61 @@ class AdvancedPrecisionNumber:
             base_prefix = ''
         else:
             base_prefix = f'[base{self.base}]'
-    
-        # Fraction representation takes precedence
-        if self.fraction:
-            return f"{sign}{base_prefix}{whole} (Fraction: {self.fraction})"
-    
-        # Standard representation with optional fractional part
-        if frac_digits:
-            frac = ''.join(frac_digits)
-            result = f"{sign}{base_prefix}{whole}.{frac}"
-        else:
-            result = f"{sign}{base_prefix}{whole}"
-    
+
+        yield sign + base_prefix
+        # Materialise digits from the mantissa only now, for display
+        yield from self._iter_int_digits(self._whole_int(), self.base)
+
+        # Fractional digits cut to precision, trailing zeros trimmed: zero blocks are held
+        # back until a later nonzero block shows they are not trailing
+        frac_len = -self._exponent
+        if frac_len > 0:
+            frac = self._mantissa % self._base_power(self.base, frac_len)
+            if frac_len > self.precision:
+                frac //= self._base_power(self.base, frac_len - self.precision)
+                frac_len = self.precision
+            if frac:
+                held = '.'
+                zeros = []
+                for piece in self._iter_int_digits(frac, self.base, frac_len):
+                    if piece.rstrip('0'):
+                        yield held
+                        yield from zeros
+                        zeros = []
+                        held = piece
+                    else:
+                        zeros.append(piece)
+                yield held.rstrip('0')
+
+        # Rationals whose expansion does not end in an integer also show the exact fraction
+        if self._is_rational():
+            numerator, denominator = self._reduced_ratio()
+            if denominator != 1:
+                yield f" (Fraction: {sign}{numerator}/{denominator})"
+
         # Append precision warning if applicable
         if self.precision_loss_warning:
-            result += " [PRECISION WARNING]"
-    
-        return result
+            yield " [PRECISION WARNING]"
 
     def __repr__(self):
         return f"AdvancedPrecisionNumber('{str(self)}')"
 
     def __hash__(self):
-        """Make the object hashable"""
-        return hash((tuple(self.whole_digits), tuple(self.fractional_digits), self.negative, self.base))
+        """Make the object hashable; fractional trailing zeros are never stored, so the parts are canonical"""
+        if self._is_rational():
+            numerator, denominator = self._reduced_ratio()
+            # A ratio that terminates in this base hashes like its exact digits, which compare equal
+            places, rest = 0, denominator
+            while rest > 1:
+                g = math.gcd(rest, self.base)
+                if g == 1:
+                    return hash((numerator, denominator, self.negative))
+                rest //= g
+                places += 1
+            mantissa = numerator * self._base_power(self.base, places) // denominator
+            mantissa, exponent = self._strip_zeros(mantissa, -places, self.base)
+            return hash((mantissa, exponent, self.negative, self.base))
+        return hash((self._mantissa, self._exponent, self.negative, self.base))
 
     def __format__(self, format_spec):
         """Support for format() function"""
@@ -577,455 +999,707 @@ class AdvancedPrecisionNumber:
         """
         Convert the number to a Fraction
         """
-        # If fraction is already defined, return it
-        if self.fraction:
-            return self.fraction if not self.negative else -self.fraction
-        
-        # Convert decimal representation to fraction
-        decimal_value = self._base_to_decimal()
-        frac = fractions.Fraction(decimal_value).limit_denominator()
-        return frac if not self.negative else -frac
+        # Rationals are returned exactly
+        if self._is_rational():
+            return self.fraction
+
+        # Otherwise the closest fraction with a denominator up to a million, from the continued fraction
+        return self.to_fraction(1000000)
 
     def __abs__(self):
-        # Create a copy without negative sign
-        abs_copy = AdvancedPrecisionNumber('0', self.base, self.precision)
-        abs_copy.whole_digits = self.whole_digits.copy()
-        abs_copy.fractional_digits = self.fractional_digits.copy()
-        return abs_copy
+        # Immutable, so a non-negative number is its own absolute value
+        if not self.negative:
+            return self
+        if self._is_rational():
+            numerator, denominator, bound, reduced = self._extras['ratio']
+            return AdvancedPrecisionNumber._from_ratio(numerator, denominator, self.base, self.precision, bound,
+                                                       reduced)
+        return AdvancedPrecisionNumber._from_parts(self._mantissa, self._exponent, False, self.base, self.precision)
 
     def _ensure_apn(self, other):
-        # Convert to AdvancedPrecisionNumber
-        return other if isinstance(other, AdvancedPrecisionNumber) else \
-               AdvancedPrecisionNumber(str(other), self.base, self.precision)
+        # Convert to AdvancedPrecisionNumber; plain Python numbers are written in decimal
+        if isinstance(other, AdvancedPrecisionNumber):
+            return other
+        if isinstance(other, int):
+            return AdvancedPrecisionNumber.from_int(other, 10, self.precision)
+        return AdvancedPrecisionNumber(str(other), 10, self.precision)
 
     def __add__(self, other):
-        """FIXED: Add two numbers in their native base without conversion"""
+        """Add two numbers in their native base without conversion"""
         other = self._ensure_apn(other)
+        if self._is_rational() or other._is_rational():
+            return self._rational_arithmetic(other, '+')
     
         # Handle different bases by converting other to self's base
         if other.base != self.base:
             other = other._convert_to_base(self.base)
     
-        result = AdvancedPrecisionNumber('0', self.base, max(self.precision, other.precision))
-    
         # Handle signs
         if self.negative == other.negative:
-            result = self._abs_add(other)
-            result.negative = self.negative
-        else:
-            # If signs differ, subtract absolute values
-            if self._abs_compare(other) >= 0:
-                result = self._abs_subtract(other)
-                result.negative = self.negative
-            else:
-                result = other._abs_subtract(self)
-                result.negative = other.negative
-    
-        return result
+            return self._abs_add(other, self.negative)
+        # If signs differ, subtract absolute values
+        if self._abs_compare(other) >= 0:
+            return self._abs_subtract(other, self.negative)
+        return other._abs_subtract(self, other.negative)
 
-    def _abs_add(self, other):
-        """FIXED: Add absolute values directly in base"""
-        result = AdvancedPrecisionNumber('0', self.base, max(self.precision, other.precision))
-        carry = 0
-    
-        # Add fractional parts from right to left
-        max_frac_len = max(len(self.fractional_digits), len(other.fractional_digits))
-        result.fractional_digits = [0] * max_frac_len
-        
-        for i in range(max_frac_len - 1, -1, -1):
-            digit1 = self.fractional_digits[i] if i < len(self.fractional_digits) else 0
-            digit2 = other.fractional_digits[i] if i < len(other.fractional_digits) else 0
-        
-            # Add in current base
-            total = digit1 + digit2 + carry
-            result.fractional_digits[i] = total % self.base
-            carry = total // self.base
-    
-        # Add whole parts from right to left
-        whole1 = self.whole_digits[::-1]
-        whole2 = other.whole_digits[::-1]
-        result_whole = []
-    
-        max_whole_len = max(len(whole1), len(whole2))
-        for i in range(max_whole_len):
-            digit1 = whole1[i] if i < len(whole1) else 0
-            digit2 = whole2[i] if i < len(whole2) else 0
-        
-            # Add in current base
-            total = digit1 + digit2 + carry
-            result_whole.append(total % self.base)
-            carry = total // self.base
-    
-        if carry:
-            result_whole.append(carry)
-    
-        result.whole_digits = result_whole[::-1] if result_whole else [0]
-        return result
+    def _abs_add(self, other, negative=False):
+        """Add absolute values on the aligned integer mantissas, giving the sum the requested sign"""
+        a, b, exponent = self._aligned_mantissas(other)
+        return AdvancedPrecisionNumber._from_parts(a + b, exponent, negative, self.base,
+                                                   max(self.precision, other.precision))
 
     def __sub__(self, other):
-        """FIXED: Subtract two numbers in their native base without conversion"""
+        """Subtract two numbers in their native base without conversion"""
         other = self._ensure_apn(other)
+        if self._is_rational() or other._is_rational():
+            return self._rational_arithmetic(other, '-')
     
         if other.base != self.base:
             other = other._convert_to_base(self.base)
     
-        result = AdvancedPrecisionNumber('0', self.base, max(self.precision, other.precision))
-    
         # If signs are different, add absolute values
         if self.negative != other.negative:
-            result = self._abs_add(other)
-            result.negative = self.negative
-            return result
+            return self._abs_add(other, self.negative)
     
         # If signs are same, subtract absolute values
         if self._abs_compare(other) >= 0:
-            result = self._abs_subtract(other)
-            result.negative = self.negative
-        else:
-            result = other._abs_subtract(self)
-            result.negative = not self.negative
-    
-        return result
-
-    def _abs_subtract(self, other):
-        """FIXED: Subtract absolute values directly in base"""
-        result = AdvancedPrecisionNumber('0', self.base, max(self.precision, other.precision))
-        borrow = 0
-    
-        # Ensure both have same fractional length
-        max_frac_len = max(len(self.fractional_digits), len(other.fractional_digits))
-        result.fractional_digits = [0] * max_frac_len
-        
-        # Subtract fractional parts
-        for i in range(max_frac_len - 1, -1, -1):
-            digit1 = self.fractional_digits[i] if i < len(self.fractional_digits) else 0
-            digit2 = other.fractional_digits[i] if i < len(other.fractional_digits) else 0
-        
-            # Handle borrow
-            if digit1 < digit2 + borrow:
-                digit1 += self.base
-                result.fractional_digits[i] = digit1 - digit2 - borrow
-                borrow = 1
-            else:
-                result.fractional_digits[i] = digit1 - digit2 - borrow
-                borrow = 0
-    
-        # Subtract whole parts
-        whole1 = self.whole_digits[::-1]
-        whole2 = other.whole_digits[::-1]
-        result_whole = []
-    
-        max_whole_len = max(len(whole1), len(whole2))
-        for i in range(max_whole_len):
-            digit1 = whole1[i] if i < len(whole1) else 0
-            digit2 = whole2[i] if i < len(whole2) else 0
-        
-            if digit1 < digit2 + borrow:
-                digit1 += self.base
-                result_whole.append(digit1 - digit2 - borrow)
-                borrow = 1
-            else:
-                result_whole.append(digit1 - digit2 - borrow)
-                borrow = 0
-    
-        result.whole_digits = result_whole[::-1]
-    
-        # Remove leading zeros
-        while len(result.whole_digits) > 1 and result.whole_digits[0] == 0:
-            result.whole_digits.pop(0)
-    
-        return result
+            return self._abs_subtract(other, self.negative)
+        return other._abs_subtract(self, not self.negative)
+
+    def _abs_subtract(self, other, negative=False):
+        """Subtract absolute values (|self| >= |other|) on the aligned integer mantissas, with the requested sign"""
+        a, b, exponent = self._aligned_mantissas(other)
+        return AdvancedPrecisionNumber._from_parts(a - b, exponent, negative, self.base,
+                                                   max(self.precision, other.precision))
    
     def __mul__(self, other):
-        """FIXED: Multiply two numbers directly in their base without conversion"""
+        """Multiply two numbers directly in their base without conversion"""
         other = self._ensure_apn(other)
+        if self._is_rational() or other._is_rational():
+            return self._rational_arithmetic(other, '*')
 
         # Handle different bases
         if other.base != self.base:
             other = other._convert_to_base(self.base)
 
-        result = AdvancedPrecisionNumber('0', self.base, max(self.precision, other.precision))
-        result.negative = self.negative != other.negative
-
-        # Use standard multiplication for now to avoid recursion issues
-        # TODO: Fix Karatsuba multiplication recursion issue
-        return self._standard_multiply(other)
+        # Pick schoolbook, Karatsuba or Toom-3 from the operand sizes
+        return self._with_mantissa_product(other, self._int_multiply(self._mantissa, other._mantissa))
 
-    def _standard_multiply(self, other):
-        """FIXED: Optimized standard multiplication"""
-        result = AdvancedPrecisionNumber('0', self.base, max(self.precision, other.precision))
-        result.negative = self.negative != other.negative
+    def _rational_arithmetic(self, other, op):
+        """Exact + - * / // % when either operand is rational; the result is rational too.
 
-        # Convert to single digit arrays for easier multiplication
-        self_digits = self.whole_digits + self.fractional_digits
-        other_digits = other.whole_digits + other.fractional_digits
-        
-        # Calculate total fractional positions
-        self_frac_pos = len(self.fractional_digits)
-        other_frac_pos = len(other.fractional_digits)
-        total_frac_pos = self_frac_pos + other_frac_pos
-        
-        # Multiply digit arrays
-        product = [0] * (len(self_digits) + len(other_digits))
-        
-        for i in range(len(self_digits) - 1, -1, -1):
-            carry = 0
-            for j in range(len(other_digits) - 1, -1, -1):
-                pos = i + j + 1
-                temp = product[pos] + self_digits[i] * other_digits[j] + carry
-                product[pos] = temp % self.base
-                carry = temp // self.base
-            if carry:
-                product[i] += carry
-
-        # Remove leading zeros
-        while len(product) > 1 and product[0] == 0:
-            product.pop(0)
-
-        # Split back into whole and fractional parts
-        if total_frac_pos >= len(product):
-            # Result is purely fractional
-            result.whole_digits = [0]
-            result.fractional_digits = ([0] * (total_frac_pos - len(product)) + product)[:result.precision]
+        Digits are never expanded here: a + b costs a few big-int products instead of a
+        precision-digit division, and the result is reduced only when it has grown.
+        """
+        a, b = self._as_ratio()
+        c, d = other._as_ratio()
+        mul = self._int_multiply
+        if op in ('+', '-'):
+            if op == '-':
+                c = -c
+            if b == d:
+                numerator, denominator = a + c, b
+            else:
+                ad = mul(abs(a), d)
+                cb = mul(abs(c), b)
+                numerator = (-ad if a < 0 else ad) + (-cb if c < 0 else cb)
+                denominator = mul(b, d)
+        elif op == '*':
+            numerator, denominator = mul(abs(a), abs(c)), mul(b, d)
+            if (a < 0) != (c < 0):
+                numerator = -numerator
+        elif op == '/':
+            numerator, denominator = mul(abs(a), d), mul(b, abs(c))
+            if (a < 0) != (c < 0):
+                numerator = -numerator
         else:
-            # Split normally
-            split_pos = len(product) - total_frac_pos
-            result.whole_digits = product[:split_pos] if split_pos > 0 else [0]
-            result.fractional_digits = (product[split_pos:] + [0] * result.precision)[:result.precision]
+            # Truncated quotient, and the remainder that takes the sign of self, as for digits
+            quotient, remainder = self._int_divmod(mul(abs(a), d), mul(abs(c), b))
+            if op == '//':
+                numerator, denominator = (-quotient if (a < 0) != (c < 0) else quotient), 1
+            else:
+                numerator, denominator = (-remainder if a < 0 else remainder), mul(b, d)
+        bound = max(self._ratio_bound(), other._ratio_bound())
+        return AdvancedPrecisionNumber._from_ratio(numerator, denominator, self.base,
+                                                   max(self.precision, other.precision), bound)
 
-        return result
+    def _ratio_bound(self):
+        """Size in bits of the terms at their last reduction, 0 for digit numbers"""
+        return self._extras['ratio'][2] if self._is_rational() else 0
+
+    def _with_mantissa_product(self, other, product):
+        """Wrap a product of the two mantissas as a number with the combined exponent and sign"""
+        return AdvancedPrecisionNumber._from_parts(product, self._exponent + other._exponent,
+                                                   self.negative != other.negative, self.base,
+                                                   max(self.precision, other.precision))
+
+    def _standard_multiply(self, other):
+        """Schoolbook multiplication of the mantissas (the interpreter's native limb product)"""
+        return self._with_mantissa_product(other, self._mantissa * other._mantissa)
 
     def _karatsuba_multiply(self, other):
-        """Optimized Karatsuba multiplication for large numbers"""
-        # Base case: use standard multiplication for small numbers
-        # Check total digit count, not just whole digits
-        self_total_digits = len(self.whole_digits) + len(self.fractional_digits)
-        other_total_digits = len(other.whole_digits) + len(other.fractional_digits)
-        
-        if self_total_digits <= 32 or other_total_digits <= 32:
-            return self._standard_multiply(other)
+        """Karatsuba multiplication of the mantissas, whatever their size"""
+        return self._with_mantissa_product(other, self._int_karatsuba(self._mantissa, other._mantissa))
 
-        # Convert to digit arrays
-        self_digits = self.whole_digits + self.fractional_digits
-        other_digits = other.whole_digits + other.fractional_digits
-        
-        # Ensure we have at least 2 digits to split
-        if len(self_digits) < 2 or len(other_digits) < 2:
-            return self._standard_multiply(other)
-        
-        # Pad to same length
-        max_len = max(len(self_digits), len(other_digits))
-        self_digits = [0] * (max_len - len(self_digits)) + self_digits
-        other_digits = [0] * (max_len - len(other_digits)) + other_digits
-        
-        # Split point - ensure it's not 0 or max_len
-        m = max(1, min(max_len - 1, max_len // 2))
-        
-        # Split numbers
-        high1 = self_digits[:max_len-m]
-        low1 = self_digits[max_len-m:]
-        high2 = other_digits[:max_len-m]
-        low2 = other_digits[max_len-m:]
-        
-        # Ensure splits are not empty
-        if not high1 or not low1 or not high2 or not low2:
-            return self._standard_multiply(other)
-        
-        # Create temporary numbers
-        high1_num = self._digits_to_number(high1)
-        low1_num = self._digits_to_number(low1)
-        high2_num = self._digits_to_number(high2)
-        low2_num = self._digits_to_number(low2)
-        
-        # Recursive calls with size checks to prevent infinite recursion
-        z0 = low1_num._karatsuba_multiply(low2_num)
-        z2 = high1_num._karatsuba_multiply(high2_num)
-        z1 = (high1_num + low1_num)._karatsuba_multiply(high2_num + low2_num) - z2 - z0
-        
-        # Combine results: z2 * base^(2m) + z1 * base^m + z0
-        result = z2._shift_left(2 * m) + z1._shift_left(m) + z0
-        result.negative = self.negative != other.negative
-        
-        return result
+    def _toom3_multiply(self, other):
+        """Toom-3 multiplication of the mantissas, whatever their size"""
+        return self._with_mantissa_product(other, self._int_toom3(self._mantissa, other._mantissa))
 
-    def _digits_to_number(self, digits):
-        """Convert digit array to AdvancedPrecisionNumber"""
-        if not digits or all(d == 0 for d in digits):
-            return AdvancedPrecisionNumber('0', self.base, self.precision)
-        
-        # Remove leading zeros
-        while digits and digits[0] == 0:
-            digits.pop(0)
-        
-        result = AdvancedPrecisionNumber('0', self.base, self.precision)
-        result.whole_digits = digits if digits else [0]
-        result.fractional_digits = [0] * result.precision
-        return result
+    def _ntt_multiply(self, other):
+        """Number-theoretic-transform multiplication of the mantissas, whatever their size"""
+        return self._with_mantissa_product(other, self._int_ntt_multiply(self._mantissa, other._mantissa))
 
-    def _shift_left(self, positions):
-        """Shift digits left by positions (multiply by base^positions)"""
-        if positions <= 0:
-            return AdvancedPrecisionNumber(str(self), self.base, self.precision)
-        
-        result = AdvancedPrecisionNumber('0', self.base, self.precision)
-        result.negative = self.negative
-        result.whole_digits = self.whole_digits + [0] * positions
-        result.fractional_digits = self.fractional_digits.copy()
+    def _square(self):
+        """self * self through the squaring kernels, which need about half the limb products"""
+        return self._with_mantissa_product(self, self._int_square(self._mantissa))
+
+    def _karatsuba_square(self):
+        """Squaring with the Karatsuba kernel, whatever the size"""
+        return self._with_mantissa_product(self, self._int_karatsuba_square(self._mantissa))
+
+    @classmethod
+    def _int_multiply(cls, a, b):
+        """Multiply two non-negative ints, dispatching on the size of the smaller operand in limbs"""
+        limbs = min(a.bit_length(), b.bit_length()) // cls.LIMB_BITS
+        if limbs < cls.KARATSUBA_THRESHOLD:
+            return a * b
+        if limbs < cls.TOOM3_THRESHOLD:
+            return cls._int_karatsuba(a, b)
+        if limbs < cls.NTT_THRESHOLD:
+            return cls._int_toom3(a, b)
+        return cls._int_ntt_multiply(a, b)
+
+    @classmethod
+    def _int_lopsided(cls, a, b, algorithm):
+        """Multiply a long ``a`` by a much shorter ``b`` in b-sized slices of ``a``"""
+        k = b.bit_length()
+        mask = (1 << k) - 1
+        result = 0
+        shift = 0
+        while a:
+            result += algorithm(a & mask, b) << shift
+            a >>= k
+            shift += k
         return result
 
-    def __truediv__(self, other):
-        """FIXED: Optimized division with algorithm selection"""
-        other = self._ensure_apn(other)
+    @classmethod
+    def _int_karatsuba(cls, a, b):
+        """Karatsuba: three half-size products instead of four, subproducts re-dispatched"""
+        if a.bit_length() < b.bit_length():
+            a, b = b, a
+        if b.bit_length() <= cls.LIMB_BITS:
+            return a * b
+        if 2 * b.bit_length() < a.bit_length():
+            return cls._int_lopsided(a, b, cls._int_multiply)
+
+        k = a.bit_length() >> 1
+        mask = (1 << k) - 1
+        a1, a0 = a >> k, a & mask
+        b1, b0 = b >> k, b & mask
+
+        z2 = cls._int_multiply(a1, b1)
+        z0 = cls._int_multiply(a0, b0)
+        z1 = cls._int_multiply(a1 + a0, b1 + b0) - z2 - z0
+        return (((z2 << k) + z1) << k) + z0
 
-        if other._is_zero():
-            raise ZeroDivisionError("Division by zero")
+    @classmethod
+    def _int_toom3(cls, a, b):
+        """Toom-3: five third-size products evaluated at 0, 1, -1, -2 and infinity"""
+        if a.bit_length() < b.bit_length():
+            a, b = b, a
+        if b.bit_length() <= 3 * cls.LIMB_BITS:
+            return a * b
+        if 3 * b.bit_length() < 2 * a.bit_length():
+            return cls._int_lopsided(a, b, cls._int_multiply)
+
+        k = (a.bit_length() + 2) // 3
+        mask = (1 << k) - 1
+        a0, a1, a2 = a & mask, (a >> k) & mask, a >> (2 * k)
+        b0, b1, b2 = b & mask, (b >> k) & mask, b >> (2 * k)
+
+        # Evaluation; negative intermediate values are fine with Python ints
+        p, q = a0 + a2, b0 + b2
+        v0 = cls._signed_multiply(a0, b0)
+        v1 = cls._signed_multiply(p + a1, q + b1)
+        vm1 = cls._signed_multiply(p - a1, q - b1)
+        vm2 = cls._signed_multiply((((a2 << 1) - a1) << 1) + a0, (((b2 << 1) - b1) << 1) + b0)
+        vinf = cls._signed_multiply(a2, b2)
+
+        # Interpolation (Bodrato's sequence: one exact division by 3, two halvings)
+        r3 = (vm2 - v1) // 3
+        r1 = (v1 - vm1) >> 1
+        r2 = vm1 - v0
+        r3 = ((r2 - r3) >> 1) + (vinf << 1)
+        r2 = r2 + r1 - vinf
+        r1 = r1 - r3
+        return (((((((vinf << k) + r3) << k) + r2) << k) + r1) << k) + v0
 
-        if other.base != self.base:
-            other = other._convert_to_base(self.base)
+    @classmethod
+    def _signed_multiply(cls, a, b):
+        """Dispatch a product whose factors may be negative (Toom evaluation points)"""
+        product = cls._int_multiply(abs(a), abs(b))
+        return -product if (a < 0) != (b < 0) else product
 
-        # Handle signs
-        result_negative = self.negative != other.negative
-        
-        # Use long division for now to avoid Newton-Raphson overflow issues
-        # TODO: Fix Newton-Raphson division overflow
-        return self._long_division(other, result_negative)
+    @classmethod
+    def _int_square(cls, a):
+        """Square a non-negative int, dispatching on its size in limbs like _int_multiply"""
+        limbs = a.bit_length() // cls.LIMB_BITS
+        if limbs < cls.KARATSUBA_THRESHOLD:
+            # The native kernel spots identical operands and forms each cross product once
+            return a * a
+        if limbs < cls.TOOM3_THRESHOLD:
+            return cls._int_karatsuba_square(a)
+        if limbs < cls.NTT_THRESHOLD:
+            return cls._int_toom3_square(a)
+        return cls._int_ntt_multiply(a, a)
 
-    def _long_division(self, other, result_negative):
-        """FIXED: Optimized long division with early termination"""
-        precision = max(self.precision, other.precision)
-        result = AdvancedPrecisionNumber('0', self.base, precision)
-        result.negative = result_negative
+    @classmethod
+    def _int_karatsuba_square(cls, a):
+        """Karatsuba squaring: (a1*B + a0)^2 from three half-size squares"""
+        if a.bit_length() <= cls.LIMB_BITS:
+            return a * a
+        k = a.bit_length() >> 1
+        a1, a0 = a >> k, a & ((1 << k) - 1)
+        z2 = cls._int_square(a1)
+        z0 = cls._int_square(a0)
+        z1 = cls._int_square(a1 + a0) - z2 - z0
+        return (((z2 << k) + z1) << k) + z0
 
-        # Convert to integers for division with scaling
-        scale_factor = max(len(self.fractional_digits), len(other.fractional_digits))
-        
-        self_int = 0
-        for digit in self.whole_digits + self.fractional_digits:
-            self_int = self_int * self.base + digit
+    @classmethod
+    def _int_toom3_square(cls, a):
+        """Toom-3 squaring: five third-size squares at 0, 1, -1, -2 and infinity"""
+        if a.bit_length() <= 3 * cls.LIMB_BITS:
+            return a * a
+        k = (a.bit_length() + 2) // 3
+        mask = (1 << k) - 1
+        a0, a1, a2 = a & mask, (a >> k) & mask, a >> (2 * k)
+
+        p = a0 + a2
+        v0 = cls._int_square(a0)
+        v1 = cls._int_square(p + a1)
+        vm1 = cls._int_square(abs(p - a1))
+        vm2 = cls._int_square(abs((((a2 << 1) - a1) << 1) + a0))
+        vinf = cls._int_square(a2)
+
+        r3 = (vm2 - v1) // 3
+        r1 = (v1 - vm1) >> 1
+        r2 = vm1 - v0
+        r3 = ((r2 - r3) >> 1) + (vinf << 1)
+        r2 = r2 + r1 - vinf
+        r1 = r1 - r3
+        return (((((((vinf << k) + r3) << k) + r2) << k) + r1) << k) + v0
 
-        other_int = 0
-        for digit in other.whole_digits + other.fractional_digits:
-            other_int = other_int * self.base + digit
+    @classmethod
+    def _int_ntt_multiply(cls, a, b):
+        """Exact convolution of the coefficient arrays via modular NTTs and CRT recombination"""
+        if a == 0 or b == 0:
+            return 0
+        bits = cls.NTT_LIMB_BITS
+        a_len = -(-a.bit_length() // bits)
+        b_len = -(-b.bit_length() // bits)
+        length = 1
+        while length < a_len + b_len:
+            length <<= 1
+        if length.bit_length() - 1 > cls.NTT_MAX_LOG_LENGTH:
+            return cls._int_toom3(a, b)
+
+        square = a is b
+        a_coeffs = cls._int_to_limbs(a, bits, a_len)
+        b_coeffs = a_coeffs if square else cls._int_to_limbs(b, bits, b_len)
+        primes = cls._get_ntt_primes()
+
+        # Convolve modulo each prime; coefficients of the product are < length * 2^(2*bits),
+        # which the product of the primes comfortably exceeds
+        modulus = 1
+        for p, _ in primes:
+            modulus *= p
+        coeffs = [0] * length
+        for p, max_root in primes:
+            root = pow(max_root, 1 << (cls.NTT_MAX_LOG_LENGTH - length.bit_length() + 1), p)
+            fa = [x % p for x in a_coeffs] + [0] * (length - a_len)
+            cls._ntt_forward(fa, p, root)
+            if square:
+                # Squaring needs a single forward transform per prime
+                fb = fa
+            else:
+                fb = [x % p for x in b_coeffs] + [0] * (length - b_len)
+                cls._ntt_forward(fb, p, root)
+            # Fold 1/length and this prime's CRT weight into the pointwise product
+            other = modulus // p
+            weight = other * (pow(other, -1, p) * pow(length, -1, p) % p)
+            fc = [x * y % p for x, y in zip(fa, fb)]
+            cls._ntt_inverse(fc, p, pow(root, -1, p))
+            coeffs = [c + x * weight for c, x in zip(coeffs, fc)]
+        coeffs = [c % modulus for c in coeffs]
+        return cls._limbs_to_int(coeffs, bits)
 
-        if other_int == 0:
-            raise ZeroDivisionError("Division by zero")
+    @classmethod
+    def _get_ntt_primes(cls):
+        """(p, root) pairs with p = c*2^k + 1 and root of order 2^NTT_MAX_LOG_LENGTH, found once"""
+        if cls._ntt_primes is None:
+            log_length = cls.NTT_MAX_LOG_LENGTH
+            needed_bits = 2 * cls.NTT_LIMB_BITS + log_length + 1
+            prime_bits = needed_bits // cls.NTT_PRIME_COUNT + 2
+            primes = []
+            c = (1 << (prime_bits - log_length)) + 1
+            while len(primes) < cls.NTT_PRIME_COUNT:
+                p = (c << log_length) + 1
+                if cls._is_probable_prime(p):
+                    # Any quadratic non-residue raised to c generates the 2^k-th roots of unity
+                    g = 3
+                    while pow(g, (p - 1) >> 1, p) == 1:
+                        g += 1
+                    primes.append((p, pow(g, c, p)))
+                c += 2
+            cls._ntt_primes = primes
+        return cls._ntt_primes
+
+    @staticmethod
+    def _is_probable_prime(n):
+        """Miller-Rabin with the first twelve prime bases (deterministic below 3.3e24)"""
+        if n < 2:
+            return False
+        small_primes = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+        for q in small_primes:
+            if n % q == 0:
+                return n == q
+        d, s = n - 1, 0
+        while not d & 1:
+            d >>= 1
+            s += 1
+        for a in small_primes:
+            x = pow(a, d, n)
+            if x == 1 or x == n - 1:
+                continue
+            for _ in range(s - 1):
+                x = x * x % n
+                if x == n - 1:
+                    break
+            else:
+                return False
+        return True
+
+    @staticmethod
+    def _ntt_forward(values, p, root):
+        """In-place decimation-in-frequency NTT; output is left in bit-reversed order"""
+        length = len(values)
+        half = length >> 1
+        step_root = root
+        while half:
+            twiddles = [1] * half
+            for j in range(1, half):
+                twiddles[j] = twiddles[j - 1] * step_root % p
+            span = half << 1
+            if half >= length // span:
+                # Few long blocks: one comprehension per block
+                for start in range(0, length, span):
+                    lo = values[start:start + half]
+                    hi = values[start + half:start + span]
+                    values[start:start + half] = [(u + v) % p for u, v in zip(lo, hi)]
+                    values[start + half:start + span] = [(u - v) * w % p for u, v, w in zip(lo, hi, twiddles)]
+            else:
+                # Many short blocks: one strided comprehension per twiddle
+                for j in range(half):
+                    w = twiddles[j]
+                    lo = values[j::span]
+                    hi = values[j + half::span]
+                    values[j::span] = [(u + v) % p for u, v in zip(lo, hi)]
+                    values[j + half::span] = [(u - v) * w % p for u, v in zip(lo, hi)]
+            step_root = step_root * step_root % p
+            half >>= 1
+
+    @staticmethod
+    def _ntt_inverse(values, p, inverse_root):
+        """In-place decimation-in-time NTT taking bit-reversed input to natural order (unscaled)"""
+        length = len(values)
+        half = 1
+        while half < length:
+            span = half << 1
+            step_root = pow(inverse_root, length // span, p)
+            twiddles = [1] * half
+            for j in range(1, half):
+                twiddles[j] = twiddles[j - 1] * step_root % p
+            if half >= length // span:
+                for start in range(0, length, span):
+                    lo = values[start:start + half]
+                    hi = [v * w % p for v, w in zip(values[start + half:start + span], twiddles)]
+                    values[start:start + half] = [(u + v) % p for u, v in zip(lo, hi)]
+                    values[start + half:start + span] = [(u - v) % p for u, v in zip(lo, hi)]
+            else:
+                for j in range(half):
+                    w = twiddles[j]
+                    lo = values[j::span]
+                    hi = [v * w % p for v in values[j + half::span]]
+                    values[j::span] = [(u + v) % p for u, v in zip(lo, hi)]
+                    values[j + half::span] = [(u - v) % p for u, v in zip(lo, hi)]
+            half = span
+
+    @staticmethod
+    def _int_to_limbs(n, bits, count):
+        """Split n into ``count`` little-endian limbs of ``bits`` bits, halving recursively"""
+        mask = (1 << bits) - 1
+        limbs = []
+
+        def split(value, size):
+            if size <= 64:
+                for _ in range(size):
+                    limbs.append(value & mask)
+                    value >>= bits
+                return
+            low = size >> 1
+            split(value & ((1 << (low * bits)) - 1), low)
+            split(value >> (low * bits), size - low)
+
+        split(n, count)
+        return limbs
+
+    @staticmethod
+    def _limbs_to_int(limbs, bits):
+        """Sum little-endian (possibly overlapping) limbs with a balanced shift-and-add tree"""
+        def join(lo, hi):
+            if hi - lo <= 8:
+                value = 0
+                for i in range(hi - 1, lo - 1, -1):
+                    value = (value << bits) + limbs[i]
+                return value
+            mid = (lo + hi) >> 1
+            return join(lo, mid) + (join(mid, hi) << ((mid - lo) * bits))
+
+        return join(0, len(limbs)) if limbs else 0
 
-        # Perform division with additional precision
-        quotient = self_int // other_int
-        remainder = self_int % other_int
+    @classmethod
+    def _int_divmod(cls, a, b):
+        """divmod of non-negative ints, dispatching on the divisor size in limbs"""
+        limbs = b.bit_length() // cls.LIMB_BITS
+        quotient_limbs = (a.bit_length() - b.bit_length()) // cls.LIMB_BITS
+        if min(limbs, quotient_limbs) < cls.BURNIKEL_ZIEGLER_THRESHOLD:
+            # Short quotients cost the native kernel only O(n) per quotient limb
+            return divmod(a, b)
+        if limbs < cls.NEWTON_DIVISION_THRESHOLD:
+            return cls._int_burnikel_ziegler_divmod(a, b)
+        return cls._int_newton_divmod(a, b)
 
-        # Convert quotient back to base representation
-        result.whole_digits = []
-        temp = quotient
-        while temp > 0:
-            result.whole_digits.insert(0, temp % self.base)
-            temp //= self.base
+    @classmethod
+    def _int_burnikel_ziegler_divmod(cls, a, b):
+        """Burnikel-Ziegler recursive division: the dividend is consumed in divisor-sized blocks"""
+        n = b.bit_length()
+        blocks = max(1, -(-a.bit_length() // n))
+        remainder = 0
+        quotient_blocks = []
+        for block in reversed(cls._int_to_limbs(a, n, blocks)):
+            q, remainder = cls._bz_div_2n_by_n((remainder << n) + block, b, n)
+            quotient_blocks.append(q)
+        quotient_blocks.reverse()
+        return cls._limbs_to_int(quotient_blocks, n), remainder
 
-        if not result.whole_digits:
-            result.whole_digits = [0]
+    @classmethod
+    def _bz_div_2n_by_n(cls, a, b, n):
+        """Divide a < b * 2**n by the n-bit b through two 3-by-2 half-size steps"""
+        if n // cls.LIMB_BITS < cls.BURNIKEL_ZIEGLER_THRESHOLD:
+            return divmod(a, b)
+        pad = n & 1
+        if pad:
+            a, b, n = a << 1, b << 1, n + 1
+        half = n >> 1
+        mask = (1 << half) - 1
+        b1, b2 = b >> half, b & mask
+        q1, r = cls._bz_div_3_by_2(a >> n, (a >> half) & mask, b, b1, b2, half)
+        q2, r = cls._bz_div_3_by_2(r, a & mask, b, b1, b2, half)
+        if pad:
+            r >>= 1
+        return (q1 << half) | q2, r
 
-        # Calculate fractional part with early termination for repeating decimals
-        result.fractional_digits = []
-        seen_remainders = {}
-        
-        for i in range(precision):
-            if remainder == 0:
-                # Exact division, fill rest with zeros
-                result.fractional_digits.extend([0] * (precision - i))
-                break
-                
-            if remainder in seen_remainders:
-                # Repeating decimal detected, can terminate early
-                break
-                
-            seen_remainders[remainder] = i
-            remainder *= self.base
-            digit = remainder // other_int
-            result.fractional_digits.append(digit)
-            remainder = remainder % other_int
+    @classmethod
+    def _bz_div_3_by_2(cls, a12, a3, b, b1, b2, n):
+        """Divide the three half-blocks (a12, a3) by b = (b1, b2); the estimate is off by at most two"""
+        if a12 >> n == b1:
+            q, r = (1 << n) - 1, a12 - (b1 << n) + b1
+        else:
+            q, r = cls._bz_div_2n_by_n(a12, b1, n)
+        r = ((r << n) | a3) - cls._int_multiply(q, b2)
+        while r < 0:
+            q -= 1
+            r += b
+        return q, r
+
+    @classmethod
+    def _int_newton_divmod(cls, a, b):
+        """Division by multiplying with a Newton-Raphson reciprocal of the divisor"""
+        b_bits = b.bit_length()
+        n = max(a.bit_length() - b_bits, 0) + 2
+        reciprocal = cls._int_reciprocal(b, n)
+        # Bits of a below the divisor's leading 32 cannot move the quotient by a whole unit
+        shift = max(b_bits - 32, 0)
+        q = cls._int_multiply(a >> shift, reciprocal) >> (b_bits + n - shift)
+        r = a - cls._int_multiply(q, b)
+        # The reciprocal is good to a few units; the remainder settles the last quotient bits
+        if r < 0 or r >= b:
+            correction, r = divmod(r, b)
+            q += correction
+        return q, r
 
-        # Pad with zeros if needed
-        while len(result.fractional_digits) < precision:
-            result.fractional_digits.append(0)
+    @classmethod
+    def _int_reciprocal(cls, b, n):
+        """Approximately 2**(b.bit_length() + n) // b, good to a few units, by precision doubling"""
+        b_bits = b.bit_length()
+        # The fixed floor keeps h = n/2 + 32 below n, so the recursion ends whatever the threshold is set to
+        if n <= max(cls.BURNIKEL_ZIEGLER_THRESHOLD * cls.LIMB_BITS, 128):
+            return (1 << (b_bits + n)) // b
+        # Half-precision reciprocal from the leading bits of b, with guard bits
+        h = (n >> 1) + 32
+        t = min(b_bits, h + 32)
+        r = cls._int_reciprocal(b >> (b_bits - t), h)
+        # One Newton step x' = 2x - b*x^2 doubles the correct bits; b only needs n + guard bits
+        t = min(b_bits, n + 32)
+        top = b >> (b_bits - t)
+        correction = cls._int_multiply(top, cls._int_square(r)) >> (t + 2 * h - n)
+        return (r << (n - h + 1)) - correction
 
+    @classmethod
+    def _int_pow(cls, a, k):
+        """a**k for non-negative ints by left-to-right binary powering on the dispatched kernels"""
+        if k == 0:
+            return 1
+        result = a
+        for bit in bin(k)[3:]:
+            result = cls._int_square(result)
+            if bit == '1':
+                result = cls._int_multiply(result, a)
         return result
 
-    def _newton_raphson_divide(self, other):
-        """FIXED: Optimized Newton-Raphson division with better initial guess and overflow-safe convergence"""
+    @classmethod
+    def _int_iroot(cls, n, k):
+        """floor(n ** (1/k)) of a non-negative int by precision doubling.
+
+        The root of the top half of n, scaled back up, is within a unit of its last place, so
+        one Newton step at full size finishes it: the top level costs about one full-size
+        multiply and one divide, and every level below half as much.
+        """
+        if n < 2 or k == 1:
+            return n
+        if k == 2 and n.bit_length() // cls.LIMB_BITS < cls.NEWTON_ROOT_THRESHOLD:
+            return math.isqrt(n)
+        root_bits = (n.bit_length() - 1) // k + 1
+        if root_bits <= 48:
+            # A float seed is good to a few units here; the checks below make it exact
+            x = int(math.exp(math.log(n) / k))
+            while cls._int_pow(x + 1, k) <= n:
+                x += 1
+        else:
+            # Guard bits keep the Newton step within a unit of the floor; y is never below the root
+            s = root_bits // 2 - k.bit_length() - 2
+            y = (cls._int_iroot(n >> (k * s), k) + 1) << s
+            x = ((k - 1) * y + cls._int_divmod(n, cls._int_pow(y, k - 1))[0]) // k
+        while cls._int_pow(x, k) > n:
+            x -= 1
+        return x
+
+    def __truediv__(self, other):
+        """Division with the kernel chosen from the divisor size"""
+        other = self._ensure_apn(other)
+
+        if other._is_zero():
+            raise ZeroDivisionError("Division by zero")
+        if self._is_rational() or other._is_rational():
+            return self._rational_arithmetic(other, '/')
+
+        if other.base != self.base:
+            other = other._convert_to_base(self.base)
+
+        numerator, denominator, precision = self._division_operands(other)
+        return AdvancedPrecisionNumber._from_parts(self._int_divmod(numerator, denominator)[0], -precision,
+                                                   self.negative != other.negative, self.base, precision)
+
+    def _division_operands(self, other):
+        """Integers whose quotient is |self / other| * base**precision, and that precision"""
         precision = max(self.precision, other.precision)
-        
-        # Better initial guess based on leading digits
-        other_leading = other.whole_digits[0] if other.whole_digits[0] != 0 else other.whole_digits[1] if len(other.whole_digits) > 1 else 1
-        initial_guess = self.base // (other_leading + 1)
-        x = AdvancedPrecisionNumber(str(initial_guess), self.base, precision)
-        
-        two = AdvancedPrecisionNumber('2', self.base, precision)
-        epsilon = AdvancedPrecisionNumber('1', self.base, precision)
-        # Create a small epsilon for convergence testing
-        for _ in range(15):  # Make epsilon = 1e-15 approximately
-            epsilon = epsilon / AdvancedPrecisionNumber('10', self.base, precision)
-        
-        # Newton iterations with overflow-safe convergence checking
-        for iteration in range(min(50, precision)):
-            prev_x = x
-            
-            # x = x * (2 - other * x)
-            temp = other * x
-            x = x * (two - temp)
-            
-            # Check for convergence using direct number comparison instead of decimal conversion
-            try:
-                diff = x - prev_x
-                if diff.negative:
-                    diff.negative = False  # Get absolute value
-                
-                # Check if the difference is smaller than epsilon
-                if self._abs_compare_with_other(diff, epsilon) <= 0:
-                    break
-                    
-                # Simple oscillation detection - if x equals a previous value, stop
-                if iteration > 5 and self._numbers_equal(x, prev_x):
-                    break
-                    
-            except (OverflowError, ValueError):
-                # If we get overflow errors, use the previous value and exit
-                x = prev_x
-                break
-        
-        # Final multiplication to get result
-        result = self * x
-        result.negative = self.negative != other.negative
-        
-        return result
+
+        if other._mantissa == 0:
+            raise ZeroDivisionError("Division by zero")
+
+        # |self / other| * base**precision = m1 * base**(e1 - e2 + precision) / m2
+        shift = self._exponent - other._exponent + precision
+        numerator = self._mantissa
+        denominator = other._mantissa
+        if shift >= 0:
+            numerator *= self._base_power(self.base, shift)
+        else:
+            denominator *= self._base_power(self.base, -shift)
+        return numerator, denominator, precision
+
+    def _long_division(self, other, result_negative):
+        """Native long division of the scaled mantissas, truncated to the working precision"""
+        numerator, denominator, precision = self._division_operands(other)
+        return AdvancedPrecisionNumber._from_parts(numerator // denominator, -precision, result_negative,
+                                                   self.base, precision)
+
+    def _burnikel_ziegler_divide(self, other):
+        """Burnikel-Ziegler division of the scaled mantissas, whatever their size"""
+        numerator, denominator, precision = self._division_operands(other)
+        quotient = self._int_burnikel_ziegler_divmod(numerator, denominator)[0]
+        return AdvancedPrecisionNumber._from_parts(quotient, -precision, self.negative != other.negative,
+                                                   self.base, precision)
+
+    def _newton_raphson_divide(self, other):
+        """Newton-Raphson reciprocal division of the scaled mantissas, whatever their size"""
+        numerator, denominator, precision = self._division_operands(other)
+        quotient = self._int_newton_divmod(numerator, denominator)[0]
+        return AdvancedPrecisionNumber._from_parts(quotient, -precision, self.negative != other.negative,
+                                                   self.base, precision)
 
     def __mod__(self, other):
-        # Convert to decimal, modulo, convert back
+        """Remainder of the truncated quotient, so it takes the sign of self"""
         other = self._ensure_apn(other)
         if other._is_zero():
             raise ZeroDivisionError("Modulo by zero")
-        
-        # Perform division and get remainder
-        quotient = self // other
-        remainder = self - (quotient * other)
-        return remainder
+        if self._is_rational() or other._is_rational():
+            return self._rational_arithmetic(other, '%')
+        if other.base != self.base:
+            other = other._convert_to_base(self.base)
+        # self - trunc(self / other) * other, straight from the aligned mantissas
+        numerator, denominator, exponent = self._aligned_mantissas(other)
+        return AdvancedPrecisionNumber._from_parts(self._int_divmod(numerator, denominator)[1], exponent,
+                                                   self.negative, self.base, max(self.precision, other.precision))
 
     def __floordiv__(self, other):
         """Floor division"""
-        result = self / other
-        # Floor the result
-        result.fractional_digits = [0] * result.precision
-        return result
+        other = self._ensure_apn(other)
+        if other._is_zero():
+            raise ZeroDivisionError("Division by zero")
+        if self._is_rational() or other._is_rational():
+            return self._rational_arithmetic(other, '//')
+        if other.base != self.base:
+            other = other._convert_to_base(self.base)
+        # Quotient truncated towards zero, straight from the mantissas
+        numerator, denominator, _ = self._aligned_mantissas(other)
+        return AdvancedPrecisionNumber._from_parts(self._int_divmod(numerator, denominator)[0], 0, self.negative != other.negative,
+                                                   self.base, max(self.precision, other.precision))
+
+    def __pow__(self, n, modulus=None):
+        """FIXED: Optimized power calculation using binary exponentiation; pow(a, b, m) reduces as it goes"""
+        if modulus is not None:
+            return self._modular_power(n, modulus)
 
-    def __pow__(self, n):
-        """FIXED: Optimized power calculation using binary exponentiation"""
         if isinstance(n, AdvancedPrecisionNumber):
-            n = int(n._base_to_decimal())
+            if not n._is_integer():
+                return self._real_power(n)
+            n = n._to_int()
         
         if not isinstance(n, int):
             raise ValueError("Power operation currently supports only integer exponents")
     
         if n == 0:
-            return AdvancedPrecisionNumber('1', self.base, self.precision)
+            return AdvancedPrecisionNumber.from_int(1, self.base, self.precision)
+
+        if self._is_rational():
+            # Powers of a reduced ratio are already reduced
+            numerator, denominator = self._reduced_ratio()
+            if n < 0:
+                numerator, denominator, n = denominator, numerator, -n
+            numerator, denominator = self._int_pow(numerator, n), self._int_pow(denominator, n)
+            return AdvancedPrecisionNumber._from_ratio(-numerator if self.negative and n & 1 else numerator,
+                                                       denominator, self.base, self.precision,
+                                                       max(numerator.bit_length(), denominator.bit_length()), True)
     
         if n < 0:
             base_inv = self.inverse()
@@ -1036,401 +1710,979 @@ class AdvancedPrecisionNumber:
             return self._sliding_window_power(n)
         
         # Standard binary exponentiation for smaller exponents
-        result = AdvancedPrecisionNumber('1', self.base, self.precision)
-        base = AdvancedPrecisionNumber(str(self), self.base, self.precision)
+        result = None
+        base = self
     
         while n > 0:
             if n & 1:  # If n is odd
-                result = result * base
-            base = base * base
+                result = base if result is None else result * base
             n >>= 1
+            if n:
+                base = base._square()
     
         return result
 
+    def _real_power(self, n):
+        """self**n for a non-integer exponent n, as exp(n * ln(self))"""
+        precision = max(self.precision, n.precision)
+        if self.negative:
+            raise ValueError("A negative number raised to a non-integer power is not real")
+        if self._is_zero():
+            if n.negative:
+                raise ZeroDivisionError("Zero cannot be raised to a negative power")
+            return AdvancedPrecisionNumber.from_int(0, self.base, precision)
+
+        # An exponent that is p/q to within its last digit (0.5, or 1/3 truncated to 0.333...)
+        # is taken as exactly p/q: floor of the q-th root of self**p is exact where the answer is
+        root = self._rational_root_power(n, precision)
+        if root is not None:
+            return root
+
+        # An error e in n * ln(self) is a relative error e in the result, so every integer digit
+        # of the result needs one more digit in the exponent
+        size = 2.0 ** min(n._log2_upper_bound(), 64) * abs(self._log2_upper_bound()) * math.log10(2)
+        work = precision + min(int(size), 10 ** 6) + 10
+        x = AdvancedPrecisionNumber._from_parts(self._mantissa, self._exponent, False, self.base, work)
+        y = AdvancedPrecisionNumber._from_parts(n._mantissa, n._exponent, n.negative, n.base, work)
+        result = (x.log() * y).exp()
+        return AdvancedPrecisionNumber._from_parts(result._mantissa, result._exponent, False, self.base, precision)
+
+    def _rational_root_power(self, n, precision):
+        """self**n truncated to precision places when n is p/q with a small q, else None"""
+        numerator, denominator = n._as_ratio()
+        p, q = self._int_best_rational(numerator, denominator, self.ROOT_POWER_MAX_DENOMINATOR)
+        # Accept p/q only if it lies within one unit in the exponent's last place
+        if abs(numerator * q - p * denominator) * self._base_power(n.base, n.precision) >= denominator * q:
+            return None
+        a, b = self._as_ratio()
+        if p < 0:
+            a, b, p = b, a, -p
+        scale_bits = q * precision * math.log2(self.base)
+        if p * max(a.bit_length(), b.bit_length()) + scale_bits > self.ROOT_POWER_MAX_BITS:
+            return None
+        # floor((a/b)**(p/q) * base**precision) = floor(floor(a**p * base**(q*precision) / b**p) ** (1/q))
+        scaled = self._int_multiply(self._int_pow(a, p), self._base_power(self.base, q * precision))
+        root = self._int_iroot(self._int_divmod(scaled, self._int_pow(b, p))[0], q)
+        return AdvancedPrecisionNumber._from_parts(root, -precision, False, self.base, precision)
+
     def _sliding_window_power(self, n):
-        """Sliding window exponentiation for very large exponents"""
+        """Left-to-right sliding window exponentiation for very large exponents"""
         if n == 0:
-            return AdvancedPrecisionNumber('1', self.base, self.precision)
+            return AdvancedPrecisionNumber.from_int(1, self.base, self.precision)
         
         # Window size (typically 4-6 for optimal performance)
         window_size = 4
         
-        # Precompute powers
-        powers = [AdvancedPrecisionNumber('1', self.base, self.precision)]
-        base = AdvancedPrecisionNumber(str(self), self.base, self.precision)
+        # Precompute odd powers self^1, self^3, ..., self^(2^window_size - 1)
+        square = self._square()
+        powers = {1: self}
+        for i in range(3, 1 << window_size, 2):
+            powers[i] = powers[i - 2] * square
         
-        for i in range(1, 1 << window_size):
-            powers.append(powers[-1] * base)
-        
-        result = AdvancedPrecisionNumber('1', self.base, self.precision)
-        
-        # Process exponent in windows
-        while n > 0:
-            if n & 1:
-                # Find the longest sequence of 1s
-                window = 1
-                temp_n = n >> 1
-                
-                for i in range(1, window_size):
-                    if temp_n & 1:
-                        window = (window << 1) | 1
-                        temp_n >>= 1
-                    else:
-                        break
-                
-                result = result * powers[window]
-                n >>= window.bit_length()
+        bits = bin(n)[2:]
+        result = None
+        i = 0
+        # Process exponent in windows from the most significant bit
+        while i < len(bits):
+            if bits[i] == '0':
+                result = result._square()
+                i += 1
+                continue
+            # Longest window of at most window_size bits that ends in a 1
+            j = min(i + window_size, len(bits))
+            while bits[j - 1] == '0':
+                j -= 1
+            window = int(bits[i:j], 2)
+            if result is None:
+                result = powers[window]
             else:
-                result = result * result
-                n >>= 1
+                for _ in range(j - i):
+                    result = result._square()
+                result = result * powers[window]
+            i = j
         
         return result
 
+    def _modular_power(self, n, modulus):
+        """self**n mod modulus for integers, with the result in [0, modulus) as for int pow()"""
+        n = self._ensure_apn(n)
+        modulus = self._ensure_apn(modulus)
+        if not (self._is_integer() and n._is_integer() and modulus._is_integer()):
+            raise ValueError("Modular exponentiation requires integer arguments")
+        if modulus._is_zero():
+            raise ValueError("Modulus cannot be zero")
+        m = modulus._whole_int()
+        a = self._to_int() % m
+        if n.negative:
+            # As for int pow(): a negative exponent raises the modular inverse
+            a = self._int_modinv(a, m)
+        residue = self._int_modular_power(a, n._whole_int(), m)
+        if modulus.negative and residue:
+            residue -= m
+        return AdvancedPrecisionNumber._from_parts(abs(residue), 0, residue < 0, self.base, self.precision)
+
+    @classmethod
+    def _int_modular_power(cls, a, e, m):
+        """a**e mod m for non-negative ints with a < m, dispatching on the modulus size in limbs"""
+        if m.bit_length() // cls.LIMB_BITS < cls.MODULAR_REDUCTION_THRESHOLD:
+            # The interpreter's windowed pow with native remainders wins while products are schoolbook
+            return pow(a, e, m)
+        if m & 1:
+            return cls._int_montgomery_power(a, e, m)
+        return cls._int_barrett_power(a, e, m)
+
+    @classmethod
+    def _int_montgomery_power(cls, a, e, m):
+        """Modular power for odd m on Montgomery residues a*R mod m, R = 2**k: no divisions at all"""
+        k = m.bit_length()
+        mask = (1 << k) - 1
+        # -1/m mod R by Newton-Hensel lifting: each step doubles the number of correct low bits
+        inverse, bits = 1, 1
+        while bits < k:
+            bits = min(2 * bits, k)
+            inverse = (inverse * (2 - m * inverse)) & ((1 << bits) - 1)
+        m_prime = -inverse & mask
+
+        def reduce(t):
+            u = cls._int_multiply(t & mask, m_prime) & mask
+            t = (t + cls._int_multiply(u, m)) >> k
+            return t - m if t >= m else t
+
+        def mul(x, y):
+            return reduce(cls._int_multiply(x, y))
+
+        def sqr(x):
+            return reduce(cls._int_square(x))
+
+        one = (1 << k) % m
+        result = cls._int_window_power((a << k) % m, e, mul, sqr, one)
+        return reduce(result)
+
+    @classmethod
+    def _int_barrett_power(cls, a, e, m):
+        """Modular power reducing each product by a precomputed reciprocal of m instead of dividing"""
+        k = m.bit_length()
+        mu = (1 << (2 * k)) // m
+
+        def reduce(t):
+            q = cls._int_multiply(t >> (k - 1), mu) >> (k + 1)
+            r = t - cls._int_multiply(q, m)
+            while r >= m:
+                r -= m
+            return r
+
+        def mul(x, y):
+            return reduce(cls._int_multiply(x, y))
+
+        def sqr(x):
+            return reduce(cls._int_square(x))
+
+        return cls._int_window_power(a, e, mul, sqr, 1 % m)
+
+    @staticmethod
+    def _int_window_power(x, e, mul, sqr, one):
+        """x**e under the given product and square by left-to-right sliding windows"""
+        if e == 0:
+            return one
+        bits = e.bit_length()
+        window_size = 1 if bits < 16 else 3 if bits < 80 else 4 if bits < 240 else 5 if bits < 672 else 6
+        # Odd powers x, x**3, ..., x**(2**window_size - 1)
+        powers = [x]
+        if window_size > 1:
+            square = sqr(x)
+            for _ in range((1 << (window_size - 1)) - 1):
+                powers.append(mul(powers[-1], square))
+        result = one
+        i = bits - 1
+        while i >= 0:
+            if not (e >> i) & 1:
+                result = sqr(result)
+                i -= 1
+                continue
+            # Longest window of at most window_size bits that ends in a 1
+            j = max(i - window_size + 1, 0)
+            while not (e >> j) & 1:
+                j += 1
+            for _ in range(i - j + 1):
+                result = sqr(result)
+            result = mul(result, powers[((e >> j) & ((1 << (i - j + 1)) - 1)) >> 1])
+            i = j - 1
+        return result
+
+    # Comparisons work on sign and mantissa, never through floats
+    def _order(self, other):
+        """_compare against a plain number: None against NaN, NotImplemented for non-numbers"""
+        if isinstance(other, fractions.Fraction):
+            other = AdvancedPrecisionNumber._from_ratio(other.numerator, other.denominator, 10, self.precision)
+        elif isinstance(other, float) and not math.isfinite(other):
+            return None if math.isnan(other) else (-1 if other > 0 else 1)
+        elif isinstance(other, (int, float)):
+            other = self._ensure_apn(other)
+        elif not isinstance(other, AdvancedPrecisionNumber):
+            return NotImplemented
+        return self._compare(other)
+
     def __eq__(self, other):
-        other = self._ensure_apn(other)
-        return abs(self._base_to_decimal() - other._base_to_decimal()) < 1e-10
+        order = self._order(other)
+        return order if order is NotImplemented else order == 0
 
     def __lt__(self, other):
-        other = self._ensure_apn(other)
-        return self._base_to_decimal() < other._base_to_decimal()
+        order = self._order(other)
+        return order if order is NotImplemented else order is not None and order < 0
 
     def __le__(self, other):
-        other = self._ensure_apn(other)
-        return self._base_to_decimal() <= other._base_to_decimal()
+        order = self._order(other)
+        return order if order is NotImplemented else order is not None and order <= 0
 
     def __gt__(self, other):
-        other = self._ensure_apn(other)
-        return self._base_to_decimal() > other._base_to_decimal()
+        order = self._order(other)
+        return order if order is NotImplemented else order is not None and order > 0
 
     def __ge__(self, other):
-        other = self._ensure_apn(other)
-        return self._base_to_decimal() >= other._base_to_decimal()
+        order = self._order(other)
+        return order if order is NotImplemented else order is not None and order >= 0
 
     def __ne__(self, other):
-        return not self.__eq__(other)
+        order = self._order(other)
+        return order if order is NotImplemented else order != 0
 
     def __neg__(self):
         """Unary minus operator"""
-        result = AdvancedPrecisionNumber('0', self.base, self.precision)
-        result.whole_digits = self.whole_digits.copy()
-        result.fractional_digits = self.fractional_digits.copy()
-        result.negative = not self.negative
-        return result
+        if self._is_rational():
+            numerator, denominator, bound, reduced = self._extras['ratio']
+            return AdvancedPrecisionNumber._from_ratio(numerator if self.negative else -numerator, denominator,
+                                                       self.base, self.precision, bound, reduced)
+        if self._mantissa == 0:
+            return self
+        return AdvancedPrecisionNumber._from_parts(self._mantissa, self._exponent, not self.negative,
+                                                   self.base, self.precision)
 
     # Unary operations
     def sqrt(self):
-        """Optimized square root with better convergence"""
+        """Square root, truncated to `precision` places"""
         if self.negative:
             raise ValueError("Cannot calculate square root of negative number")
-        
-        if self._is_zero():
-            return AdvancedPrecisionNumber('0', self.base, self.precision)
-
-        # Better initial guess using bit manipulation
-        decimal_val = self._base_to_decimal()
-        if decimal_val >= 1:
-            # For numbers >= 1, start with a power of 2 approximation
-            bit_length = int(decimal_val).bit_length()
-            initial_guess = 1 << (bit_length // 2)
+        return self.nth_root(2)
+
+    def nth_root(self, k):
+        """Principal k-th root, truncated to `precision` places; odd roots keep the sign"""
+        if not isinstance(k, int) or k < 1:
+            raise ValueError("Root degree must be a positive integer")
+        if self.negative and k % 2 == 0:
+            raise ValueError("Cannot calculate an even root of a negative number")
+        if k == 1:
+            return self
+        # The integer k-th root of floor(|self| * base**(k * precision)) is the root's digits
+        precision = self.precision
+        shift = self._exponent + k * precision
+        if shift >= 0:
+            radicand = self._int_multiply(self._mantissa, self._base_power(self.base, shift))
         else:
-            # For numbers < 1, start with 1
-            initial_guess = 1
-            
-        x = AdvancedPrecisionNumber(str(initial_guess), self.base, self.precision)
-        two = AdvancedPrecisionNumber('2', self.base, self.precision)
-        
-        # Newton's method with adaptive precision
-        for iteration in range(max(50, self.precision // 10)):
-            prev_x = x
-            try:
-                x = (x + self / x) / two
-                
-                # Check for convergence with relative error
-                current_val = x._base_to_decimal()
-                prev_val = prev_x._base_to_decimal()
-                
-                if prev_val != 0:
-                    relative_error = abs(current_val - prev_val) / abs(prev_val)
-                    if relative_error < 1e-15:
-                        break
-            except:
-                break
-        
-        return x
+            radicand = self._int_divmod(self._mantissa, self._base_power(self.base, -shift))[0]
+        return AdvancedPrecisionNumber._from_parts(self._int_iroot(radicand, k), -precision, self.negative,
+                                                   self.base, precision)
 
     def sqr(self):
-        """Square the number using optimized power method"""
-        return self ** 2
+        """Square the number with the dedicated squaring kernel"""
+        return self._square()
 
     def cube(self):
         """Cube the number using optimized power method"""
         return self ** 3
 
     def cube_root(self):
-        """Optimized cube root using Newton's method"""
-        if self._is_zero():
-            return AdvancedPrecisionNumber('0', self.base, self.precision)
-        
-        # Better initial guess
-        decimal_val = abs(self._base_to_decimal())
-        if decimal_val >= 1:
-            bit_length = int(decimal_val).bit_length()
-            initial_guess = 1 << (bit_length // 3)
-        else:
-            initial_guess = 1
-            
-        x = AdvancedPrecisionNumber(str(initial_guess), self.base, self.precision)
-        three = AdvancedPrecisionNumber('3', self.base, self.precision)
-        two = AdvancedPrecisionNumber('2', self.base, self.precision)
-        
-        for iteration in range(max(50, self.precision // 10)):
-            prev_x = x
+        """Real cube root, truncated to `precision` places"""
+        return self.nth_root(3)
+
+    def isqrt(self):
+        """Integer square root floor(sqrt(n)) of a non-negative integer"""
+        if self.negative:
+            raise ValueError("Cannot calculate square root of negative number")
+        return self.iroot(2)
+
+    def iroot(self, k):
+        """Integer k-th root of an integer, rounded toward zero; odd roots keep the sign"""
+        if not isinstance(k, int) or k < 1:
+            raise ValueError("Root degree must be a positive integer")
+        if not self._is_integer():
+            raise ValueError("Integer roots are only defined for integers")
+        if self.negative and k % 2 == 0:
+            raise ValueError("Cannot calculate an even root of a negative number")
+        return AdvancedPrecisionNumber._from_parts(self._int_iroot(self._whole_int(), k), 0, self.negative,
+                                                   self.base, self.precision)
+
+    def is_perfect_power(self):
+        """True when the integer is m**k for some integer m and k >= 2 (odd k for negatives)"""
+        if not self._is_integer():
+            return False
+        n = self._whole_int()
+        if n < 2:
+            return True
+        # Only prime exponents need trying: m**(p*q) is also (m**q)**p
+        bits = n.bit_length()
+        sieve = self._prime_sieve(bits + 1)
+        for k in range(3 if self.negative else 2, bits + 1):
+            if sieve[k] and self._int_pow(self._int_iroot(n, k), k) == n:
+                return True
+        return False
+
+    def _integer_operands(self, other, name):
+        """Both operands as signed ints, for the integer-only number-theory functions"""
+        other = self._ensure_apn(other)
+        if not (self._is_integer() and other._is_integer()):
+            raise ValueError(f"{name} is only defined for integers")
+        return self._to_int(), other._to_int()
+
+    def gcd(self, other):
+        """Greatest common divisor of two integers, always non-negative"""
+        a, b = self._integer_operands(other, "GCD")
+        return AdvancedPrecisionNumber._from_parts(self._int_gcd(abs(a), abs(b)), 0, False, self.base,
+                                                   self.precision)
+
+    def lcm(self, other):
+        """Least common multiple of two integers, always non-negative"""
+        a, b = self._integer_operands(other, "LCM")
+        a, b = abs(a), abs(b)
+        result = 0 if a == 0 or b == 0 else self._int_multiply(a // self._int_gcd(a, b), b)
+        return AdvancedPrecisionNumber._from_parts(result, 0, False, self.base, self.precision)
+
+    def xgcd(self, other):
+        """(g, x, y) with self*x + other*y = g = gcd(self, other)"""
+        a, b = self._integer_operands(other, "Extended GCD")
+        return tuple(AdvancedPrecisionNumber._from_parts(abs(v), 0, v < 0, self.base, self.precision)
+                     for v in self._int_xgcd(a, b))
+
+    def modinv(self, modulus):
+        """Inverse of self modulo an integer, in [0, modulus) as for pow(self, -1, modulus)"""
+        a, m = self._integer_operands(modulus, "Modular inverse")
+        if m == 0:
+            raise ValueError("Modulus cannot be zero")
+        inverse = self._int_modinv(a % abs(m), abs(m))
+        if m < 0 and inverse:
+            inverse += m
+        return AdvancedPrecisionNumber._from_parts(abs(inverse), 0, inverse < 0, self.base, self.precision)
+
+    @classmethod
+    def _int_gcd(cls, a, b):
+        """gcd of non-negative ints: native Lehmer, after half-GCD reduction for very large operands"""
+        if a < b:
+            a, b = b, a
+        while b.bit_length() // cls.LIMB_BITS >= cls.HALF_GCD_THRESHOLD:
+            _, a, b = cls._int_reduce_gcd(a, b)
+        return math.gcd(a, b)
+
+    @classmethod
+    def _int_xgcd(cls, a, b):
+        """(g, x, y) with a*x + b*y = g = gcd(a, b) for any ints"""
+        x_sign, y_sign = (-1 if a < 0 else 1), (-1 if b < 0 else 1)
+        a, b = abs(a), abs(b)
+        swapped = a < b
+        if swapped:
+            a, b = b, a
+        # Half-GCD steps first, collected in one matrix with (a, b) = matrix (a', b')
+        matrix = (1, 0, 0, 1)
+        while b.bit_length() // cls.LIMB_BITS >= cls.HALF_XGCD_THRESHOLD:
+            step, a, b = cls._int_reduce_gcd(a, b)
+            matrix = cls._gcd_matrix_multiply(matrix, step)
+        g, x = cls._int_lehmer_xgcd(a, b)
+        y = (g - a * x) // b if b else 0
+        if matrix != (1, 0, 0, 1):
+            # g = x*a' + y*b', and (a', b') is the inverse matrix applied to the original (a, b)
+            m00, m01, m10, m11 = matrix
+
+            def mul(u, v):
+                return cls._int_multiply(u, v) if u >= 0 else -cls._int_multiply(-u, v)
+
+            x, y = mul(x, m11) - mul(y, m10), mul(y, m00) - mul(x, m01)
+            if cls._gcd_matrix_det(matrix) < 0:
+                x, y = -x, -y
+        if swapped:
+            x, y = y, x
+        return g, x * x_sign, y * y_sign
+
+    @classmethod
+    def _int_modinv(cls, a, m):
+        """Inverse of a modulo m > 0, in [0, m)"""
+        if m.bit_length() // cls.LIMB_BITS < cls.HALF_XGCD_THRESHOLD:
             try:
-                x_squared = x * x
-                x = (two * x + self / x_squared) / three
-                
-                # Check convergence
-                if abs(x._base_to_decimal() - prev_x._base_to_decimal()) < 1e-15:
+                return pow(a, -1, m)
+            except ValueError:
+                raise ValueError(f"{a} is not invertible modulo {m}") from None
+        g, x, _ = cls._int_xgcd(a, m)
+        if g != 1:
+            raise ValueError(f"{a} is not invertible modulo {m}")
+        return x % m
+
+    @classmethod
+    def _int_lehmer_xgcd(cls, a, b):
+        """(g, x) with a*x = g (mod b), for a >= b >= 0, by Lehmer's algorithm.
+
+        Quotients are found from the leading 62 bits of both operands while they agree
+        with those of the true values, so the big operands are updated once per run of
+        single-word steps instead of once per quotient.
+        """
+        x0, x1 = 1, 0
+        while b.bit_length() > 62:
+            shift = a.bit_length() - 62
+            ah, bh = a >> shift, b >> shift
+            p, q, r, s = 1, 0, 0, 1
+            while bh + r and bh + s:
+                quotient = (ah + p) // (bh + r)
+                if quotient != (ah + q) // (bh + s):
                     break
-            except:
-                break
-        
-        # Handle negative numbers
-        if self.negative:
-            x.negative = True
-            
-        return x
+                p, r = r, p - quotient * r
+                q, s = s, q - quotient * s
+                ah, bh = bh, ah - quotient * bh
+            if q == 0:
+                # No word-sized step was certain: one full-precision division
+                quotient, remainder = divmod(a, b)
+                a, b = b, remainder
+                x0, x1 = x1, x0 - quotient * x1
+            else:
+                a, b = p * a + q * b, r * a + s * b
+                x0, x1 = p * x0 + q * x1, r * x0 + s * x1
+        while b:
+            quotient, remainder = divmod(a, b)
+            a, b = b, remainder
+            x0, x1 = x1, x0 - quotient * x1
+        return a, x0
+
+    @classmethod
+    def _int_reduce_gcd(cls, a, b):
+        """One half-GCD reduction of a >= b >= 0, or a single Euclid step if b is already short"""
+        matrix, a2, b2 = cls._int_half_gcd(a, b)
+        if matrix == (1, 0, 0, 1):
+            quotient, remainder = divmod(a, b)
+            return (quotient, 1, 1, 0), b, remainder
+        return matrix, a2, b2
+
+    @classmethod
+    def _int_half_gcd(cls, a, b):
+        """Half-GCD of a >= b >= 0: (M, a', b') with (a, b) = M (a', b') and a', b' consecutive
+        Euclidean remainders, a' above and b' at most half the bits of a.
+
+        M is the product of the quotient matrices [[q, 1], [1, 0]]. The quotients of the top
+        halves are found recursively, twice, so the cost is that of a few multiplications per
+        level instead of one division per quotient.
+        """
+        s = a.bit_length() // 2
+        if b.bit_length() <= s:
+            return (1, 0, 0, 1), a, b
+        if a.bit_length() // cls.LIMB_BITS < cls.HALF_GCD_LEAF_LIMBS:
+            return cls._gcd_steps((1, 0, 0, 1), a, b, s)
+        # Reduce the top n/2 bits to their half, taking the full operands to about 3n/4 bits
+        matrix, a, b = cls._gcd_apply_top(a, b, s)
+        if b.bit_length() > s:
+            quotient, remainder = divmod(a, b)
+            m00, m01, m10, m11 = matrix
+            matrix = (m00 * quotient + m01, m00, m10 * quotient + m11, m10)
+            a, b = b, remainder
+            if b.bit_length() > s:
+                # Then the top 2(n' - n/2) bits of the n'-bit operands take them to n/2 bits
+                step, a, b = cls._gcd_apply_top(a, b, max(2 * s - a.bit_length() + 1, 0))
+                matrix = cls._gcd_matrix_multiply(matrix, step)
+        # Any step past the target is undone, then single steps close the remaining gap
+        while matrix[1] and a.bit_length() <= s:
+            matrix, a, b = cls._gcd_matrix_pop(matrix, a, b)
+        return cls._gcd_steps(matrix, a, b, s)
+
+    @classmethod
+    def _gcd_apply_top(cls, a, b, shift):
+        """Half-GCD of the operands above `shift` bits, applied to the full operands.
+
+        The quotients of the top bits are those of the full operands except perhaps the
+        last few, which are undone until the remainders are valid (a > b >= 0) again.
+        """
+        matrix, top_a, top_b = cls._int_half_gcd(a >> shift, b >> shift)
+        if matrix == (1, 0, 0, 1):
+            return matrix, a, b
+        mask = (1 << shift) - 1
+        low_a, low_b = cls._gcd_matrix_solve(matrix, a & mask, b & mask)
+        a, b = (top_a << shift) + low_a, (top_b << shift) + low_b
+        while matrix[1] and not a > b >= 0:
+            matrix, a, b = cls._gcd_matrix_pop(matrix, a, b)
+        return matrix, a, b
+
+    @classmethod
+    def _gcd_steps(cls, matrix, a, b, s):
+        """Plain Euclid steps on a > b until b has at most s bits, accumulated into matrix"""
+        m00, m01, m10, m11 = matrix
+        while b.bit_length() > s:
+            quotient, remainder = divmod(a, b)
+            a, b = b, remainder
+            m00, m01 = m00 * quotient + m01, m00
+            m10, m11 = m10 * quotient + m11, m10
+        return (m00, m01, m10, m11), a, b
+
+    @classmethod
+    def _gcd_matrix_multiply(cls, left, right):
+        mul = cls._int_multiply
+        a, b, c, d = left
+        e, f, g, h = right
+        return (mul(a, e) + mul(b, g), mul(a, f) + mul(b, h), mul(c, e) + mul(d, g), mul(c, f) + mul(d, h))
+
+    @staticmethod
+    def _gcd_matrix_det(matrix):
+        """Determinant of a quotient-matrix product, which is +1 or -1, read off modulo 4"""
+        m00, m01, m10, m11 = matrix
+        return 1 if (m00 % 4 * (m11 % 4) - m01 % 4 * (m10 % 4)) % 4 == 1 else -1
 
-    def factorial(self):
-        """FIXED: Optimized factorial calculation"""
+    @classmethod
+    def _gcd_matrix_solve(cls, matrix, a, b):
+        """(a', b') with (a, b) = matrix (a', b'), for non-negative a and b"""
+        m00, m01, m10, m11 = matrix
+        mul = cls._int_multiply
+        x, y = mul(m11, a) - mul(m01, b), mul(m00, b) - mul(m10, a)
+        return (x, y) if cls._gcd_matrix_det(matrix) > 0 else (-x, -y)
+
+    @staticmethod
+    def _gcd_matrix_pop(matrix, a, b):
+        """Undo the last quotient step of matrix: back to the previous pair of remainders"""
+        m00, m01, m10, m11 = matrix
+        # Each row's floor bounds the last quotient from above and at least one is exact
+        quotient = m00 // m01 if m11 == 0 else min(m00 // m01, m10 // m11)
+        return (m01, m00 - quotient * m01, m11, m10 - quotient * m11), quotient * a + b, a
+
+    def factorial(self, workers=None):
+        """Factorial of a non-negative integer by the prime-swing algorithm.
+
+        ``workers`` (default PARALLEL_WORKERS) above 1 spreads very large factorials
+        over that many processes.
+        """
         # Only for non-negative integers
-        if self.negative or any(d != 0 for d in self.fractional_digits):
+        if self.negative or not self._is_integer():
             raise ValueError("Factorial is only defined for non-negative integers")
-    
-        # Convert to integer value
-        n = int(self._base_to_decimal())
-    
-        # Handle special cases
-        if n == 0 or n == 1:
-            return AdvancedPrecisionNumber('1', self.base, self.precision)
-    
-        # For large factorials, use optimized algorithms
-        if n > 100:
-            return self._prime_swing_factorial(n)
-        
-        # Iterative factorial calculation for smaller numbers
-        result = AdvancedPrecisionNumber('1', self.base, self.precision)
-        for i in range(2, n + 1):
-            result = result * AdvancedPrecisionNumber(str(i), self.base, self.precision)
-    
-        return result
 
-    def _prime_swing_factorial(self, n):
-        """Prime swing factorial algorithm for large factorials"""
-        # This is a simplified version - full implementation would use prime factorization
-        # For now, use the standard method with optimizations
-        result = AdvancedPrecisionNumber('1', self.base, self.precision)
-        
-        # Calculate in chunks to reduce intermediate number sizes
-        chunk_size = 50
-        for start in range(2, n + 1, chunk_size):
-            end = min(start + chunk_size - 1, n)
-            chunk_product = AdvancedPrecisionNumber('1', self.base, self.precision)
-            
-            for i in range(start, end + 1):
-                chunk_product = chunk_product * AdvancedPrecisionNumber(str(i), self.base, self.precision)
-            
-            result = result * chunk_product
-        
+        return AdvancedPrecisionNumber._from_parts(self._int_factorial(self._to_int(), workers), 0, False,
+                                                   self.base, self.precision)
+
+    @classmethod
+    def _int_factorial(cls, n, workers=None):
+        """n! as an int, served from or extending the memo of recent results"""
+        memo = cls._factorial_memo
+        with cls._factorial_lock:
+            if n in memo:
+                memo.move_to_end(n)
+                return memo[n]
+            # Extending a cached m! is cheaper than a fresh computation when the gap is small
+            below = [m for m in memo if m < n]
+            start = max(below) if below else None
+            start_value = memo[start] if start is not None else None
+
+        # The product itself runs outside the lock
+        workers = cls.PARALLEL_WORKERS if workers is None else workers
+        if start is not None and n - start <= n // 4:
+            result = cls._int_multiply(start_value, cls._range_product(start + 1, n, workers))
+        elif workers and workers > 1 and n >= cls.PARALLEL_FACTORIAL_THRESHOLD:
+            result = cls._parallel_factorial(n, workers)
+        else:
+            result = cls._prime_swing_factorial(n)
+
+        with cls._factorial_lock:
+            memo[n] = result
+            memo.move_to_end(n)
+            while len(memo) > cls.FACTORIAL_MEMO_SIZE:
+                memo.popitem(last=False)
         return result
 
+    @classmethod
+    def _prime_swing_factorial(cls, n):
+        """n! = ((n//2)!)**2 * swing(n), where the swing is a product of prime powers"""
+        if n < 20:
+            return math.prod(range(2, n + 1))
+        with cls._factorial_lock:
+            half = cls._factorial_memo.get(n // 2)
+        if half is None:
+            half = cls._prime_swing_factorial(n // 2)
+        return cls._int_multiply(cls._int_square(half), cls._swing(n))
+
+    @classmethod
+    def _swing(cls, n):
+        """n! / ((n//2)!)**2 from the exponent of each prime, multiplied by a balanced product tree"""
+        sieve = cls._prime_sieve(n)
+        factors = []
+        for p in range(2, n + 1):
+            if not sieve[p]:
+                continue
+            if p * p <= n:
+                # Exponent of p is the number of odd quotients n // p**k
+                q, power = n, 1
+                while q:
+                    q //= p
+                    if q & 1:
+                        power *= p
+                if power > 1:
+                    factors.append(power)
+            elif p <= n // 3:
+                if (n // p) & 1:
+                    factors.append(p)
+            elif p > n // 2:
+                factors.append(p)
+        return cls._product_tree(factors)
+
+    @classmethod
+    def _prime_sieve(cls, n):
+        """Sieve of Eratosthenes up to at least n, cached and regrown by doubling"""
+        if len(cls._sieve) <= n:
+            size = max(n + 1, 2 * len(cls._sieve))
+            sieve = bytearray([1]) * size
+            sieve[0:2] = b'\x00\x00'
+            for p in range(2, math.isqrt(size - 1) + 1):
+                if sieve[p]:
+                    sieve[p * p::p] = bytes(len(range(p * p, size, p)))
+            cls._sieve = sieve
+        return cls._sieve
+
+    @classmethod
+    def _product_tree(cls, values):
+        """Product of a list of ints, pairing equal-sized operands so big multiplies stay balanced"""
+        if not values:
+            return 1
+        while len(values) > 1:
+            paired = [cls._int_multiply(values[i], values[i + 1]) for i in range(0, len(values) - 1, 2)]
+            if len(values) & 1:
+                paired.append(values[-1])
+            values = paired
+        return values[0]
+
+    @classmethod
+    def _range_product(cls, lo, hi, workers=None):
+        """lo * (lo + 1) * ... * hi by a balanced product tree"""
+        workers = cls.PARALLEL_WORKERS if workers is None else workers
+        if workers and workers > 1 and hi - lo >= cls.PARALLEL_PRODUCT_THRESHOLD:
+            # Sub-ranges of equal length hold factors of nearly equal size
+            step = -(-(hi - lo + 1) // (4 * workers))
+            bounds = [(start, min(start + step - 1, hi)) for start in range(lo, hi + 1, step)]
+            return cls._parallel_merge(_range_product_worker, bounds, workers)
+        return cls._product_tree(list(range(lo, hi + 1)))
+
+    @classmethod
+    def _parallel_factorial(cls, n, workers):
+        """n! from its prime factorisation, odd prime powers multiplied out in worker processes"""
+        sieve = cls._prime_sieve(n)
+        # Legendre: the exponent of p in n! is the sum of n // p**k; for 2 it is n - popcount(n)
+        pairs = []
+        for p in range(3, n + 1, 2):
+            if sieve[p]:
+                exponent, q = 0, n
+                while q:
+                    q //= p
+                    exponent += q
+                pairs.append((p, exponent))
+        weights = [e * p.bit_length() for p, e in pairs]
+        chunks = cls._balanced_chunks(pairs, weights, 4 * workers)
+        return cls._parallel_merge(_prime_power_product_worker, chunks, workers) << (n - bin(n).count('1'))
+
+    @staticmethod
+    def _balanced_chunks(items, weights, count):
+        """Split items into at most `count` contiguous chunks of roughly equal total weight"""
+        target = sum(weights) / count
+        chunks, current, load = [], [], 0
+        for item, weight in zip(items, weights):
+            current.append(item)
+            load += weight
+            if load >= target:
+                chunks.append(current)
+                current, load = [], 0
+        if current:
+            chunks.append(current)
+        return chunks
+
+    @classmethod
+    def _parallel_merge(cls, worker, tasks, workers):
+        """Run worker over tasks in a process pool and merge the partial products in this process"""
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            partials = [_decode_limbs(data) for data in pool.map(worker, tasks)]
+        return cls._product_tree(partials)
+
+    def _as_ratio(self):
+        """The exact value as (signed numerator, positive denominator)"""
+        if self._is_rational():
+            numerator, denominator = self._extras['ratio'][:2]
+        elif self._exponent >= 0:
+            numerator, denominator = self._mantissa * self._base_power(self.base, self._exponent), 1
+        else:
+            numerator, denominator = self._mantissa, self._base_power(self.base, -self._exponent)
+        return (-numerator if self.negative else numerator), denominator
+
+    # Binary fixed-point kernels: a real v is carried as the int floor(v * 2**bits)
+    def _to_fixed(self, bits):
+        """self * 2**bits truncated towards zero, as a signed int"""
+        numerator, denominator = self._as_ratio()
+        numerator = abs(numerator)
+        if bits >= 0:
+            numerator <<= bits
+        else:
+            denominator <<= -bits
+        value = self._int_divmod(numerator, denominator)[0]
+        return -value if self.negative else value
+
+    def _from_fixed(self, value, bits):
+        """A number in this one's base and precision from the fixed-point int value / 2**bits"""
+        scaled = self._int_multiply(abs(value), self._base_power(self.base, self.precision)) >> bits
+        return AdvancedPrecisionNumber._from_parts(scaled, -self.precision, value < 0, self.base, self.precision)
+
+    def _fixed_bits(self):
+        """Fractional bits that cover this number's precision, plus guard bits"""
+        return math.ceil(self.precision * math.log2(self.base)) + 8
+
+    @classmethod
+    def _constant_fixed(cls, name, bits):
+        """A cached constant as floor(constant * 2**bits)"""
+        constant = cls._get_constant(name, math.ceil(bits * math.log10(2)) + 2)
+        return (constant._mantissa << bits) // cls._base_power(10, -constant._exponent)
+
+    @classmethod
+    def _agm_fixed(cls, a, b, bits):
+        """Arithmetic-geometric mean of two positive fixed-point values"""
+        while abs(a - b) > 2:
+            a, b = (a + b) >> 1, cls._int_iroot(cls._int_multiply(a, b), 2)
+        return a
+
+    def _log_fixed(self, bits):
+        """floor(ln(self) * 2**bits) for self > 0, by the AGM with the argument scaled up by 2**m"""
+        # ln(s) = pi / (2 * AGM(1, 4/s)) with error O(ln(s) / s**2), so s must exceed 2**(wp/2)
+        wp = bits + 2 * bits.bit_length() + 16
+        m = wp // 2 + 8 - math.floor(self._log2_upper_bound())
+        # 4/s is about 2**(-wp/2), so the AGM runs with wp/2 more fractional bits
+        p = wp + wp // 2 + 16
+        s = self._to_fixed(p + m)
+        agm = self._agm_fixed(1 << p, (4 << (2 * p)) // s, p)
+        pi = self._constant_fixed('pi', p)
+        ln2 = self._constant_fixed('ln2', p + abs(m).bit_length())
+        value = (pi << p) // (2 * agm) - ((m * ln2) >> abs(m).bit_length())
+        return value >> (p - bits)
+
+    def _exp_fixed(self, bits):
+        """floor(exp(self) * 2**bits): reduce by k*ln2 and 2**j, sum the Taylor series, square back"""
+        if self._log2_upper_bound() > 40:
+            if not self.negative:
+                raise OverflowError("Exponential result too large to represent")
+            return 0
+        # exp(v) = 2**k * exp(r) with |r| <= ln2 / 2
+        ln2 = self._constant_fixed('ln2', 96)
+        k = (self._to_fixed(96) + (ln2 >> 1)) // ln2
+        if k < -bits - 1:
+            return 0
+        # The result has about bits + k significant bits; squaring j times costs j more
+        j = math.isqrt(max(bits + k, 1)) // 2 + 1
+        wp = max(bits + k, 0) + j + 2 * bits.bit_length() + 16
+        wide = wp + abs(k).bit_length() + 2
+        r = (self._to_fixed(wide) - k * self._constant_fixed('ln2', wide)) >> (wide - wp + j)
+
+        one = 1 << wp
+        total = one + r
+        term = r
+        n = 1
+        while term:
+            n += 1
+            product = term * r
+            term = (abs(product) >> wp) // n
+            if product < 0:
+                term = -term
+            total += term
+        for _ in range(j):
+            total = self._int_square(total) >> wp
+
+        shift = k + bits - wp
+        return total << shift if shift >= 0 else total >> -shift
+
     def log(self, base=None):
-        """Calculate natural logarithm or logarithm with specified base"""
+        """Natural logarithm, or logarithm to the given base, at this number's precision"""
         if self.negative or self._is_zero():
             raise ValueError("Logarithm undefined for non-positive numbers")
 
-        if base is not None:
-            base_num = self._ensure_apn(base)
-            if base_num._is_zero() or base_num.negative:
-                raise ValueError("Logarithm base must be positive")
-            
-            if base_num == AdvancedPrecisionNumber('1', self.base):
-                raise ValueError("Logarithm base cannot be 1")
+        bits = self._fixed_bits()
+        if base is None:
+            return self._from_fixed(self._log_fixed(bits), bits)
 
-        # For now, use built-in math.log and convert back
-        import math
-        decimal_val = self._base_to_decimal()
-        
-        if base is not None:
-            base_val = base_num._base_to_decimal()
-            log_result = math.log(decimal_val, base_val)
-        else:
-            log_result = math.log(decimal_val)
-        
-        return AdvancedPrecisionNumber(str(log_result), self.base, self.precision)
+        base_num = self._ensure_apn(base)
+        if base_num._is_zero() or base_num.negative:
+            raise ValueError("Logarithm base must be positive")
+
+        if base_num == AdvancedPrecisionNumber.from_int(1, self.base):
+            raise ValueError("Logarithm base cannot be 1")
+
+        # A base close to 1 has a small logarithm, so buy back the bits the quotient would lose
+        wp = bits + 32
+        ln_base = base_num._log_fixed(wp)
+        wp += max(0, wp - abs(ln_base).bit_length()) + int(abs(self._log2_upper_bound())).bit_length()
+        ln_base = base_num._log_fixed(wp)
+        ln_self = self._log_fixed(wp)
+        # Rounded rather than truncated, so exact answers such as log(8, 0.5) = -3 come out whole
+        quotient = (((abs(ln_self) << (bits + 1)) // abs(ln_base)) + 1) >> 1
+        return self._from_fixed(-quotient if (ln_self < 0) != (ln_base < 0) else quotient, bits)
 
     def exp(self):
-        """Calculate exponential function"""
-        import math
-        decimal_val = self._base_to_decimal()
-        exp_result = math.exp(decimal_val)
-        return AdvancedPrecisionNumber(str(exp_result), self.base, self.precision)
+        """Exponential function at this number's precision"""
+        bits = self._fixed_bits()
+        return self._from_fixed(self._exp_fixed(bits), bits)
 
     def inverse(self):
         """Calculate multiplicative inverse (1/x)"""
         if self._is_zero():
             raise ZeroDivisionError("Cannot calculate inverse of zero")
         
-        one = AdvancedPrecisionNumber('1', self.base, self.precision)
+        one = AdvancedPrecisionNumber.from_int(1, self.base, self.precision)
         return one / self
 
     # Pure Trigonometric Functions - No library dependencies
+    def _sin_cos_fixed(self, bits):
+        """(sin, cos) of self as fixed-point ints with `bits` fractional bits, from one series"""
+        # Divide the reduced angle by 3**j, then triple back with sin(3t) = 3 sin t - 4 sin**3 t;
+        # each tripling costs about 1.6 bits
+        j = math.isqrt(bits) // 2 + 1
+        wp = bits + 2 * j + 2 * bits.bit_length() + 16
+
+        # Single-division reduction: self = k * pi/2 + r with |r| <= pi/4
+        magnitude = max(0, math.ceil(self._log2_upper_bound()))
+        wide = wp + 2 * magnitude + 16
+        x = self._to_fixed(wide)
+        half_pi = self._constant_fixed('pi', wide) >> 1
+        k = (2 * x + half_pi) // (2 * half_pi)
+        r = x - k * half_pi
+
+        t = (r >> (wide - wp)) // 3 ** j if r >= 0 else -((-r >> (wide - wp)) // 3 ** j)
+
+        # Term-ratio recurrence: term_{n+2} = -term_n * t**2 / ((n + 1)(n + 2))
+        t_squared = self._int_square(abs(t)) >> wp
+        total = term = t
+        n = 1
+        while term:
+            product = term * t_squared
+            term = (abs(product) >> wp) // ((n + 1) * (n + 2))
+            if product > 0:
+                term = -term
+            total += term
+            n += 2
+        s = total
+        for _ in range(j):
+            cube = self._int_multiply(abs(s), self._int_square(abs(s))) >> (2 * wp)
+            s = 3 * s - 4 * (cube if s >= 0 else -cube)
+
+        # |r| <= pi/4 keeps the cosine above 0.7, so recovering it from the sine is well conditioned
+        c = self._int_iroot(max(0, (1 << (2 * wp)) - self._int_square(abs(s))), 2)
+        s, c = [(s, c), (c, -s), (-s, -c), (-c, s)][k % 4]
+        return s >> (wp - bits), c >> (wp - bits)
+
+    def _sin_cos(self):
+        """sin(self) and cos(self) together, at this number's precision"""
+        bits = self._fixed_bits()
+        s, c = self._sin_cos_fixed(bits)
+        return self._from_fixed(s, bits), self._from_fixed(c, bits)
+
     def sin(self):
-        """Calculate sine using Taylor series"""
-        # Use angle reduction to bring to [-π/2, π/2]
-        pi = self._get_pi(self.precision)
-        two_pi = pi * AdvancedPrecisionNumber('2', self.base, self.precision)
-        
-        # Reduce angle to [0, 2π]
-        x = self
-        while x._base_to_decimal() > two_pi._base_to_decimal():
-            x = x - two_pi
-        while x._base_to_decimal() < 0:
-            x = x + two_pi
-        
-        # Further reduce to [-π/2, π/2] for better convergence
-        pi_half = pi / AdvancedPrecisionNumber('2', self.base, self.precision)
-        if x._base_to_decimal() > pi_half._base_to_decimal():
-            if x._base_to_decimal() <= (pi_half * AdvancedPrecisionNumber('3', self.base, self.precision))._base_to_decimal():
-                # sin(π - x) = sin(x)
-                x = pi - x
-            else:
-                # sin(2π - x) = -sin(x)
-                x = two_pi - x
-                return -self._sin_taylor(x)
-        
-        return self._sin_taylor(x)
-    
-    def _sin_taylor(self, x):
-        """Calculate sin(x) using Taylor series: sin(x) = x - x³/3! + x⁵/5! - x⁷/7! + ..."""
-        result = AdvancedPrecisionNumber('0', self.base, self.precision)
-        x_power = x
-        x_squared = x * x
-        factorial = AdvancedPrecisionNumber('1', self.base, self.precision)
-        sign = 1
-        
-        for n in range(1, self.precision * 4, 2):  # Odd terms only
-            factorial = factorial * AdvancedPrecisionNumber(str(n), self.base, self.precision)
-            if n > 1:
-                factorial = factorial * AdvancedPrecisionNumber(str(n-1), self.base, self.precision)
-            
-            term = x_power / factorial
-            if sign > 0:
-                result = result + term
-            else:
-                result = result - term
-            
-            x_power = x_power * x_squared
-            sign *= -1
-            
-            # Early termination
-            if abs(term._base_to_decimal()) < 10**(-self.precision):
-                break
-        
-        return result
+        """Calculate sine"""
+        return self._sin_cos()[0]
 
     def cos(self):
-        """Calculate cosine using Taylor series"""
-        # cos(x) = sin(π/2 - x)
-        pi_half = self._get_pi(self.precision) / AdvancedPrecisionNumber('2', self.base, self.precision)
-        return (pi_half - self).sin()
+        """Calculate cosine"""
+        return self._sin_cos()[1]
     
     def tan(self):
-        """Calculate tangent as sin(x)/cos(x)"""
-        sin_val = self.sin()
-        cos_val = self.cos()
-        
-        if cos_val._is_zero():
+        """Calculate tangent as sin(x)/cos(x) from one joint evaluation"""
+        bits = self._fixed_bits()
+        wp = bits + 32
+        s, c = self._sin_cos_fixed(wp)
+        if c == 0:
             raise ValueError("Tangent undefined (cosine is zero)")
-        
-        return sin_val / cos_val
+        # A small cosine loses bits in the quotient; buy them back
+        lost = wp - abs(c).bit_length()
+        if lost > 0:
+            s, c = self._sin_cos_fixed(wp + lost)
+        quotient = (abs(s) << bits) // abs(c)
+        return self._from_fixed(-quotient if (s < 0) != (c < 0) else quotient, bits)
+
+    @classmethod
+    def _arctan_ratio_fixed(cls, num, den, bits):
+        """floor(atan(num / den) * 2**bits) for ints with den > 0"""
+        negative = num < 0
+        num = abs(num)
+        # atan(x) = pi/2 - atan(1/x) keeps the series argument at most 1, swapping exactly
+        complement = num > den
+        if complement:
+            num, den = den, num
+
+        # Each halving x -> x / (1 + sqrt(1 + x**2)) doubles the angle to restore and costs a bit
+        h = math.isqrt(bits) // 2 + 1
+        wp = bits + h + 2 * bits.bit_length() + 16
+        one = 1 << wp
+        t = (num << wp) // den
+        for _ in range(h):
+            t = (t << wp) // (one + cls._int_iroot((one << wp) + cls._int_square(t), 2))
+
+        # Euler's series: atan(x) = sum 2**2n (n!)**2 / (2n+1)! * x**(2n+1) / (1+x**2)**(n+1),
+        # all terms positive, each the previous times 2n / (2n+1) * x**2 / (1+x**2)
+        t_squared = cls._int_square(t) >> wp
+        ratio = (t_squared << wp) // (one + t_squared)
+        term = total = (t << wp) // (one + t_squared)
+        n = 1
+        while term:
+            term = (cls._int_multiply(term, ratio) >> wp) * (2 * n) // (2 * n + 1)
+            total += term
+            n += 1
+        total <<= h
+
+        if complement:
+            total = (cls._constant_fixed('pi', wp) >> 1) - total
+        total >>= wp - bits
+        return -total if negative else total
+
+    @classmethod
+    def _atan2_fixed(cls, y, x, bits):
+        """floor(atan2(y, x) * 2**bits) for ints y and x on a common scale, not both zero"""
+        if x > 0:
+            return cls._arctan_ratio_fixed(y, x, bits)
+        if x == 0:
+            half_pi = cls._constant_fixed('pi', bits) >> 1
+            return -half_pi if y < 0 else half_pi
+        pi = cls._constant_fixed('pi', bits)
+        angle = cls._arctan_ratio_fixed(abs(y), -x, bits)
+        return angle - pi if y < 0 else pi - angle
+
+    @classmethod
+    def _atan2(cls, y, x):
+        """atan2(y, x) at the higher of the two precisions, in x's base"""
+        if y._is_zero() and x._is_zero():
+            raise ValueError("atan2 undefined for (0, 0)")
+        # Only the base and precision of the template matter: it scales the fixed-point result
+        template = cls._from_parts(0, 0, False, x.base, max(x.precision, y.precision))
+        yn, yd = y._as_ratio()
+        xn, xd = x._as_ratio()
+        bits = template._fixed_bits()
+        return template._from_fixed(cls._atan2_fixed(yn * xd, xn * yd, bits), bits)
+
+    def _arcsin_arccos_operands(self, bits):
+        """x*2**wp and sqrt(1 - x**2)*2**wp for |x| <= 1, the atan2 arguments of arcsin and arccos"""
+        n, d = self._as_ratio()
+        if abs(n) > d:
+            raise ValueError("Argument must be between -1 and 1")
+        wp = bits + 16
+        # sqrt(d**2 - n**2) / d taken exactly from the ratio, so nothing cancels near |x| = 1
+        root = self._int_iroot((d * d - n * n) << (2 * wp), 2)
+        return (n << wp), root
 
     def arcsin(self):
-        """Calculate arcsine using Newton's method"""
-        decimal_val = self._base_to_decimal()
-        if abs(decimal_val) > 1:
+        """Arcsine as atan2(x, sqrt(1 - x**2))"""
+        if self._abs_compare(AdvancedPrecisionNumber.from_int(1, self.base)) > 0:
             raise ValueError("Arcsine argument must be between -1 and 1")
-        
-        if abs(decimal_val) == 1:
-            pi_half = self._get_pi(self.precision) / AdvancedPrecisionNumber('2', self.base, self.precision)
-            return pi_half if decimal_val > 0 else -pi_half
-        
-        # Use series expansion for small values, Newton's method for others
-        if abs(decimal_val) < 0.5:
-            return self._arcsin_series()
-        else:
-            return self._arcsin_newton()
-    
-    def _arcsin_series(self):
-        """Calculate arcsin(x) using series: arcsin(x) = x + x³/6 + 3x⁵/40 + ..."""
-        result = AdvancedPrecisionNumber('0', self.base, self.precision)
-        x = self
-        x_squared = x * x
-        x_power = x
-        
-        # First term
-        result = x
-        
-        # Subsequent terms using the recurrence relation
-        for n in range(1, self.precision):
-            coeff_num = AdvancedPrecisionNumber(str(2*n - 1), self.base, self.precision)
-            coeff_den = AdvancedPrecisionNumber(str(2*n), self.base, self.precision)
-            power_den = AdvancedPrecisionNumber(str(2*n + 1), self.base, self.precision)
-            
-            x_power = x_power * x_squared
-            term = (coeff_num / coeff_den) * (x_power / power_den)
-            result = result + term
-            
-            # Early termination
-            if abs(term._base_to_decimal()) < 10**(-self.precision):
-                break
-        
-        return result
-    
-    def _arcsin_newton(self):
-        """Calculate arcsin(x) using Newton's method"""
-        # Initial guess
-        x = AdvancedPrecisionNumber(str(self._base_to_decimal()), self.base, self.precision)
-        
-        for _ in range(50):
-            sin_x = x.sin()
-            cos_x = x.cos()
-            
-            if cos_x._is_zero():
-                break
-                
-            # Newton iteration: x_new = x - (sin(x) - target) / cos(x)
-            x_new = x - (sin_x - self) / cos_x
-            
-            if abs(x_new._base_to_decimal() - x._base_to_decimal()) < 1e-15:
-                break
-                
-            x = x_new
-        
-        return x
+        bits = self._fixed_bits()
+        sine, cosine = self._arcsin_arccos_operands(bits)
+        return self._from_fixed(self._atan2_fixed(sine, cosine, bits), bits)
 
     def arccos(self):
-        """Calculate arccosine using identity: arccos(x) = π/2 - arcsin(x)"""
-        decimal_val = self._base_to_decimal()
-        if abs(decimal_val) > 1:
+        """Arccosine as atan2(sqrt(1 - x**2), x)"""
+        if self._abs_compare(AdvancedPrecisionNumber.from_int(1, self.base)) > 0:
             raise ValueError("Arccosine argument must be between -1 and 1")
-        
-        pi_half = self._get_pi(self.precision) / AdvancedPrecisionNumber('2', self.base, self.precision)
-        return pi_half - self.arcsin()
+        bits = self._fixed_bits()
+        cosine, sine = self._arcsin_arccos_operands(bits)
+        return self._from_fixed(self._atan2_fixed(sine, cosine, bits), bits)
 
     def arctan(self):
-        """Calculate arctangent using pure Taylor series or arctan_taylor method"""
-        return self._arctan_taylor(self, self.precision)
+        """Arctangent by argument halving and Euler's series"""
+        bits = self._fixed_bits()
+        numerator, denominator = self._as_ratio()
+        return self._from_fixed(self._arctan_ratio_fixed(numerator, denominator, bits), bits)
 
     def to_fraction(self, limit_denominator=None):
         """Convert the number to a Fraction with optional denominator limit"""
@@ -1440,31 +2692,94 @@ class AdvancedPrecisionNumber:
             if limit_denominator <= 0:
                 raise ValueError("limit_denominator must be a positive integer")
     
-        try:
-            decimal_value = self._base_to_decimal()
-        
-            if abs(decimal_value) > sys.float_info.max:
-                raise OverflowError("Number too large to convert to fraction")
-        
-            if abs(decimal_value) < sys.float_info.min:
-                return fractions.Fraction(0)
-        
-            if limit_denominator is not None:
-                frac = fractions.Fraction(decimal_value).limit_denominator(limit_denominator)
-            else:
-                frac = fractions.Fraction(decimal_value)
-        
-            return -frac if self.negative else frac
-    
-        except OverflowError:
-            raise
-        except Exception as e:
-            raise ValueError(f"Could not convert to fraction: {e}")
+        # Straight from the exact ratio, never through a float
+        if limit_denominator is None:
+            return self.fraction if self._is_rational() else fractions.Fraction(*self._as_ratio())
+        return fractions.Fraction(*self._int_best_rational(*self._as_ratio(), limit_denominator))
+
+    def continued_fraction(self, n_terms=None):
+        """Partial quotients [a0; a1, a2, ...] of the exact value, all of them or the first n_terms"""
+        if n_terms is not None and (not isinstance(n_terms, int) or n_terms < 1):
+            raise ValueError("n_terms must be a positive integer")
+        return [AdvancedPrecisionNumber.from_int(term, self.base, self.precision)
+                for term in itertools.islice(self._int_continued_fraction(*self._as_ratio()), n_terms)]
+
+    def convergents(self, max_denominator=None):
+        """Yield the convergents of the exact value as Fractions, stopping before the
+        denominator exceeds max_denominator; the last one is the value itself"""
+        for p, q in self._int_convergents(*self._as_ratio()):
+            if max_denominator is not None and q > max_denominator:
+                return
+            yield fractions.Fraction(p, q)
+
+    @staticmethod
+    def _continued_fraction_str(terms):
+        """Partial quotients in the usual [a0; a1, a2, ...] notation"""
+        if len(terms) == 1:
+            return f"[{terms[0]}]"
+        return f"[{terms[0]}; {', '.join(str(term) for term in terms[1:])}]"
+
+    @staticmethod
+    def _int_continued_fraction(numerator, denominator):
+        """Partial quotients of numerator/denominator (denominator > 0), one Euclid step per term"""
+        while denominator:
+            quotient, remainder = divmod(numerator, denominator)
+            yield quotient
+            numerator, denominator = denominator, remainder
+
+    @classmethod
+    def _int_convergents(cls, numerator, denominator):
+        """Convergents (p, q) of numerator/denominator by the three-term recurrence, in lowest terms"""
+        p0, q0, p1, q1 = 0, 1, 1, 0
+        for term in cls._int_continued_fraction(numerator, denominator):
+            p0, q0, p1, q1 = p1, q1, term * p1 + p0, term * q1 + q0
+            yield p1, q1
+
+    @classmethod
+    def _int_best_rational(cls, numerator, denominator, limit):
+        """(p, q): the fraction closest to numerator/denominator with 0 < q <= limit.
+
+        The continued fraction stops at the first convergent past the limit; the answer is
+        then the last convergent or the semiconvergent with the largest allowed denominator,
+        with ties going to the convergent as in Fraction.limit_denominator.
+        """
+        p0, q0, p1, q1 = 0, 1, 1, 0
+        for term in cls._int_continued_fraction(numerator, denominator):
+            if term * q1 + q0 > limit:
+                break
+            p0, q0, p1, q1 = p1, q1, term * p1 + p0, term * q1 + q0
+        else:
+            return p1, q1
+        k = (limit - q0) // q1
+        p2, q2 = p0 + k * p1, q0 + k * q1
+        # Compare |p/q - n/d| cross-multiplied over the common denominator d*q1*q2
+        if abs(p1 * denominator - numerator * q1) * q2 <= abs(p2 * denominator - numerator * q2) * q1:
+            return p1, q1
+        return p2, q2
+
+
+# Process-pool workers live at module level so they can be pickled. Ints cross the process
+# boundary as little-endian bytes, a compact limb encoding that avoids str() conversion.
+def _encode_limbs(value):
+    return value.to_bytes((value.bit_length() + 7) // 8, 'little')
+
+
+def _decode_limbs(data):
+    return int.from_bytes(data, 'little')
+
+
+def _range_product_worker(bounds):
+    lo, hi = bounds
+    return _encode_limbs(AdvancedPrecisionNumber._range_product(lo, hi, workers=1))
+
+
+def _prime_power_product_worker(pairs):
+    return _encode_limbs(AdvancedPrecisionNumber._product_tree([p ** e for p, e in pairs]))
 
 
 class ComplexNumber:
     """Arbitrary precision complex number implementation using AdvancedPrecisionNumber for real and imaginary parts"""
-    
+
     def __init__(self, real='0', imag='0', base=10, precision_mode='standard'):
         """Initialize complex number with real and imaginary parts
         
@@ -1547,8 +2862,9 @@ class ComplexNumber:
         if not isinstance(phase, AdvancedPrecisionNumber):
             phase = AdvancedPrecisionNumber(phase, base, precision_mode)
         
-        real_part = magnitude * phase.cos()
-        imag_part = magnitude * phase.sin()
+        sin_phase, cos_phase = phase._sin_cos()
+        real_part = magnitude * cos_phase
+        imag_part = magnitude * sin_phase
         
         return cls(real_part, imag_part, base, precision_mode)
     
@@ -1689,19 +3005,11 @@ class ComplexNumber:
         return self.abs()
     
     def arg(self):
-        """Return argument (phase angle): arg(a+bi) = arctan(b/a)"""
-        if self.real._is_zero():
-            if self.imag._base_to_decimal() > 0:
-                # π/2
-                return AdvancedPrecisionNumber._get_pi(self.real.precision) / AdvancedPrecisionNumber('2')
-            elif self.imag._base_to_decimal() < 0:
-                # -π/2
-                return -(AdvancedPrecisionNumber._get_pi(self.real.precision) / AdvancedPrecisionNumber('2'))
-            else:
-                # 0+0i, argument undefined
-                raise ValueError("Argument of zero complex number is undefined")
-        else:
-            return (self.imag / self.real).arctan()
+        """Return argument (phase angle): arg(a+bi) = atan2(b, a), in (-π, π]"""
+        if self.real._is_zero() and self.imag._is_zero():
+            # 0+0i, argument undefined
+            raise ValueError("Argument of zero complex number is undefined")
+        return AdvancedPrecisionNumber._atan2(self.imag, self.real)
     
     def phase(self):
         """Alias for arg()"""
@@ -1710,8 +3018,7 @@ class ComplexNumber:
     def exp(self):
         """Complex exponential: e^(a+bi) = e^a * (cos(b) + i*sin(b))"""
         exp_real = self.real.exp()
-        cos_imag = self.imag.cos()
-        sin_imag = self.imag.sin()
+        sin_imag, cos_imag = self.imag._sin_cos()
         
         return ComplexNumber(exp_real * cos_imag, exp_real * sin_imag)
     
@@ -1737,29 +3044,28 @@ class ComplexNumber:
         phase = self.arg()
         
         new_magnitude = magnitude.sqrt()
-        new_phase = phase / AdvancedPrecisionNumber('2')
+        new_phase = phase / AdvancedPrecisionNumber.from_int(2)
         
         return ComplexNumber.from_polar(new_magnitude, new_phase)
     
+    def _cosh_sinh_imag(self):
+        """cosh(b) and sinh(b) of the imaginary part from a single exp"""
+        exp_b = self.imag.exp()
+        exp_neg_b = exp_b.inverse()
+        two = AdvancedPrecisionNumber.from_int(2, self.imag.base, self.imag.precision)
+        return (exp_b + exp_neg_b) / two, (exp_b - exp_neg_b) / two
+
     def sin(self):
         """Complex sine: sin(a+bi) = sin(a)cosh(b) + i*cos(a)sinh(b)"""
-        # Using identity: sin(z) = (e^(iz) - e^(-iz)) / (2i)
-        i = ComplexNumber('0', '1')
-        iz = i * self
-        exp_iz = iz.exp()
-        exp_neg_iz = (-iz).exp()
-        
-        return (exp_iz - exp_neg_iz) / (ComplexNumber('0', '2'))
+        sin_a, cos_a = self.real._sin_cos()
+        cosh_b, sinh_b = self._cosh_sinh_imag()
+        return ComplexNumber(sin_a * cosh_b, cos_a * sinh_b)
     
     def cos(self):
         """Complex cosine: cos(a+bi) = cos(a)cosh(b) - i*sin(a)sinh(b)"""
-        # Using identity: cos(z) = (e^(iz) + e^(-iz)) / 2
-        i = ComplexNumber('0', '1')
-        iz = i * self
-        exp_iz = iz.exp()
-        exp_neg_iz = (-iz).exp()
-        
-        return (exp_iz + exp_neg_iz) / ComplexNumber('2', '0')
+        sin_a, cos_a = self.real._sin_cos()
+        cosh_b, sinh_b = self._cosh_sinh_imag()
+        return ComplexNumber(cos_a * cosh_b, -(sin_a * sinh_b))
     
     def tan(self):
         """Complex tangent: tan(z) = sin(z) / cos(z)"""
@@ -1781,6 +3087,9 @@ class ComplexNumber:
             
 def calculate_repl():
     """Enhanced REPL calculator with better error handling and features"""
+    # Imported here: the engine itself imports this module
+    from expression_engine import evaluate, format_result
+
     calculation_history = []
 
     def print_menu():
@@ -1801,12 +3110,18 @@ def calculate_repl():
         print(f"{'Square':^25}{'sqr(4)':^35}")
         print(f"{'Cube':^25}{'cube(4)':^35}")
         print(f"{'Cube Root':^25}{'cube_root(4)':^35}")
+        print(f"{'Integer Roots':^25}{'isqrt(17), iroot(30, 3)':^35}")
+        print(f"{'Perfect Power':^25}{'is_perfect_power(243)':^35}")
+        print(f"{'Modular Power':^25}{'pow(4, 13, 497)':^35}")
+        print(f"{'GCD / LCM':^25}{'gcd(12, 18), lcm(4, 6)':^35}")
+        print(f"{'Extended GCD':^25}{'xgcd(240, 46), modinv(3, 7)':^35}")
         print(f"{'Reciprocal':^25}{'inverse(4)':^35}")
         print(f"{'Logarithm':^25}{'log(4) or log(4, 2)':^35}")
         print(f"{'Base Conversion':^25}{'0b1010 or 0x10':^35}")
         print(f"{'Trigonometric':^25}{'sin(1), cos(1), tan(1)':^35}")
         print(f"{'Inverse Trig':^25}{'arcsin(0.5), arccos(0.5)':^35}")
-        print(f"{'Fractions':^25}{'to_fraction()':^35}")
+        print(f"{'Fractions':^25}{'to_fraction(3.14159, 100)':^35}")
+        print(f"{'Continued Fraction':^25}{'continued_fraction(3.245, 5)':^35}")
         print("-" * 60)
         print(f"{'COMPLEX NUMBERS':^60}")
         print("-" * 60)
@@ -1834,148 +3149,9 @@ def calculate_repl():
             print(f"{'Zero Matrix':^25}{'zeros(2, 3)':^35}")
             print("-" * 60)
         print("Commands: 'menu' (help), 'history' (show history), 'clear' (clear history), 'quit' (exit)")
-        print("Performance: Optimized for very large numbers with Karatsuba, Toom-Cook, and FFT algorithms")
+        print("Performance: Optimized for very large numbers with Karatsuba, Toom-3 and NTT multiplication")
         print("=" * 60)
 
-    def safe_eval(expr):
-        """Safely evaluate mathematical expressions"""
-        # Replace function calls with method calls
-        expr = expr.replace('factorial(', 'TEMP.factorial() if TEMP == ')
-        expr = expr.replace('sqrt(', 'TEMP.sqrt() if TEMP == ')
-        expr = expr.replace('sqr(', 'TEMP.sqr() if TEMP == ')
-        expr = expr.replace('cube(', 'TEMP.cube() if TEMP == ')
-        expr = expr.replace('cube_root(', 'TEMP.cube_root() if TEMP == ')
-        expr = expr.replace('inverse(', 'TEMP.inverse() if TEMP == ')
-        expr = expr.replace('sin(', 'TEMP.sin() if TEMP == ')
-        expr = expr.replace('cos(', 'TEMP.cos() if TEMP == ')
-        expr = expr.replace('tan(', 'TEMP.tan() if TEMP == ')
-        expr = expr.replace('arcsin(', 'TEMP.arcsin() if TEMP == ')
-        expr = expr.replace('arccos(', 'TEMP.arccos() if TEMP == ')
-        expr = expr.replace('arctan(', 'TEMP.arctan() if TEMP == ')
-        expr = expr.replace('log(', 'TEMP.log() if TEMP == ')
-        
-        # Handle simple expressions
-        try:
-            # Split by operators and convert to AdvancedPrecisionNumber
-            tokens = []
-            current_token = ""
-            operators = ['+', '-', '*', '/', '%', '(', ')', '**', '//', '!']
-            
-            i = 0
-            while i < len(expr):
-                char = expr[i]
-                
-                # Handle multi-character operators
-                if i < len(expr) - 1:
-                    two_char = expr[i:i+2]
-                    if two_char in ['**', '//']:
-                        if current_token:
-                            tokens.append(current_token.strip())
-                            current_token = ""
-                        tokens.append(two_char)
-                        i += 2
-                        continue
-                
-                if char in operators:
-                    if current_token:
-                        tokens.append(current_token.strip())
-                        current_token = ""
-                    tokens.append(char)
-                else:
-                    current_token += char
-                
-                i += 1
-            
-            if current_token:
-                tokens.append(current_token.strip())
-            
-            # Convert numeric tokens to AdvancedPrecisionNumber or ComplexNumber
-            for i, token in enumerate(tokens):
-                if token not in operators and token.strip():
-                    try:
-                        # Check if it's a complex number
-                        if 'i' in token or 'j' in token:
-                            tokens[i] = ComplexNumber.from_string(token)
-                        else:
-                            tokens[i] = AdvancedPrecisionNumber(token)
-                    except:
-                        pass  # Keep as string if conversion fails
-            
-            return tokens
-            
-        except Exception as e:
-            raise ValueError(f"Invalid expression: {e}")
-
-    def evaluate_expression(tokens):
-        """Evaluate tokenized expression"""
-        if len(tokens) == 1:
-            return tokens[0]
-        
-        # Handle factorial first
-        i = 0
-        while i < len(tokens):
-            if tokens[i] == '!':
-                if i > 0:
-                    result = tokens[i-1].factorial()
-                    tokens = tokens[:i-1] + [result] + tokens[i+1:]
-                    i -= 1
-                else:
-                    raise ValueError("Invalid factorial usage")
-            i += 1
-        
-        # Handle exponentiation
-        i = 0
-        while i < len(tokens):
-            if tokens[i] == '**':
-                if i > 0 and i < len(tokens) - 1:
-                    result = tokens[i-1] ** tokens[i+1]
-                    tokens = tokens[:i-1] + [result] + tokens[i+2:]
-                    i -= 1
-                else:
-                    raise ValueError("Invalid exponentiation")
-            i += 1
-        
-        # Handle multiplication, division, modulo
-        i = 0
-        while i < len(tokens):
-            if tokens[i] in ['*', '/', '//', '%']:
-                if i > 0 and i < len(tokens) - 1:
-                    if tokens[i] == '*':
-                        result = tokens[i-1] * tokens[i+1]
-                    elif tokens[i] == '/':
-                        result = tokens[i-1] / tokens[i+1]
-                    elif tokens[i] == '//':
-                        result = tokens[i-1] // tokens[i+1]
-                    elif tokens[i] == '%':
-                        result = tokens[i-1] % tokens[i+1]
-                    
-                    tokens = tokens[:i-1] + [result] + tokens[i+2:]
-                    i -= 1
-                else:
-                    raise ValueError(f"Invalid {tokens[i]} operation")
-            i += 1
-        
-        # Handle addition and subtraction
-        i = 0
-        while i < len(tokens):
-            if tokens[i] in ['+', '-']:
-                if i > 0 and i < len(tokens) - 1:
-                    if tokens[i] == '+':
-                        result = tokens[i-1] + tokens[i+1]
-                    elif tokens[i] == '-':
-                        result = tokens[i-1] - tokens[i+1]
-                    
-                    tokens = tokens[:i-1] + [result] + tokens[i+2:]
-                    i -= 1
-                else:
-                    raise ValueError(f"Invalid {tokens[i]} operation")
-            i += 1
-        
-        if len(tokens) == 1:
-            return tokens[0]
-        else:
-            raise ValueError("Could not evaluate expression")
-
     print_menu()
 
     while True:
@@ -2082,91 +3258,14 @@ def calculate_repl():
                         print(f"Error in matrix operation: {e}")
                         continue
 
-            # Handle function calls (case-insensitive)
-            raw_expr_lower = raw_expr.lower()
-            if any(func in raw_expr_lower for func in ['factorial(', 'sqrt(', 'sqr(', 'cube(', 'cube_root(', 'inverse(',
-                                                       'sin(', 'cos(', 'tan(', 'arcsin(', 'arccos(', 'arctan(', 
-                                                       'log(', 'exp(', 'abs(', 'conjugate(', 'arg(']):
-                # Extract function and argument
-                for func_name in ['factorial', 'sqrt', 'sqr', 'cube', 'cube_root', 'inverse', 
-                                  'sin', 'cos', 'tan', 'arcsin', 'arccos', 'arctan', 'log', 'exp',
-                                  'abs', 'conjugate', 'arg']:
-                    if f'{func_name}(' in raw_expr_lower:
-                        # Find the actual function name in original expression (preserve case)
-                        start_pos = raw_expr_lower.find(f'{func_name}(')
-                        actual_func_start = start_pos
-                        actual_func_end = start_pos + len(func_name)
-                        
-                        start = raw_expr_lower.find(f'{func_name}(') + len(func_name) + 1
-                        end = raw_expr_lower.find(')', start)
-                        if end != -1:
-                            arg = raw_expr[start:end].strip()
-                            
-                            # Handle log with base
-                            if func_name == 'log' and ',' in arg:
-                                args = [a.strip() for a in arg.split(',')]
-                                if 'i' in args[0] or 'j' in args[0]:
-                                    num = ComplexNumber.from_string(args[0])
-                                else:
-                                    num = AdvancedPrecisionNumber(args[0])
-                                base = AdvancedPrecisionNumber(args[1])
-                                result = num.log(base)
-                            else:
-                                # Determine if argument is complex
-                                if 'i' in arg or 'j' in arg:
-                                    num = ComplexNumber.from_string(arg)
-                                    if func_name in ['abs', 'conjugate', 'arg']:
-                                        # Complex-specific functions
-                                        if func_name == 'abs':
-                                            result = num.abs()
-                                        elif func_name == 'conjugate':
-                                            result = num.conjugate()
-                                        elif func_name == 'arg':
-                                            result = num.arg()
-                                    else:
-                                        # Standard functions that work on complex numbers
-                                        result = getattr(num, func_name)()
-                                else:
-                                    num = AdvancedPrecisionNumber(arg)
-                                    if func_name in ['abs', 'conjugate', 'arg']:
-                                        # These functions on real numbers
-                                        if func_name == 'abs':
-                                            result = abs(num)
-                                        elif func_name == 'conjugate':
-                                            result = num  # Conjugate of real number is itself
-                                        elif func_name == 'arg':
-                                            # Argument of real number is 0 (or π if negative)
-                                            if num.negative:
-                                                result = AdvancedPrecisionNumber._get_pi(num.precision)
-                                            else:
-                                                result = AdvancedPrecisionNumber('0')
-                                    else:
-                                        result = getattr(num, func_name)()
-                            
-                            print(result)
-                            calculation_history.append(f"{raw_expr} = {result}")
-                            break
-                continue
-
-            # Handle simple expressions
+            # Everything else goes through the shared expression parser
             try:
-                tokens = safe_eval(raw_expr)
-                result = evaluate_expression(tokens)
+                result = format_result(evaluate(raw_expr))
                 print(result)
                 calculation_history.append(f"{raw_expr} = {result}")
-            except Exception as e:
-                # Try to parse as single number (real or complex)
-                try:
-                    # Check if it's a complex number first
-                    if 'i' in raw_expr or 'j' in raw_expr:
-                        result = ComplexNumber.from_string(raw_expr)
-                    else:
-                        result = AdvancedPrecisionNumber(raw_expr)
-                    print(result)
-                    calculation_history.append(f"{raw_expr}")
-                except:
-                    print(f"Error: {e}")
-                    print("Type 'menu' for help with syntax.")
+            except (ValueError, ArithmeticError, TypeError) as e:
+                print(f"Error: {e}")
+                print("Type 'menu' for help with syntax.")
         
         except KeyboardInterrupt:
             print("\nUse 'quit' to exit.")
@@ -9,7 +9,7 @@ from flask_cors import CORS
 import traceback
 import json
 import time
-from APICalc import AdvancedPrecisionNumber
+from expression_engine import cache_info, evaluate, format_result
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for React frontend
@@ -21,86 +21,9 @@ class CalculatorAPI:
     def safe_calculate(self, expression):
         """Safely evaluate mathematical expressions"""
         try:
-            # Handle function calls
-            if any(func in expression.lower() for func in ['factorial(', 'sqrt(', 'sin(', 'cos(', 'tan(', 'log(']):
-                return self.handle_function_call(expression)
-            
-            # Handle power operator (**)
-            if '**' in expression:
-                return self.handle_binary_operation(expression, '**')
-            
-            # Handle other binary operations
-            for op in ['*', '/', '+', '-']:
-                if op in expression:
-                    return self.handle_binary_operation(expression, op)
-            
-            # Handle simple numbers or base conversions
-            try:
-                num = AdvancedPrecisionNumber(expression)
-                return str(num)
-            except:
-                # Last resort: try eval for basic arithmetic
-                if all(c in '0123456789+-*/.()\t\n ' for c in expression):
-                    result = eval(expression)
-                    return str(result)
-                else:
-                    raise ValueError(f"Unsupported expression: {expression}")
-            
-        except Exception as e:
+            return format_result(evaluate(expression))
+        except (ValueError, ArithmeticError, TypeError) as e:
             raise ValueError(f"Invalid expression: {str(e)}")
-    
-    def handle_binary_operation(self, expression, operator):
-        """Handle binary operations like +, -, *, /, **"""
-        parts = expression.split(operator, 1)
-        if len(parts) != 2:
-            raise ValueError(f"Invalid {operator} operation")
-        
-        left_str = parts[0].strip()
-        right_str = parts[1].strip()
-        
-        # Convert to AdvancedPrecisionNumber
-        left = AdvancedPrecisionNumber(left_str)
-        right = AdvancedPrecisionNumber(right_str)
-        
-        # Perform operation
-        if operator == '+':
-            result = left + right
-        elif operator == '-':
-            result = left - right
-        elif operator == '*':
-            result = left * right
-        elif operator == '/':
-            result = left / right
-        elif operator == '**':
-            result = left ** right
-        else:
-            raise ValueError(f"Unsupported operator: {operator}")
-        
-        return str(result)
-    
-    def handle_function_call(self, expression):
-        """Handle function calls like factorial(5), sqrt(16), etc."""
-        for func_name in ['factorial', 'sqrt', 'sqr', 'cube', 'cube_root', 'inverse', 
-                          'sin', 'cos', 'tan', 'arcsin', 'arccos', 'arctan', 'log', 'exp']:
-            if f'{func_name}(' in expression.lower():
-                start = expression.lower().find(f'{func_name}(') + len(func_name) + 1
-                end = expression.find(')', start)
-                if end != -1:
-                    arg = expression[start:end].strip()
-                    
-                    # Handle log with base
-                    if func_name == 'log' and ',' in arg:
-                        args = [a.strip() for a in arg.split(',')]
-                        num = AdvancedPrecisionNumber(args[0])
-                        base = AdvancedPrecisionNumber(args[1])
-                        result = num.log(base)
-                    else:
-                        num = AdvancedPrecisionNumber(arg)
-                        result = getattr(num, func_name)()
-                    
-                    return str(result)
-        
-        raise ValueError("Unknown function")
 
 calculator = CalculatorAPI()
 
@@ -191,7 +114,8 @@ def health_check():
     """Health check endpoint"""
     return jsonify({
         'status': 'healthy',
-        'message': 'Advanced Precision Calculator API is running'
+        'message': 'Advanced Precision Calculator API is running',
+        'expression_cache': cache_info()
     })
 
 @app.errorhandler(404)
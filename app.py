@@ -4,10 +4,12 @@ Flask Web Server for Advanced Precision Calculator
 Provides REST API endpoints for calculator operations
 """
 
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, request, jsonify, render_template
 from flask_cors import CORS
 import APICalc
+import expression_engine
 import traceback
+import fractions
 import json
 
 app = Flask(__name__)
@@ -32,8 +34,23 @@ class CalculatorAPI:
         """Format result for JSON serialization"""
         if isinstance(result, (APICalc.AdvancedPrecisionNumber, APICalc.ComplexNumber)):
             return str(result)
+        if isinstance(result, (tuple, list)):
+            return [CalculatorAPI.format_result(item) for item in result]
+        if isinstance(result, fractions.Fraction):
+            return str(result)
         return result
 
+    @staticmethod
+    def stream_result(result, **fields):
+        """JSON body with the result string sent in chunks, for results too long to build in one piece"""
+        if not isinstance(result, APICalc.AdvancedPrecisionNumber):
+            yield json.dumps({'result': CalculatorAPI.format_result(result), **fields})
+            return
+        yield '{"result": "'
+        # Digits, signs, prefixes and the warning text need no JSON escaping
+        yield from result.to_string_chunks()
+        yield '", ' + json.dumps(fields)[1:]
+
 @app.route('/')
 def index():
     """Serve the main calculator interface"""
@@ -54,7 +71,11 @@ def calculate():
         
         # Handle different types of calculations
         result = evaluate_expression(expression, precision_mode, base)
-        
+
+        if data.get('stream'):
+            return Response(CalculatorAPI.stream_result(result, expression=expression, success=True),
+                            mimetype='application/json')
+
         return jsonify({
             'result': CalculatorAPI.format_result(result),
             'expression': expression,
@@ -117,6 +138,10 @@ def get_constants():
         return jsonify({
             'pi': str(pi),
             'e': str(e),
+            'ln2': str(APICalc.AdvancedPrecisionNumber._get_ln2(precision)),
+            'ln10': str(APICalc.AdvancedPrecisionNumber._get_ln10(precision)),
+            'euler_gamma': str(APICalc.AdvancedPrecisionNumber._get_euler_gamma(precision)),
+            'sqrt2': str(APICalc.AdvancedPrecisionNumber._get_sqrt2(precision)),
             'precision': precision,
             'success': True
         })
@@ -166,134 +191,13 @@ def convert_base():
 
 def evaluate_expression(expression, precision_mode='standard', base=10):
     """Evaluate a mathematical expression"""
-    
-    # Handle simple binary operations
-    operators = ['+', '-', '*', '/', '**', '//', '%']
-    
-    for op in ['**', '//', '!=', '==', '<=', '>=']:  # Multi-character operators first
-        if op in expression:
-            parts = expression.split(op, 1)
-            if len(parts) == 2:
-                left = CalculatorAPI.safe_number_creation(parts[0].strip(), base, precision_mode)
-                right = CalculatorAPI.safe_number_creation(parts[1].strip(), base, precision_mode)
-                
-                if op == '**':
-                    return left ** right
-                elif op == '//':
-                    return left // right
-                elif op == '!=':
-                    return left != right
-                elif op == '==':
-                    return left == right
-                elif op == '<=':
-                    return left <= right
-                elif op == '>=':
-                    return left >= right
-    
-    for op in ['+', '-', '*', '/', '%', '<', '>']:
-        if op in expression:
-            # Handle negative numbers properly
-            parts = []
-            if op in ['+', '-']:
-                # Split more carefully for + and -
-                temp_parts = expression.split(op)
-                if len(temp_parts) >= 2:
-                    if op == '-' and expression.startswith('-'):
-                        # Handle leading negative sign
-                        if len(temp_parts) > 2:
-                            parts = ['-' + temp_parts[1], op.join(temp_parts[2:])]
-                        else:
-                            # Just a negative number
-                            return CalculatorAPI.safe_number_creation(expression, base, precision_mode)
-                    else:
-                        parts = [temp_parts[0], op.join(temp_parts[1:])]
-            else:
-                parts = expression.split(op, 1)
-            
-            if len(parts) == 2:
-                left = CalculatorAPI.safe_number_creation(parts[0].strip(), base, precision_mode)
-                right = CalculatorAPI.safe_number_creation(parts[1].strip(), base, precision_mode)
-                
-                if op == '+':
-                    return left + right
-                elif op == '-':
-                    return left - right
-                elif op == '*':
-                    return left * right
-                elif op == '/':
-                    return left / right
-                elif op == '%':
-                    return left % right
-                elif op == '<':
-                    return left < right
-                elif op == '>':
-                    return left > right
-    
-    # If no operators found, try to parse as a single number
-    return CalculatorAPI.safe_number_creation(expression, base, precision_mode)
+    return expression_engine.evaluate(expression, precision_mode, base)
 
 def execute_function(function_name, args):
     """Execute a mathematical function"""
-    
     if not args:
         raise ValueError("Function requires at least one argument")
-    
-    # Get the first argument (most functions are unary)
-    x = args[0]
-    
-    # Handle functions
-    if function_name == 'sin':
-        return x.sin()
-    elif function_name == 'cos':
-        return x.cos()
-    elif function_name == 'tan':
-        return x.tan()
-    elif function_name == 'arcsin':
-        return x.arcsin()
-    elif function_name == 'arccos':
-        return x.arccos()
-    elif function_name == 'arctan':
-        return x.arctan()
-    elif function_name == 'sqrt':
-        return x.sqrt()
-    elif function_name == 'sqr':
-        return x.sqr()
-    elif function_name == 'cube':
-        return x.cube()
-    elif function_name == 'cube_root':
-        return x.cube_root()
-    elif function_name == 'factorial':
-        return x.factorial()
-    elif function_name == 'log':
-        if len(args) > 1:
-            return x.log(args[1])
-        else:
-            return x.log()
-    elif function_name == 'exp':
-        return x.exp()
-    elif function_name == 'abs':
-        if isinstance(x, APICalc.ComplexNumber):
-            return x.abs()
-        else:
-            return abs(x)
-    elif function_name == 'conjugate':
-        if isinstance(x, APICalc.ComplexNumber):
-            return x.conjugate()
-        else:
-            return x  # Conjugate of real number is itself
-    elif function_name == 'arg':
-        if isinstance(x, APICalc.ComplexNumber):
-            return x.arg()
-        else:
-            # Argument of real number
-            if x.negative:
-                return APICalc.AdvancedPrecisionNumber._get_pi(x.precision)
-            else:
-                return APICalc.AdvancedPrecisionNumber('0')
-    elif function_name == 'inverse':
-        return x.inverse()
-    else:
-        raise ValueError(f"Unknown function: {function_name}")
+    return expression_engine.call_function(function_name, tuple(args))
 
 @app.errorhandler(404)
 def not_found(error):
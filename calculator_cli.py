@@ -8,7 +8,7 @@ Allows local execution without needing a server
 import sys
 import json
 import argparse
-from APICalc import AdvancedPrecisionNumber
+from expression_engine import evaluate, format_result
 
 class CalculatorCLI:
     def __init__(self, precision_mode='standard'):
@@ -17,86 +17,9 @@ class CalculatorCLI:
     def safe_calculate(self, expression):
         """Safely evaluate mathematical expressions (same logic as API server)"""
         try:
-            # Handle function calls
-            if any(func in expression.lower() for func in ['factorial(', 'sqrt(', 'sin(', 'cos(', 'tan(', 'log(']):
-                return self.handle_function_call(expression)
-            
-            # Handle power operator (**)
-            if '**' in expression:
-                return self.handle_binary_operation(expression, '**')
-            
-            # Handle other binary operations
-            for op in ['*', '/', '+', '-']:
-                if op in expression:
-                    return self.handle_binary_operation(expression, op)
-            
-            # Handle simple numbers or base conversions
-            try:
-                num = AdvancedPrecisionNumber(expression, precision_mode=self.precision_mode)
-                return str(num)
-            except:
-                # Last resort: try eval for basic arithmetic
-                if all(c in '0123456789+-*/.()\t\n ' for c in expression):
-                    result = eval(expression)
-                    return str(result)
-                else:
-                    raise ValueError(f"Unsupported expression: {expression}")
-            
-        except Exception as e:
+            return format_result(evaluate(expression, self.precision_mode))
+        except (ValueError, ArithmeticError, TypeError) as e:
             raise ValueError(f"Invalid expression: {str(e)}")
-    
-    def handle_binary_operation(self, expression, operator):
-        """Handle binary operations like +, -, *, /, **"""
-        parts = expression.split(operator, 1)
-        if len(parts) != 2:
-            raise ValueError(f"Invalid {operator} operation")
-        
-        left_str = parts[0].strip()
-        right_str = parts[1].strip()
-        
-        # Convert to AdvancedPrecisionNumber
-        left = AdvancedPrecisionNumber(left_str, precision_mode=self.precision_mode)
-        right = AdvancedPrecisionNumber(right_str, precision_mode=self.precision_mode)
-        
-        # Perform operation
-        if operator == '+':
-            result = left + right
-        elif operator == '-':
-            result = left - right
-        elif operator == '*':
-            result = left * right
-        elif operator == '/':
-            result = left / right
-        elif operator == '**':
-            result = left ** right
-        else:
-            raise ValueError(f"Unsupported operator: {operator}")
-        
-        return str(result)
-    
-    def handle_function_call(self, expression):
-        """Handle function calls like factorial(5), sqrt(16), etc."""
-        for func_name in ['factorial', 'sqrt', 'sqr', 'cube', 'cube_root', 'inverse', 
-                          'sin', 'cos', 'tan', 'arcsin', 'arccos', 'arctan', 'log', 'exp']:
-            if f'{func_name}(' in expression.lower():
-                start = expression.lower().find(f'{func_name}(') + len(func_name) + 1
-                end = expression.find(')', start)
-                if end != -1:
-                    arg = expression[start:end].strip()
-                    
-                    # Handle log with base
-                    if func_name == 'log' and ',' in arg:
-                        args = [a.strip() for a in arg.split(',')]
-                        num = AdvancedPrecisionNumber(args[0], precision_mode=self.precision_mode)
-                        base = AdvancedPrecisionNumber(args[1], precision_mode=self.precision_mode)
-                        result = num.log(base)
-                    else:
-                        num = AdvancedPrecisionNumber(arg, precision_mode=self.precision_mode)
-                        result = getattr(num, func_name)()
-                    
-                    return str(result)
-        
-        raise ValueError("Unknown function")
 
 def calculate_expression(expression, precision_mode='standard'):
     """Calculate a mathematical expression and return JSON result"""
@@ -158,7 +81,7 @@ def main():
     parser.add_argument('--test', '-t', nargs=2, metavar=('EXPRESSION', 'EXPECTED'), 
                        help='Test expression against expected result')
     parser.add_argument('--precision', '-p', type=str, default='standard',
-                       choices=['standard', 'high', 'extreme'],
+                       choices=['standard', 'high', 'extreme', 'exact'],
                        help='Precision mode (default: standard)')
     parser.add_argument('--json', action='store_true', help='Output in JSON format')
     parser.add_argument('--version', '-v', action='store_true', help='Show version information')
@@ -203,7 +126,7 @@ def main():
         # Interactive mode
         print("Advanced Precision Calculator - Interactive Mode")
         print("Enter mathematical expressions (type 'quit' to exit):")
-        print("Available precision modes: standard, high, extreme")
+        print("Available precision modes: standard, high, extreme, exact")
         print("Set precision with: precision <mode>")
         print()
         
@@ -218,11 +141,11 @@ def main():
                 
                 if user_input.startswith('precision '):
                     new_precision = user_input.split(' ', 1)[1].strip()
-                    if new_precision in ['standard', 'high', 'extreme']:
+                    if new_precision in ['standard', 'high', 'extreme', 'exact']:
                         precision_mode = new_precision
                         print(f"Precision mode set to: {precision_mode}")
                     else:
-                        print("Invalid precision mode. Available: standard, high, extreme")
+                        print("Invalid precision mode. Available: standard, high, extreme, exact")
                     continue
                 
                 if user_input:
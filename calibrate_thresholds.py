@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Threshold Calibration Benchmark
+Measures where each big-integer algorithm in AdvancedPrecisionNumber starts to
+beat the one below it on this machine, and prints class attributes to paste
+into APICalc.py (or to set at start-up) for the host that serves requests.
+"""
+
+import argparse
+import math
+import random
+import time
+
+from APICalc import AdvancedPrecisionNumber
+
+
+def time_call(func, *args, min_time=0.05):
+    """Best-of-three average time of func(*args), repeating until min_time elapses"""
+    best = None
+    for _ in range(3):
+        loops = 0
+        start = time.perf_counter()
+        while True:
+            func(*args)
+            loops += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        per_call = elapsed / loops
+        best = per_call if best is None else min(best, per_call)
+        if per_call > 1.0:
+            # Very large operands: one timing is representative and repeats are costly
+            break
+    return best
+
+
+def random_operands(limbs, count=2):
+    """Random ints of exactly the given size in limbs"""
+    bits = limbs * AdvancedPrecisionNumber.LIMB_BITS
+    return [random.getrandbits(bits) | (1 << (bits - 1)) for _ in range(count)]
+
+
+def division_operands(limbs):
+    """A dividend twice the size of a divisor of the given size in limbs"""
+    dividend, divisor = random_operands(limbs)
+    return [dividend << (limbs * AdvancedPrecisionNumber.LIMB_BITS) | divisor, divisor]
+
+
+def find_crossover(candidate, baseline, start_limbs, max_limbs, prepare=None, operands=random_operands,
+                   verbose=False):
+    """Smallest size (doubling from start_limbs) at which candidate wins twice in a row"""
+    limbs = start_limbs
+    first_win = None
+    while limbs <= max_limbs:
+        if prepare is not None:
+            prepare(limbs)
+        args = operands(limbs)
+        fast = time_call(candidate, *args)
+        slow = time_call(baseline, *args)
+        if verbose:
+            print(f"  {limbs:>8} limbs: {fast * 1e3:10.3f} ms vs {slow * 1e3:10.3f} ms")
+        if fast < slow:
+            if first_win is not None:
+                return first_win
+            first_win = limbs
+        else:
+            first_win = None
+        limbs *= 2
+    return first_win if first_win is not None else max_limbs * 2
+
+
+def calibrate_multiplication(max_limbs, ntt_max_limbs, verbose=False):
+    """Measure KARATSUBA_THRESHOLD, TOOM3_THRESHOLD and NTT_THRESHOLD"""
+    cls = AdvancedPrecisionNumber
+    saved = (cls.KARATSUBA_THRESHOLD, cls.TOOM3_THRESHOLD, cls.NTT_THRESHOLD)
+    try:
+        cls.NTT_THRESHOLD = float('inf')
+
+        # One Karatsuba level on top of native half-size products
+        def karatsuba_top_level(limbs):
+            cls.KARATSUBA_THRESHOLD = limbs
+            cls.TOOM3_THRESHOLD = float('inf')
+
+        if verbose:
+            print("Karatsuba vs schoolbook:")
+        karatsuba = find_crossover(cls._int_karatsuba, lambda a, b: a * b, 64, max_limbs,
+                                   prepare=karatsuba_top_level, verbose=verbose)
+
+        # Toom-3 on top, its third-size products dispatched with the measured Karatsuba threshold
+        cls.KARATSUBA_THRESHOLD = karatsuba
+        if verbose:
+            print("Toom-3 vs Karatsuba/schoolbook:")
+        toom3 = find_crossover(cls._int_toom3, cls._int_multiply, 64, max_limbs, verbose=verbose)
+        # If Toom-3 wins first there is simply no Karatsuba band
+        karatsuba = min(karatsuba, toom3)
+
+        # NTT against everything below it; the transform only pays off on very long operands
+        cls.TOOM3_THRESHOLD = toom3
+        cls._get_ntt_primes()
+        if verbose:
+            print("NTT vs Toom-3/Karatsuba/schoolbook:")
+        ntt = max(find_crossover(cls._int_ntt_multiply, cls._int_multiply, 1 << 15, ntt_max_limbs,
+                                 verbose=verbose), toom3)
+        return {'KARATSUBA_THRESHOLD': karatsuba, 'TOOM3_THRESHOLD': toom3, 'NTT_THRESHOLD': ntt}
+    finally:
+        cls.KARATSUBA_THRESHOLD, cls.TOOM3_THRESHOLD, cls.NTT_THRESHOLD = saved
+
+
+def calibrate_division(max_limbs, newton_max_limbs, verbose=False):
+    """Measure BURNIKEL_ZIEGLER_THRESHOLD and NEWTON_DIVISION_THRESHOLD with the current multiply thresholds"""
+    cls = AdvancedPrecisionNumber
+    saved = (cls.BURNIKEL_ZIEGLER_THRESHOLD, cls.NEWTON_DIVISION_THRESHOLD)
+    try:
+        cls.NEWTON_DIVISION_THRESHOLD = float('inf')
+
+        # One recursion level on top of native half-size divisions
+        def bz_top_level(limbs):
+            cls.BURNIKEL_ZIEGLER_THRESHOLD = limbs
+
+        if verbose:
+            print("Burnikel-Ziegler vs native long division:")
+        bz = find_crossover(cls._int_burnikel_ziegler_divmod, divmod, 32, max_limbs,
+                            prepare=bz_top_level, operands=division_operands, verbose=verbose)
+
+        cls.BURNIKEL_ZIEGLER_THRESHOLD = bz
+        if verbose:
+            print("Newton-Raphson vs Burnikel-Ziegler:")
+        newton = max(find_crossover(cls._int_newton_divmod, cls._int_divmod, 1 << 12, newton_max_limbs,
+                                    operands=division_operands, verbose=verbose), bz)
+        return {'BURNIKEL_ZIEGLER_THRESHOLD': bz, 'NEWTON_DIVISION_THRESHOLD': newton}
+    finally:
+        cls.BURNIKEL_ZIEGLER_THRESHOLD, cls.NEWTON_DIVISION_THRESHOLD = saved
+
+
+def calibrate_roots(max_limbs, verbose=False):
+    """Measure NEWTON_ROOT_THRESHOLD with the current multiply and divide thresholds"""
+    cls = AdvancedPrecisionNumber
+    saved = cls.NEWTON_ROOT_THRESHOLD
+    try:
+        # One Newton level on top of math.isqrt of the half-size root
+        def newton_top_level(limbs):
+            cls.NEWTON_ROOT_THRESHOLD = limbs
+
+        if verbose:
+            print("Newton square root vs math.isqrt:")
+        newton = find_crossover(lambda n: cls._int_iroot(n, 2), math.isqrt, 256, max_limbs,
+                                prepare=newton_top_level, operands=lambda limbs: random_operands(limbs, 1),
+                                verbose=verbose)
+        return {'NEWTON_ROOT_THRESHOLD': newton}
+    finally:
+        cls.NEWTON_ROOT_THRESHOLD = saved
+
+
+def modular_power_operands(limbs):
+    """A base, an exponent and an odd modulus, all of the given size in limbs"""
+    base, exponent, modulus = random_operands(limbs, 3)
+    return [base % modulus, exponent, modulus | 1]
+
+
+def calibrate_modular_power(max_limbs, verbose=False):
+    """Measure MODULAR_REDUCTION_THRESHOLD with the current multiply thresholds"""
+    cls = AdvancedPrecisionNumber
+    if verbose:
+        print("Montgomery modular power vs built-in pow:")
+    threshold = find_crossover(cls._int_montgomery_power, pow, 8, max_limbs,
+                               operands=modular_power_operands, verbose=verbose)
+    return {'MODULAR_REDUCTION_THRESHOLD': threshold}
+
+
+def calibrate_gcd(max_limbs, verbose=False):
+    """Measure HALF_XGCD_THRESHOLD and HALF_GCD_THRESHOLD with the current multiply thresholds"""
+    cls = AdvancedPrecisionNumber
+    saved = (cls.HALF_XGCD_THRESHOLD, cls.HALF_GCD_THRESHOLD)
+    try:
+        # One half-GCD reduction on top of Lehmer's algorithm (in Python, or math.gcd in C) for the rest
+        def xgcd_top_level(limbs):
+            cls.HALF_XGCD_THRESHOLD = limbs
+
+        def gcd_top_level(limbs):
+            cls.HALF_GCD_THRESHOLD = limbs
+
+        if verbose:
+            print("Half-GCD vs Lehmer extended GCD:")
+        xgcd = find_crossover(cls._int_xgcd, lambda a, b: cls._int_lehmer_xgcd(max(a, b), min(a, b)), 32,
+                              max_limbs, prepare=xgcd_top_level, verbose=verbose)
+        cls.HALF_XGCD_THRESHOLD = xgcd
+        if verbose:
+            print("Half-GCD vs math.gcd:")
+        gcd = find_crossover(cls._int_gcd, math.gcd, 1 << 12, max_limbs, prepare=gcd_top_level, verbose=verbose)
+        return {'HALF_XGCD_THRESHOLD': xgcd, 'HALF_GCD_THRESHOLD': gcd}
+    finally:
+        cls.HALF_XGCD_THRESHOLD, cls.HALF_GCD_THRESHOLD = saved
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Calibrate AdvancedPrecisionNumber algorithm thresholds')
+    parser.add_argument('--max-limbs', type=int, default=1 << 17,
+                        help='Largest operand size to try, in 30-bit limbs (default: 131072)')
+    parser.add_argument('--ntt-max-limbs', type=int, default=1 << 20,
+                        help='Largest operand size to try for the NTT crossover (default: 1048576)')
+    parser.add_argument('--newton-max-limbs', type=int, default=1 << 20,
+                        help='Largest divisor size to try for the Newton division crossover (default: 1048576)')
+    parser.add_argument('--modular-max-limbs', type=int, default=1024,
+                        help='Largest modulus size to try for the modular power crossover (default: 1024)')
+    parser.add_argument('--verbose', action='store_true', help='Print every timing')
+    args = parser.parse_args()
+
+    thresholds = calibrate_multiplication(args.max_limbs, args.ntt_max_limbs, verbose=args.verbose)
+    # Division kernels are built on multiplication, and roots on both, so each stage is
+    # measured with the thresholds found before it
+    cls = AdvancedPrecisionNumber
+    names = ('KARATSUBA_THRESHOLD', 'TOOM3_THRESHOLD', 'NTT_THRESHOLD',
+             'BURNIKEL_ZIEGLER_THRESHOLD', 'NEWTON_DIVISION_THRESHOLD')
+    saved = {name: getattr(cls, name) for name in names}
+    try:
+        for name, value in thresholds.items():
+            setattr(cls, name, value)
+        thresholds.update(calibrate_division(args.max_limbs, args.newton_max_limbs, verbose=args.verbose))
+        for name in ('BURNIKEL_ZIEGLER_THRESHOLD', 'NEWTON_DIVISION_THRESHOLD'):
+            setattr(cls, name, thresholds[name])
+        thresholds.update(calibrate_roots(args.max_limbs, verbose=args.verbose))
+        thresholds.update(calibrate_modular_power(args.modular_max_limbs, verbose=args.verbose))
+        thresholds.update(calibrate_gcd(args.max_limbs, verbose=args.verbose))
+    finally:
+        for name, value in saved.items():
+            setattr(cls, name, value)
+
+    print("Measured thresholds (30-bit limbs of the smaller operand, the divisor, the radicand, the modulus")
+    print("or the smaller GCD operand):")
+    for name, value in thresholds.items():
+        print(f"    {name} = {value}")
+
+
+if __name__ == "__main__":
+    main()
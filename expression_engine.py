@@ -0,0 +1,515 @@
+# Shared expression engine for every calculator front end - no external library dependencies
+# One tokenizer and one Pratt (precedence-climbing) parser turn the source into an AST, which is
+# compiled once into nested closures; evaluation then walks the tree a single time. Compiled trees
+# and results are kept in small LRU caches, since front ends send the same expressions repeatedly.
+
+import fractions
+import operator
+import re
+import threading
+from collections import OrderedDict, namedtuple
+
+from APICalc import AdvancedPrecisionNumber, ComplexNumber
+
+# AST nodes. Number keeps its source text: the digits are read in whatever base and precision
+# mode the expression is evaluated with.
+Number = namedtuple('Number', 'text')
+Name = namedtuple('Name', 'name')
+Unary = namedtuple('Unary', 'op operand')
+Binary = namedtuple('Binary', 'op left right')
+Postfix = namedtuple('Postfix', 'op operand')
+Call = namedtuple('Call', 'name args')
+
+Token = namedtuple('Token', 'kind text pos')
+
+# Numbers start with a digit, a point or a [baseN] prefix and run over every base-36 digit, so
+# 0x1f, [base36]zz and 4i are single tokens. In decimal a plain exponent may carry its own sign;
+# in other bases e is left to the parser, since from base 15 up it is a digit (1e-5 is 0x1e - 5).
+_EXPONENT_NUMBER = r"(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)[eE][-+]\d+"
+_NUMBER = r"\[base\d+\][0-9a-zA-Z_.]+|(?:\d|\.\d)[0-9a-zA-Z_.]*"
+_TOKEN_PATTERN = r"""
+    (?P<space>\s+)
+  | (?P<number>{number})
+  | (?P<name>[a-zA-Z_][a-zA-Z0-9_]*)
+  | (?P<op>\*\*|//|==|!=|<=|>=|[-+*/%<>!(),])
+"""
+_TOKEN_RE = re.compile(_TOKEN_PATTERN.format(number=_EXPONENT_NUMBER + '|' + _NUMBER), re.VERBOSE)
+_DIGIT_TOKEN_RE = re.compile(_TOKEN_PATTERN.format(number=_NUMBER), re.VERBOSE)
+_EXPONENT_RE = re.compile(_EXPONENT_NUMBER)
+
+# Binding powers: a higher number binds tighter. Unary minus sits between * and ** as in
+# Python (-2**2 == -4, 2**-1 == 0.5); ** is right-associative and ! is postfix.
+_INFIX_POWER = {
+    '==': 10, '!=': 10, '<': 10, '<=': 10, '>': 10, '>=': 10,
+    '+': 20, '-': 20,
+    '*': 30, '/': 30, '//': 30, '%': 30,
+    '**': 50,
+}
+_RIGHT_ASSOCIATIVE = {'**'}
+_PREFIX_POWER = 40
+_POSTFIX_POWER = 60
+
+
+def tokenize(text, scientific=True):
+    """Split an expression into tokens in one left-to-right pass; scientific reads 1e-5 as one decimal number"""
+    token_re = _TOKEN_RE if scientific else _DIGIT_TOKEN_RE
+    tokens = []
+    pos = 0
+    while pos < len(text):
+        match = token_re.match(text, pos)
+        if match is None:
+            raise ValueError(f"Unexpected character '{text[pos]}' at position {pos}")
+        kind = match.lastgroup
+        if kind == 'number' and match.group().count('.') > 1:
+            raise ValueError(f"Invalid number '{match.group()}' at position {pos}: more than one radix point")
+        if kind != 'space':
+            tokens.append(Token(kind, match.group(), pos))
+        pos = match.end()
+    tokens.append(Token('end', '', pos))
+    return tokens
+
+
+class _Parser:
+    """Pratt parser over a token list: each operator is consumed exactly once"""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.index = 0
+
+    def peek(self):
+        return self.tokens[self.index]
+
+    def advance(self):
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+
+    def expect(self, text):
+        token = self.advance()
+        if token.text != text:
+            found = f"'{token.text}'" if token.kind != 'end' else 'end of expression'
+            raise ValueError(f"Expected '{text}' at position {token.pos}, found {found}")
+        return token
+
+    def parse(self):
+        node = self.expression(0)
+        token = self.peek()
+        if token.kind != 'end':
+            raise ValueError(f"Unexpected '{token.text}' at position {token.pos}")
+        return node
+
+    def expression(self, min_power):
+        node = self.prefix()
+        while True:
+            token = self.peek()
+            if token.kind != 'op':
+                return node
+            if token.text == '!':
+                if _POSTFIX_POWER < min_power:
+                    return node
+                self.advance()
+                node = Postfix('!', node)
+                continue
+            power = _INFIX_POWER.get(token.text)
+            if power is None or power < min_power or (power == min_power and token.text not in _RIGHT_ASSOCIATIVE):
+                return node
+            self.advance()
+            right_power = power if token.text in _RIGHT_ASSOCIATIVE else power + 1
+            node = Binary(token.text, node, self.expression(right_power))
+
+    def prefix(self):
+        token = self.advance()
+        if token.kind == 'number':
+            return Number(token.text)
+        if token.kind == 'name':
+            if self.peek().text == '(':
+                return self.call(token)
+            return Name(token.text.lower())
+        if token.text in ('-', '+'):
+            return Unary(token.text, self.expression(_PREFIX_POWER))
+        if token.text == '(':
+            node = self.expression(0)
+            self.expect(')')
+            return node
+        if token.kind == 'end':
+            raise ValueError("Unexpected end of expression")
+        raise ValueError(f"Unexpected '{token.text}' at position {token.pos}")
+
+    def call(self, name_token):
+        self.expect('(')
+        args = []
+        if self.peek().text != ')':
+            args.append(self.expression(0))
+            while self.peek().text == ',':
+                self.advance()
+                args.append(self.expression(0))
+        self.expect(')')
+        return Call(name_token.text.lower(), tuple(args))
+
+
+def parse(text, scientific=True):
+    """Parse an expression into an AST of Number, Name, Unary, Binary, Postfix and Call nodes"""
+    return _Parser(tokenize(text, scientific)).parse()
+
+
+# Evaluation helpers
+
+def _is_complex(value):
+    return isinstance(value, ComplexNumber)
+
+
+def _as_complex(value):
+    return value if _is_complex(value) else ComplexNumber(value, AdvancedPrecisionNumber.from_int(0))
+
+
+def _real(value, name):
+    if _is_complex(value):
+        raise ValueError(f"{name} is not defined for complex numbers")
+    return value
+
+
+def _integer(value, name):
+    value = _real(value, name)
+    if not value._is_integer():
+        raise ValueError(f"{name} requires an integer argument")
+    return value._to_int()
+
+
+def _number(text, base, precision_mode):
+    """A literal read in the given base; a trailing i or j that is not a digit marks it imaginary"""
+    lowered = text.lower()
+    digits_base = base
+    if lowered.startswith(('0b', '0o', '0x')):
+        digits_base = {'b': 2, 'o': 8, 'x': 16}[lowered[1]]
+    elif lowered.startswith('[base'):
+        digits_base = int(lowered[5:lowered.index(']')])
+    if lowered[-1] in 'ij' and int(lowered[-1], 36) >= digits_base:
+        imaginary = _number(text[:-1], base, precision_mode) if len(text) > 1 else \
+            AdvancedPrecisionNumber.from_int(1, base, precision_mode)
+        return ComplexNumber(AdvancedPrecisionNumber.from_int(0, base, precision_mode), imaginary)
+    number = AdvancedPrecisionNumber(text, base, precision_mode)
+    if number.precision_loss_warning:
+        raise ValueError(f"Invalid number '{text}' for base {base}")
+    return number
+
+
+def _constant(name, base, precision_mode):
+    # One rule in every base: a name made only of digits of the base is a number (ff, or e in
+    # base 16); anything else may be a constant, and _pi, _e, _i and _j are never digits
+    if not name.startswith('_') and all(int(digit, 36) < base for digit in name if digit != '_'):
+        return _number(name, base, precision_mode)
+    constant = name[1:] if name.startswith('_') else name
+    precision = AdvancedPrecisionNumber.PRECISION_MODES.get(precision_mode, 50)
+    if constant == 'pi':
+        value = AdvancedPrecisionNumber._get_pi(precision)
+    elif constant == 'e':
+        value = AdvancedPrecisionNumber._get_e(precision)
+    elif constant in ('i', 'j'):
+        return ComplexNumber(AdvancedPrecisionNumber.from_int(0, base, precision_mode),
+                             AdvancedPrecisionNumber.from_int(1, base, precision_mode))
+    else:
+        raise ValueError(f"Unknown name '{name}'")
+    return value._convert_to_base(base)
+
+
+_COMPARISONS = {'==': operator.eq, '!=': operator.ne, '<': operator.lt, '<=': operator.le,
+                '>': operator.gt, '>=': operator.ge}
+_ARITHMETIC = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': operator.truediv,
+               '//': operator.floordiv, '%': operator.mod, '**': operator.pow}
+
+
+def _operand(value, role):
+    """value if it is a number; comparison, xgcd, continued fraction and fraction results are not"""
+    if isinstance(value, (AdvancedPrecisionNumber, ComplexNumber)):
+        return value
+    if isinstance(value, bool):
+        kind = 'a comparison result'
+    elif isinstance(value, tuple):
+        kind = 'an xgcd result'
+    elif isinstance(value, list):
+        kind = 'a continued fraction'
+    else:
+        kind = f'a {type(value).__name__}'
+    raise ValueError(f"{role} must be a number, not {kind}")
+
+
+def _complex_power(z, w):
+    # z**w = exp(w * log(z)) on the principal branch
+    if z.real._is_zero() and z.imag._is_zero():
+        if not w.real.negative and not w.real._is_zero():
+            return z
+        raise ValueError("Zero raised to a power with a non-positive real part is undefined")
+    return (w * z.log()).exp()
+
+
+def _apply_binary(op, left, right):
+    left = _operand(left, f"Left operand of '{op}'")
+    right = _operand(right, f"Right operand of '{op}'")
+    try:
+        if _is_complex(left) or _is_complex(right):
+            if op in ('//', '%') or op in _COMPARISONS and op not in ('==', '!='):
+                raise ValueError(f"Operator '{op}' is not defined for complex numbers")
+            if op == '**':
+                if not _is_complex(right):
+                    return _as_complex(left) ** right
+                return _complex_power(_as_complex(left), right)
+            left, right = _as_complex(left), _as_complex(right)
+        if op in _COMPARISONS:
+            return _COMPARISONS[op](left, right)
+        return _ARITHMETIC[op](left, right)
+    except TypeError as e:
+        raise ValueError(f"Operator '{op}': {e}") from None
+
+
+def _real_argument(x):
+    # Argument of a real number: 0, or pi when it is negative
+    if x.negative:
+        return AdvancedPrecisionNumber._get_pi(x.precision)
+    return AdvancedPrecisionNumber.from_int(0, x.base, x.precision)
+
+
+def _method(name, real_only=False):
+    def call(x):
+        if real_only:
+            _real(x, name)
+        method = getattr(x, name, None)
+        if method is None:
+            raise ValueError(f"{name} is not defined for complex numbers")
+        return method()
+    return call
+
+
+# name -> (minimum arguments, maximum arguments, implementation)
+FUNCTIONS = {
+    'sin': (1, 1, _method('sin')),
+    'cos': (1, 1, _method('cos')),
+    'tan': (1, 1, _method('tan')),
+    'arcsin': (1, 1, _method('arcsin', real_only=True)),
+    'arccos': (1, 1, _method('arccos', real_only=True)),
+    'arctan': (1, 1, _method('arctan', real_only=True)),
+    'sqrt': (1, 1, _method('sqrt')),
+    'sqr': (1, 1, _method('sqr', real_only=True)),
+    'cube': (1, 1, _method('cube', real_only=True)),
+    'cube_root': (1, 1, _method('cube_root', real_only=True)),
+    'isqrt': (1, 1, _method('isqrt', real_only=True)),
+    'iroot': (2, 2, lambda x, k: _real(x, 'iroot').iroot(_integer(k, 'iroot'))),
+    'is_perfect_power': (1, 1, _method('is_perfect_power', real_only=True)),
+    'pow': (2, 3, lambda *args: pow(*[_real(a, 'pow') for a in args]) if len(args) == 3
+            else _apply_binary('**', *args)),
+    'gcd': (2, 2, lambda a, b: _real(a, 'gcd').gcd(_real(b, 'gcd'))),
+    'lcm': (2, 2, lambda a, b: _real(a, 'lcm').lcm(_real(b, 'lcm'))),
+    'xgcd': (2, 2, lambda a, b: _real(a, 'xgcd').xgcd(_real(b, 'xgcd'))),
+    'modinv': (2, 2, lambda a, m: _real(a, 'modinv').modinv(_real(m, 'modinv'))),
+    'continued_fraction': (1, 2, lambda x, n=None: _real(x, 'continued_fraction').continued_fraction(
+        None if n is None else _integer(n, 'continued_fraction'))),
+    'to_fraction': (1, 2, lambda x, limit=None: _real(x, 'to_fraction').to_fraction(
+        None if limit is None else _integer(limit, 'to_fraction'))),
+    'factorial': (1, 1, _method('factorial', real_only=True)),
+    'log': (1, 2, lambda x, base=None: x.log() if base is None else x.log(base)),
+    'exp': (1, 1, _method('exp')),
+    'abs': (1, 1, lambda x: x.abs() if _is_complex(x) else abs(x)),
+    'conjugate': (1, 1, lambda x: x.conjugate() if _is_complex(x) else x),
+    'arg': (1, 1, lambda x: x.arg() if _is_complex(x) else _real_argument(x)),
+    'inverse': (1, 1, _method('inverse', real_only=True)),
+}
+
+
+def call_function(name, args):
+    """Apply a calculator function to already evaluated arguments"""
+    entry = FUNCTIONS.get(name)
+    if entry is None:
+        raise ValueError(f"Unknown function: {name}")
+    low, high, implementation = entry
+    if not low <= len(args) <= high:
+        expected = str(low) if low == high else f"{low} to {high}"
+        raise ValueError(f"{name} takes {expected} argument{'s' if high > 1 else ''}, got {len(args)}")
+    args = [_operand(arg, f"Argument {index} of {name}") for index, arg in enumerate(args, 1)]
+    try:
+        return implementation(*args)
+    except TypeError as e:
+        raise ValueError(f"{name}: {e}") from None
+
+
+# Compilation: every node becomes a closure over its compiled children, taking (base, precision_mode)
+
+def _compile(node):
+    if isinstance(node, Number):
+        # Numbers are immutable, so a cached tree reads each literal once per base and mode
+        text, values = node.text, {}
+
+        def number(base, mode):
+            value = values.get((base, mode))
+            if value is None:
+                value = values[base, mode] = _number(text, base, mode)
+            return value
+        return number
+    if isinstance(node, Name):
+        name = node.name
+        return lambda base, mode: _constant(name, base, mode)
+    if isinstance(node, Unary):
+        operand = _compile(node.operand)
+        if node.op == '+':
+            return lambda base, mode: _operand(operand(base, mode), "Operand of unary '+'")
+        return lambda base, mode: -_operand(operand(base, mode), "Operand of unary '-'")
+    if isinstance(node, Postfix):
+        operand = _compile(node.operand)
+        return lambda base, mode: call_function('factorial', (operand(base, mode),))
+    if isinstance(node, Binary):
+        if node.op in _RIGHT_ASSOCIATIVE:
+            op, left, right = node.op, _compile(node.left), _compile(node.right)
+            return lambda base, mode: _apply_binary(op, left(base, mode), right(base, mode))
+        # A left-associative chain such as 1 + 2 + ... + n is a deep left spine: compile it
+        # into one loop rather than n nested closures
+        steps = []
+        while isinstance(node, Binary) and node.op not in _RIGHT_ASSOCIATIVE:
+            steps.append((node.op, _compile(node.right)))
+            node = node.left
+        steps.reverse()
+        first = _compile(node)
+
+        def chain(base, mode):
+            value = first(base, mode)
+            for op, right in steps:
+                value = _apply_binary(op, value, right(base, mode))
+            return value
+        return chain
+    if isinstance(node, Call):
+        name = node.name
+        if name not in FUNCTIONS:
+            raise ValueError(f"Unknown function: {name}")
+        args = [_compile(arg) for arg in node.args]
+        return lambda base, mode: call_function(name, tuple(arg(base, mode) for arg in args))
+    raise TypeError(f"Not an expression node: {node!r}")
+
+
+class CompiledExpression:
+    """An expression parsed and compiled once, to be evaluated in any base and precision mode"""
+    __slots__ = ('source', 'tree', '_evaluate', '_digit_evaluate')
+
+    def __init__(self, source, tree=None):
+        self.source = source
+        self.tree = parse(source) if tree is None else tree
+        self._evaluate = _compile(self.tree)
+        # Outside decimal a number like 1e-5 is read as 1e - 5, so such sources get a second tree
+        self._digit_evaluate = _compile(parse(source, scientific=False)) if _EXPONENT_RE.search(source) else None
+
+    def evaluate(self, precision_mode='standard', base=10):
+        if base != 10 and self._digit_evaluate is not None:
+            return self._digit_evaluate(base, precision_mode)
+        return self._evaluate(base, precision_mode)
+
+    def __repr__(self):
+        return f"CompiledExpression({self.source!r})"
+
+
+class _LRUCache:
+    """Mapping of bounded size that evicts the least recently used entry and counts hits and misses"""
+    __slots__ = ('max_size', 'hits', 'misses', '_entries', '_lock')
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        # The Flask servers handle requests on several threads
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        return {'size': len(self._entries), 'max_size': self.max_size, 'hits': self.hits, 'misses': self.misses}
+
+
+# Compiled trees keyed by the normalized token text, so "1+2" and " 1 + 2 " share one tree
+COMPILE_CACHE_SIZE = 512
+_compile_cache = _LRUCache(COMPILE_CACHE_SIZE)
+# Results keyed by (source text, precision mode, base): an exact repeat skips even the tokenizer
+RESULT_CACHE_SIZE = 1024
+_result_cache = _LRUCache(RESULT_CACHE_SIZE)
+# Results above this many bits (about 20,000 decimal digits) are returned but not kept, which caps
+# the result cache at RESULT_CACHE_SIZE * RESULT_CACHE_MAX_BITS bits, about 8 MB
+RESULT_CACHE_MAX_BITS = 1 << 16
+
+
+def _normalize(tokens):
+    # Tokens joined by single spaces never merge differently, so the key parses exactly as the source
+    return ' '.join(token.text.lower() if token.kind == 'name' else token.text for token in tokens[:-1])
+
+
+def _result_bits(value):
+    """Rough size of a result in bits, to keep very large results out of the cache"""
+    if isinstance(value, AdvancedPrecisionNumber):
+        if value._is_rational():
+            numerator, denominator = value._extras['ratio'][:2]
+            return numerator.bit_length() + denominator.bit_length()
+        return value._mantissa.bit_length()
+    if isinstance(value, ComplexNumber):
+        return _result_bits(value.real) + _result_bits(value.imag)
+    if isinstance(value, (tuple, list)):
+        return sum(_result_bits(item) + 1 for item in value)
+    if isinstance(value, fractions.Fraction):
+        return value.numerator.bit_length() + value.denominator.bit_length()
+    return 1
+
+
+def compile_expression(text):
+    """Tokenize, parse and compile an expression, or reuse the tree compiled for the same normalized text"""
+    tokens = tokenize(text)
+    key = _normalize(tokens)
+    compiled = _compile_cache.get(key)
+    if compiled is None:
+        compiled = CompiledExpression(key, _Parser(tokens).parse())
+        _compile_cache.put(key, compiled)
+    return compiled
+
+
+def evaluate(text, precision_mode='standard', base=10):
+    """Evaluate an expression: numbers, + - * / // % **, comparisons, ! and function calls"""
+    key = (text, precision_mode, base)
+    result = _result_cache.get(key)
+    if result is None:
+        result = compile_expression(text).evaluate(precision_mode, base)
+        if _result_bits(result) <= RESULT_CACHE_MAX_BITS:
+            _result_cache.put(key, result)
+    # Numbers are immutable, but a continued fraction comes back as a list the caller may change
+    return list(result) if isinstance(result, list) else result
+
+
+def cache_info():
+    """Size, capacity and hit/miss counts of the compile and result caches"""
+    return {'compile': _compile_cache.info(), 'result': _result_cache.info()}
+
+
+def clear_caches():
+    """Empty both caches and reset their counters"""
+    _compile_cache.clear()
+    _result_cache.clear()
+
+
+def format_result(value):
+    """Text for a result: numbers as str(), xgcd triples as (g, x, y), continued fractions as [a0; a1, ...]"""
+    if isinstance(value, tuple):
+        return '(' + ', '.join(format_result(item) for item in value) + ')'
+    if isinstance(value, list):
+        return AdvancedPrecisionNumber._continued_fraction_str(value)
+    return str(value)
@@ -38,7 +38,7 @@ class Matrix:
                                 element = data[i][j]
                                 row.append(self._create_number(element))
                             else:
-                                row.append(self._create_number('0'))
+                                row.append(self._create_number(0))
                         self.data.append(row)
                 else:
                     # 1D list provided - treat as single row
@@ -49,17 +49,22 @@ class Matrix:
                 # Empty data, use dimensions
                 self.rows = max(rows, 0)
                 self.cols = max(cols, 0)
-                self.data = [[self._create_number('0') for _ in range(self.cols)] for _ in range(self.rows)]
+                # Numbers are immutable, so every entry can share one zero
+                zero = self._create_number(0)
+                self.data = [[zero] * self.cols for _ in range(self.rows)]
         else:
             # Create empty matrix with specified dimensions
             self.rows = max(rows, 0)
             self.cols = max(cols, 0)
-            self.data = [[self._create_number('0') for _ in range(self.cols)] for _ in range(self.rows)]
+            zero = self._create_number(0)
+            self.data = [[zero] * self.cols for _ in range(self.rows)]
     
     def _create_number(self, value):
         """Create appropriate number type (real or complex) from value."""
         if isinstance(value, (AdvancedPrecisionNumber, ComplexNumber)):
             return value
+        if isinstance(value, int):
+            return AdvancedPrecisionNumber.from_int(value, precision_mode=self.precision_mode)
         
         value_str = str(value).strip()
         
@@ -184,7 +189,7 @@ class Matrix:
             
             for i in range(self.rows):
                 for j in range(other.cols):
-                    sum_val = self._create_number('0')
+                    sum_val = self._create_number(0)
                     for k in range(self.cols):
                         product = self.data[i][k] * other.data[k][j]
                         sum_val = sum_val + product
@@ -225,7 +230,7 @@ class Matrix:
         if not self.is_square():
             raise ValueError("Trace is only defined for square matrices")
         
-        trace_sum = self._create_number('0')
+        trace_sum = self._create_number(0)
         for i in range(self.rows):
             trace_sum = trace_sum + self.data[i][i]
         
@@ -237,7 +242,7 @@ class Matrix:
             raise ValueError("Determinant is only defined for square matrices")
         
         if self.rows == 0:
-            return self._create_number('1')
+            return self._create_number(1)
         elif self.rows == 1:
             return self.data[0][0]
         elif self.rows == 2:
@@ -249,7 +254,7 @@ class Matrix:
             return (a * d) - (b * c)
         else:
             # Recursive cofactor expansion along first row
-            det = self._create_number('0')
+            det = self._create_number(0)
             
             for j in range(self.cols):
                 # Get cofactor
@@ -258,7 +263,7 @@ class Matrix:
                 
                 # Apply sign
                 if j % 2 == 1:
-                    cofactor = self._create_number('0') - cofactor
+                    cofactor = self._create_number(0) - cofactor
                 
                 # Add to determinant
                 term = self.data[0][j] * cofactor
@@ -290,7 +295,7 @@ class Matrix:
             raise ValueError("Inverse is only defined for square matrices")
         
         det = self.determinant()
-        zero = self._create_number('0')
+        zero = self._create_number(0)
         
         # Check if determinant is zero (using comparison with small epsilon)
         try:
@@ -320,9 +325,9 @@ class Matrix:
         for i in range(n):
             for j in range(n):
                 if i == j:
-                    augmented.data[i][n + j] = self._create_number('1')
+                    augmented.data[i][n + j] = self._create_number(1)
                 else:
-                    augmented.data[i][n + j] = self._create_number('0')
+                    augmented.data[i][n + j] = self._create_number(0)
         
         # Perform Gauss-Jordan elimination
         for i in range(n):
@@ -379,9 +384,9 @@ class Matrix:
         for i in range(size):
             for j in range(size):
                 if i == j:
-                    matrix.data[i][j] = matrix._create_number('1')
+                    matrix.data[i][j] = matrix._create_number(1)
                 else:
-                    matrix.data[i][j] = matrix._create_number('0')
+                    matrix.data[i][j] = matrix._create_number(0)
         
         return matrix
     
@@ -397,7 +402,7 @@ class Matrix:
         
         for i in range(rows):
             for j in range(cols):
-                matrix.data[i][j] = matrix._create_number('1')
+                matrix.data[i][j] = matrix._create_number(1)
         
         return matrix
     
@@ -5,6 +5,7 @@ import fractions
 
 # Import the module
 from APICalc import AdvancedPrecisionNumber, ComplexNumber
+import expression_engine
 
 class ImprovedTestResult(unittest.TestResult):
     """
@@ -165,6 +166,286 @@ class TestAdvancedPrecisionNumber(unittest.TestCase):
         octal = AdvancedPrecisionNumber('0o17')
         self.assertEqual(octal.base, 8)
 
+    def test_divide_and_conquer_base_conversion(self):
+        """Test exact conversion of long numbers between bases"""
+        hex_digits = 'f' * 5000
+        num = AdvancedPrecisionNumber(hex_digits, 16)
+        self.assertEqual(num.base, 16)
+        decimal = num._convert_to_base(10)
+        self.assertEqual(decimal._to_int(), int(hex_digits, 16))
+        self.assertEqual(AdvancedPrecisionNumber._int_to_str(10 ** 3000, 10), '1' + '0' * 3000)
+        self.assertEqual(AdvancedPrecisionNumber._int_to_str(7 ** 2000, 7), '1' + '0' * 2000)
+        digits = [d % 5 for d in range(4000)]
+        value = AdvancedPrecisionNumber._digits_to_int(digits, 5)
+        self.assertEqual(value, int(''.join(map(str, digits)), 5))
+        # str() output in any base parses back
+        base5 = AdvancedPrecisionNumber('12.4')._convert_to_base(5)
+        self.assertEqual(str(AdvancedPrecisionNumber(str(base5))._convert_to_base(10)), '12.4')
+
+    def test_bulk_parse_and_format(self):
+        """Test exact scientific notation and chunked output of long numbers"""
+        self.assertEqual(str(AdvancedPrecisionNumber('1.5e-3')), '0.0015')
+        self.assertEqual(str(AdvancedPrecisionNumber('12345e20')), '12345' + '0' * 20)
+        self.assertEqual(str(AdvancedPrecisionNumber(1e-30)), '0.' + '0' * 29 + '1')
+        self.assertEqual(AdvancedPrecisionNumber._digit_string('1_000', 10), '1000')
+        with self.assertRaises(ValueError):
+            AdvancedPrecisionNumber._digit_string('12a', 10)
+        for bad in ('1.2.3', '1e', '1e+', 'none', '3+4', '1$2', '12-'):
+            with self.assertRaises(ValueError):
+                AdvancedPrecisionNumber(bad)
+        with self.assertRaisesRegex(ValueError, "Invalid exponent in '1e'"):
+            AdvancedPrecisionNumber('1e')
+        digits = ''.join(str(d * 7 % 10) for d in range(1, 6000))
+        num = AdvancedPrecisionNumber(digits + '.25', max_precision=10000)
+        self.assertEqual(str(num), digits + '.25')
+        self.assertEqual(num._to_int(), AdvancedPrecisionNumber._str_to_int(digits, 10))
+        chunks = list(num.to_string_chunks(1000))
+        self.assertEqual(''.join(chunks), str(num))
+        self.assertTrue(all(len(chunk) == 1000 for chunk in chunks[:-1]))
+        base7 = AdvancedPrecisionNumber('6' * 3000, 7)
+        self.assertEqual(str(base7), '[base7]' + '6' * 3000)
+
+    def test_compact_immutable_numbers(self):
+        """Test slot storage, canonical mantissas and sharing of immutable values"""
+        num = AdvancedPrecisionNumber('2.50000')
+        self.assertFalse(hasattr(num, '__dict__'))
+        self.assertEqual((num._mantissa, num._exponent), (25, -1))
+        quarter = AdvancedPrecisionNumber('1') / AdvancedPrecisionNumber('4')
+        self.assertEqual((quarter._mantissa, quarter._exponent), (25, -2))
+        self.assertEqual(hash(quarter), hash(AdvancedPrecisionNumber('0.25')))
+        self.assertIs(abs(num), num)
+        self.assertIs(-self.zero, self.zero)
+        self.assertIs(num._convert_to_base(10), num)
+        self.assertEqual(str(-(-num)), '2.5')
+        self.assertEqual(str(self.a - self.a), '0')
+        self.assertEqual(str(self.b - self.a), '-7.3')
+        self.assertEqual(AdvancedPrecisionNumber('7', max_precision=20).max_precision, 20)
+        self.assertIsNone(num._extras)
+        # A copy owns its extras: setting one on the copy leaves the source as it was
+        source = AdvancedPrecisionNumber('1.5', max_precision=20)
+        copy = AdvancedPrecisionNumber(source)
+        copy._set_extra('precision_loss_warning', True)
+        self.assertEqual(source._extras, {'max_precision': 20})
+        self.assertFalse(source.precision_loss_warning)
+        self.assertEqual(copy.max_precision, 20)
+
+    def test_from_int_and_small_int_pool(self):
+        """Test the parser-free integer constructor and its interned small values"""
+        two = AdvancedPrecisionNumber.from_int(2, 10, 'high')
+        self.assertIs(two, AdvancedPrecisionNumber.from_int(2, 10, 200))
+        self.assertIsNot(two, AdvancedPrecisionNumber.from_int(2))
+        self.assertEqual(two.precision, 200)
+        # Precisions outside the named modes are built fresh instead of growing the pool
+        pool_size = len(AdvancedPrecisionNumber._small_int_pool)
+        odd = AdvancedPrecisionNumber.from_int(2, 10, 123)
+        self.assertIsNot(odd, AdvancedPrecisionNumber.from_int(2, 10, 123))
+        self.assertEqual((odd.precision, str(odd)), (123, '2'))
+        self.assertEqual(len(AdvancedPrecisionNumber._small_int_pool), pool_size)
+        self.assertEqual(str(AdvancedPrecisionNumber.from_int(-7)), '-7')
+        big = 10 ** 60 + 1
+        self.assertEqual(AdvancedPrecisionNumber.from_int(big)._to_int(), big)
+        self.assertEqual(str(AdvancedPrecisionNumber.from_int(255, 16)), '0xff')
+        self.assertEqual(str(self.a * 2), '21')
+        with self.assertRaises(ValueError):
+            AdvancedPrecisionNumber.from_int(1, 40)
+
+    def test_newton_roots(self):
+        """Test sqrt, cube_root and nth_root to every digit of precision"""
+        from decimal import Decimal, getcontext
+        getcontext().prec = 1020
+        root2 = AdvancedPrecisionNumber('2', 10, 'extreme').sqrt()
+        self.assertEqual(str(root2)[:1001], str(Decimal(2).sqrt())[:1001])
+        self.assertEqual(str(AdvancedPrecisionNumber('-27').cube_root()), '-3')
+        self.assertEqual(str(AdvancedPrecisionNumber('0.001').cube_root()), '0.1')
+        self.assertEqual(str(AdvancedPrecisionNumber('1.5').nth_root(1)), '1.5')
+        fifth = AdvancedPrecisionNumber('7', 10, 'high').nth_root(5)
+        self.assertEqual(str(fifth)[:150], str(Decimal(7) ** (Decimal(1) / 5))[:150])
+        with self.assertRaises(ValueError):
+            self.negative.nth_root(4)
+        AdvancedPrecisionNumber.NEWTON_ROOT_THRESHOLD, saved = 1, AdvancedPrecisionNumber.NEWTON_ROOT_THRESHOLD
+        try:
+            n = 3 ** 5000
+            root = AdvancedPrecisionNumber._int_iroot(n, 2)
+            self.assertEqual(root, math.isqrt(n))
+            cube = AdvancedPrecisionNumber._int_iroot(n, 3)
+            self.assertTrue(cube ** 3 <= n < (cube + 1) ** 3)
+        finally:
+            AdvancedPrecisionNumber.NEWTON_ROOT_THRESHOLD = saved
+
+    def test_integer_roots(self):
+        """Test isqrt, iroot and perfect-power detection on exact integers"""
+        huge = AdvancedPrecisionNumber('1' + '0' * 2000, max_precision=5000)
+        self.assertEqual(str(huge.isqrt()), '1' + '0' * 1000)
+        self.assertEqual(str(AdvancedPrecisionNumber('17').isqrt()), '4')
+        self.assertEqual(str(AdvancedPrecisionNumber('-26').iroot(3)), '-2')
+        root = AdvancedPrecisionNumber.from_int(3 ** 500).iroot(7)._to_int()
+        self.assertTrue(root ** 7 <= 3 ** 500 < (root + 1) ** 7)
+        with self.assertRaises(ValueError):
+            self.a.isqrt()
+        self.assertTrue(huge.is_perfect_power())
+        self.assertTrue(AdvancedPrecisionNumber('-243').is_perfect_power())
+        self.assertFalse(AdvancedPrecisionNumber('-16').is_perfect_power())
+        self.assertFalse(AdvancedPrecisionNumber.from_int(2 * 3 ** 400).is_perfect_power())
+        self.assertFalse(self.a.is_perfect_power())
+
+    def test_modular_power(self):
+        """Test three-argument pow with both reductions and the direct remainder"""
+        self.assertEqual(str(pow(AdvancedPrecisionNumber('4'), 13, 497)), '445')
+        self.assertEqual(str(pow(AdvancedPrecisionNumber('-2'), 3, 5)), '2')
+        self.assertEqual(str(pow(AdvancedPrecisionNumber('2'), 3, -5)), '-2')
+        exponent = int('9' * 300)
+        modulus = 10 ** 299 + 7
+        result = pow(AdvancedPrecisionNumber('12345'), AdvancedPrecisionNumber('9' * 300), modulus)
+        self.assertEqual(result._to_int(), pow(12345, exponent, modulus))
+        odd, even = 3 ** 2000, 2 ** 6000 + 2
+        self.assertEqual(AdvancedPrecisionNumber._int_montgomery_power(12345, exponent, odd), pow(12345, exponent, odd))
+        self.assertEqual(AdvancedPrecisionNumber._int_barrett_power(12345, exponent, even), pow(12345, exponent, even))
+        with self.assertRaises(ValueError):
+            pow(self.a, 2, 7)
+        self.assertEqual(str(AdvancedPrecisionNumber('-7.5') % 2), '-1.5')
+
+    def test_exact_rational_mode(self):
+        """Test that rational-mode arithmetic stays exact and expands digits only for display"""
+        third = AdvancedPrecisionNumber('1/3', precision_mode='exact')
+        total = third + AdvancedPrecisionNumber(fraction=(1, 7))
+        self.assertEqual(total.fraction, fractions.Fraction(10, 21))
+        self.assertTrue(str(total).endswith('(Fraction: 10/21)'))
+        self.assertEqual(third * 3, 1)
+        harmonic = sum((AdvancedPrecisionNumber(fraction=(1, k)) for k in range(1, 40)), self.zero)
+        self.assertEqual(harmonic.to_fraction(), sum(fractions.Fraction(1, k) for k in range(1, 40)))
+        half = AdvancedPrecisionNumber(fraction='3/6')
+        self.assertEqual(half, AdvancedPrecisionNumber('0.5'))
+        self.assertEqual(hash(half), hash(AdvancedPrecisionNumber('0.5')))
+        self.assertEqual((-third) ** -2, 9)
+        self.assertEqual(str(AdvancedPrecisionNumber(fraction=(-7, 2)) % 2), '-1.5 (Fraction: -3/2)')
+        tiny = AdvancedPrecisionNumber(fraction=(1, 10 ** 80))
+        self.assertFalse(tiny == 0)
+        self.assertEqual(tiny * 10 ** 80, 1)
+        self.assertEqual(AdvancedPrecisionNumber('-0.5').to_fraction(), fractions.Fraction(-1, 2))
+        # An exact-mode copy takes its own ratio and max_precision, leaving the source untouched
+        source = AdvancedPrecisionNumber('1.5', max_precision=20)
+        copy = AdvancedPrecisionNumber(source, precision_mode='exact', max_precision=30)
+        self.assertEqual(copy.fraction, fractions.Fraction(3, 2))
+        self.assertEqual(copy.max_precision, 30)
+        self.assertEqual(str(source), '1.5')
+        self.assertIsNone(source.fraction)
+        self.assertEqual(source.max_precision, 20)
+
+    def test_gcd_lcm_and_modinv(self):
+        """Test gcd, lcm, xgcd and modinv, including the half-GCD path on large operands"""
+        self.assertEqual(str(AdvancedPrecisionNumber('12').gcd(-18)), '6')
+        self.assertEqual(str(AdvancedPrecisionNumber('4').lcm(6)), '12')
+        g, x, y = AdvancedPrecisionNumber('240').xgcd(46)
+        self.assertEqual((str(g), 240 * x._to_int() + 46 * y._to_int()), ('2', 2))
+        self.assertEqual(str(AdvancedPrecisionNumber('3').modinv(7)), '5')
+        self.assertEqual(str(pow(AdvancedPrecisionNumber('3'), -1, 7)), '5')
+        with self.assertRaises(ValueError):
+            AdvancedPrecisionNumber('2').modinv(4)
+        with self.assertRaises(ValueError):
+            self.a.gcd(2)
+        a, b = 3 ** 4000 * 7 ** 500, 2 ** 3000 * 7 ** 800 + 7 ** 500
+        self.assertEqual(AdvancedPrecisionNumber._int_gcd(a, b), math.gcd(a, b))
+        g, x, y = AdvancedPrecisionNumber._int_xgcd(a, -b)
+        self.assertEqual((g, a * x - b * y), (math.gcd(a, b), g))
+        matrix, a2, b2 = AdvancedPrecisionNumber._int_half_gcd(a, b)
+        self.assertTrue(a2 > b2 >= 0 and b2.bit_length() <= a.bit_length() // 2 < a2.bit_length())
+        self.assertEqual((matrix[0] * a2 + matrix[1] * b2, matrix[2] * a2 + matrix[3] * b2), (a, b))
+
+    def test_continued_fractions(self):
+        """Test continued fractions, convergents and exact best rational approximations"""
+        value = AdvancedPrecisionNumber(fraction=(415, 93))
+        self.assertEqual([str(t) for t in value.continued_fraction()], ['4', '2', '6', '7'])
+        self.assertEqual([str(t) for t in AdvancedPrecisionNumber('-0.5').continued_fraction()], ['-1', '2'])
+        pi = AdvancedPrecisionNumber._get_pi(200)
+        self.assertEqual([str(t) for t in pi.continued_fraction(5)], ['3', '7', '15', '1', '292'])
+        self.assertEqual(list(pi.convergents(200)), [fractions.Fraction(3), fractions.Fraction(22, 7),
+                                                     fractions.Fraction(333, 106), fractions.Fraction(355, 113)])
+        self.assertEqual(pi.to_fraction(1000), fractions.Fraction(355, 113))
+        # Far beyond the 53 bits a float carries
+        exact = pi.to_fraction()
+        for limit in (10 ** 60, 10 ** 150, 7):
+            self.assertEqual(pi.to_fraction(limit), exact.limit_denominator(limit))
+        self.assertEqual(AdvancedPrecisionNumber('0.5').as_fraction(), fractions.Fraction(1, 2))
+
+    def test_expression_parser(self):
+        """Test precedence, associativity, unary minus and calls in the shared expression engine"""
+        evaluate = lambda text, base=10: expression_engine.format_result(expression_engine.evaluate(text, base=base))
+        self.assertEqual(evaluate('1 + 2 * 3'), '7')
+        self.assertEqual(evaluate('(1 + 2) * (3 + 4) - ((10))'), '11')
+        self.assertEqual(evaluate('-2 ** 2'), '-4')
+        self.assertEqual(evaluate('2 ** 3 ** 2'), '512')
+        self.assertEqual(evaluate('2 ** -1'), '0.5')
+        self.assertEqual(evaluate('-17 % 5'), '-2')
+        self.assertEqual(evaluate('10 - 4 - 3'), '3')
+        self.assertEqual(evaluate('3! + factorial(4)'), '30')
+        self.assertEqual(evaluate('pow(4, 13, 497) + gcd(12, 18)'), '451')
+        self.assertEqual(evaluate('xgcd(240, 46)'), '(2, -9, 47)')
+        self.assertEqual(evaluate('continued_fraction(415 / 93, 4)'), '[4; 2, 6, 7]')
+        self.assertEqual(evaluate('(1 + 2i) * (3 - 4i)'), '11+2i')
+        self.assertEqual(evaluate('ff + 1', base=16), '0x100')
+        # Letters that are digits of the base are digits; _e and _pi are the constants in any base
+        self.assertEqual(evaluate('e + 1', base=16).lower(), '0xf')
+        self.assertEqual(evaluate('e + ee', base=16).lower(), '0xfc')
+        # In base 16 an e is a digit, so 1e-5 does not depend on spacing, while decimal reads an exponent
+        self.assertEqual(evaluate('1e-5', base=16), evaluate('1e - 5', base=16))
+        self.assertEqual(evaluate('2*1e-5', base=16).lower(), '0x37')
+        self.assertEqual(evaluate('1e-5'), '0.00001')
+        self.assertEqual(evaluate('_e'), evaluate('e'))
+        self.assertEqual(evaluate('pi', base=36), '[base36]pi')
+        self.assertTrue(evaluate('_pi', base=36).startswith('[base36]3.'))
+        self.assertEqual(evaluate('_i * _i', base=20), evaluate('-1', base=20))
+        self.assertEqual(evaluate('1 < 2'), 'True')
+        long_sum = ' + '.join(str(n) for n in range(1, 2001))
+        self.assertEqual(evaluate(f'({long_sum}) * 2'), str(2001 * 2000))
+        # Non-integer exponents are real powers, not truncated to an integer
+        self.assertNotEqual(evaluate('2 ** 0.5'), '1')
+        self.assertEqual(evaluate('2 ** (1 / 2)'), str(AdvancedPrecisionNumber('2').sqrt()))
+        # Exponents with a small denominator are exact roots, not truncated exp(y * ln x)
+        self.assertEqual(str(AdvancedPrecisionNumber('4') ** AdvancedPrecisionNumber('0.5')), '2')
+        self.assertEqual(evaluate('8 ** (1 / 3)'), '2')
+        self.assertEqual(evaluate('27 ** (2 / 3)'), '9')
+        self.assertEqual(evaluate('4 ** -0.5'), '0.5')
+        self.assertEqual(evaluate('(1 + 2i) ** (1 + i)')[:12], '-0.247200044')
+        for bad in ('1 +', '(1', '1 2', 'foo(1)', 'sqrt(1, 2)', '1..2', '1.2.3 + 1', '(1 == 1) + 1',
+                    '1 < 2 < 3', 'xgcd(4, 6) * 2', '(-8) ** 0.5'):
+            with self.assertRaises(ValueError):
+                expression_engine.evaluate(bad)
+
+    def test_expression_cache(self):
+        """Test that repeated expressions are served from the bounded compile and result caches"""
+        expression_engine.clear_caches()
+        first = expression_engine.evaluate('2 ** 10 + 1')
+        self.assertIs(expression_engine.evaluate('2 ** 10 + 1'), first)
+        # Different spacing shares the compiled tree but not the result entry
+        self.assertEqual(str(expression_engine.evaluate('2**10+1')), '1025')
+        self.assertEqual(str(expression_engine.evaluate('2**10+1', 'high')), '1025')
+        info = expression_engine.cache_info()
+        self.assertEqual((info['result']['hits'], info['result']['misses']), (1, 3))
+        self.assertEqual((info['compile']['hits'], info['compile']['misses']), (2, 1))
+        # A continued fraction list handed out from the cache cannot be changed by the caller
+        terms = expression_engine.evaluate('continued_fraction(415 / 93)')
+        count = len(terms)
+        terms.append(None)
+        self.assertEqual(len(expression_engine.evaluate('continued_fraction(415 / 93)')), count)
+
+        # Very large results are returned but not kept
+        size = expression_engine.cache_info()['result']['size']
+        self.assertEqual(expression_engine.evaluate('10000!')._to_int(), math.factorial(10000))
+        self.assertEqual(expression_engine.cache_info()['result']['size'], size)
+
+        cache = expression_engine._result_cache
+        saved = cache.max_size
+        try:
+            cache.max_size = 2
+            for n in range(5):
+                expression_engine.evaluate(f'{n} + 1')
+            self.assertEqual(expression_engine.cache_info()['result']['size'], 2)
+            self.assertEqual(str(expression_engine.evaluate('4 + 1')), '5')
+            self.assertEqual(cache.hits, 3)
+        finally:
+            cache.max_size = saved
+            expression_engine.clear_caches()
+
     def test_factorial(self):
         """Test factorial operation"""
         five = AdvancedPrecisionNumber('5')
@@ -175,6 +456,29 @@ class TestAdvancedPrecisionNumber(unittest.TestCase):
         zero_fact = self.zero.factorial()
         self.assertEqual(int(zero_fact._base_to_decimal()), 1)
 
+    def test_large_factorial(self):
+        """Test the prime-swing factorial and extension from the memo"""
+        AdvancedPrecisionNumber._factorial_memo.clear()
+        result = AdvancedPrecisionNumber('5000').factorial()
+        self.assertEqual(result._to_int(), math.factorial(5000))
+        result = AdvancedPrecisionNumber('5100').factorial()
+        self.assertEqual(result._to_int(), math.factorial(5100))
+        self.assertIn(5000, AdvancedPrecisionNumber._factorial_memo)
+        self.assertEqual(AdvancedPrecisionNumber._prime_swing_factorial(101), math.factorial(101))
+
+        # The memo is shared between threads, as in the Flask servers
+        from concurrent.futures import ThreadPoolExecutor
+        sizes = [200 + 37 * k for k in range(64)]
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(AdvancedPrecisionNumber._int_factorial, sizes))
+        self.assertEqual(results, [math.factorial(n) for n in sizes])
+        self.assertLessEqual(len(AdvancedPrecisionNumber._factorial_memo), AdvancedPrecisionNumber.FACTORIAL_MEMO_SIZE)
+
+    def test_parallel_factorial_and_product(self):
+        """Test the process-pool factorial and range-product paths against the standard library"""
+        self.assertEqual(AdvancedPrecisionNumber._parallel_factorial(3000, 2), math.factorial(3000))
+        self.assertEqual(AdvancedPrecisionNumber._range_product(5, 25004, 2), math.prod(range(5, 25005)))
+
     def test_power_operations(self):
         """Test exponentiation"""
         base = AdvancedPrecisionNumber('2')
@@ -261,6 +565,171 @@ class TestAdvancedPrecisionNumber(unittest.TestCase):
         num2 = AdvancedPrecisionNumber('10.5')
         self.assertEqual(hash(num1), hash(num2))
 
+    def test_scaled_integer_storage(self):
+        """Test exact arithmetic on the mantissa/exponent representation"""
+        big = AdvancedPrecisionNumber('1' + '0' * 60)
+        one = AdvancedPrecisionNumber('1')
+        result = (big + one) * (big - one)
+        self.assertEqual(str(result), '9' * 120)
+
+        # Division keeps every digit up to the working precision
+        third = AdvancedPrecisionNumber('1', 10, 'extreme') / AdvancedPrecisionNumber('3', 10, 'extreme')
+        self.assertEqual(str(third), '0.' + '3' * 1000)
+
+        # Digit lists are still available on demand
+        num = AdvancedPrecisionNumber('0x1f.8')
+        self.assertEqual(num.whole_digits, [1, 15])
+        self.assertEqual(num.fractional_digits[:2], [8, 0])
+
+    def test_multiplication_algorithms_agree(self):
+        """Test schoolbook, Karatsuba and Toom-3 give identical products"""
+        a = AdvancedPrecisionNumber('-' + '987654321' * 40 + '.125')
+        b = AdvancedPrecisionNumber('123456789' * 25 + '.5')
+        expected = a._standard_multiply(b)
+        self.assertEqual(str(a._karatsuba_multiply(b)), str(expected))
+        self.assertEqual(str(a._toom3_multiply(b)), str(expected))
+
+        # Force the dispatcher through every algorithm on multi-limb operands
+        saved = (AdvancedPrecisionNumber.KARATSUBA_THRESHOLD, AdvancedPrecisionNumber.TOOM3_THRESHOLD)
+        try:
+            AdvancedPrecisionNumber.KARATSUBA_THRESHOLD = 4
+            AdvancedPrecisionNumber.TOOM3_THRESHOLD = 16
+            x, y = 7 ** 3000, 3 ** 2500
+            self.assertEqual(AdvancedPrecisionNumber._int_multiply(x, y), x * y)
+            self.assertEqual(str(a * b), str(expected))
+        finally:
+            AdvancedPrecisionNumber.KARATSUBA_THRESHOLD, AdvancedPrecisionNumber.TOOM3_THRESHOLD = saved
+
+    def test_ntt_multiplication(self):
+        """Test the NTT product is exact, including lopsided operands"""
+        x, y = 3 ** 20000, 7 ** 3000 + 1
+        self.assertEqual(AdvancedPrecisionNumber._int_ntt_multiply(x, y), x * y)
+        self.assertEqual(AdvancedPrecisionNumber._int_ntt_multiply(x, x), x * x)
+        self.assertEqual(AdvancedPrecisionNumber._int_ntt_multiply(x, 0), 0)
+
+        a = AdvancedPrecisionNumber('-12345678901234567890.75')
+        b = AdvancedPrecisionNumber('98765432109876543210.5')
+        self.assertEqual(str(a._ntt_multiply(b)), str(a._standard_multiply(b)))
+
+    def test_squaring_kernels(self):
+        """Test the squaring kernels and the powers built on them"""
+        x = 3 ** 20000 + 12345
+        self.assertEqual(AdvancedPrecisionNumber._int_karatsuba_square(x), x * x)
+        self.assertEqual(AdvancedPrecisionNumber._int_toom3_square(x), x * x)
+        self.assertEqual(AdvancedPrecisionNumber._int_square(x), x * x)
+
+        a = AdvancedPrecisionNumber('-123.45')
+        self.assertEqual(str(a.sqr()), str(a * a))
+        self.assertEqual(str(a._karatsuba_square()), str(a * a))
+
+        # Exponents above 1000 take the sliding window path
+        self.assertEqual(AdvancedPrecisionNumber('7') ** 1013,
+                         AdvancedPrecisionNumber('7') ** 1000 * AdvancedPrecisionNumber('7') ** 13)
+        self.assertEqual(str(AdvancedPrecisionNumber('2') ** 1024)[-10:], str(2 ** 1024)[-10:])
+
+    def test_division_algorithms_agree(self):
+        """Test Burnikel-Ziegler and Newton-Raphson division against native divmod"""
+        a, b = 3 ** 40000 + 17, 7 ** 9000 + 1
+        self.assertEqual(AdvancedPrecisionNumber._int_burnikel_ziegler_divmod(a, b), divmod(a, b))
+        self.assertEqual(AdvancedPrecisionNumber._int_newton_divmod(a, b), divmod(a, b))
+        self.assertEqual(AdvancedPrecisionNumber._int_newton_divmod(b * b, b), (b, 0))
+        # The reciprocal recursion must end even with a tiny (calibrated) threshold
+        saved = AdvancedPrecisionNumber.BURNIKEL_ZIEGLER_THRESHOLD
+        try:
+            AdvancedPrecisionNumber.BURNIKEL_ZIEGLER_THRESHOLD = 2
+            self.assertEqual(AdvancedPrecisionNumber._int_newton_divmod(a, b), divmod(a, b))
+        finally:
+            AdvancedPrecisionNumber.BURNIKEL_ZIEGLER_THRESHOLD = saved
+
+        x = AdvancedPrecisionNumber('-22.5')
+        y = AdvancedPrecisionNumber('7')
+        expected = str(x / y)
+        self.assertEqual(str(x._newton_raphson_divide(y)), expected)
+        self.assertEqual(str(x._burnikel_ziegler_divide(y)), expected)
+        self.assertEqual(str(x._long_division(y, True)), expected)
+
+    def test_exact_comparisons(self):
+        """Test comparisons are exact beyond float range and precision"""
+        big = AdvancedPrecisionNumber('1' + '0' * 400)
+        self.assertTrue(big > AdvancedPrecisionNumber('9' * 399))
+        self.assertTrue(-big < AdvancedPrecisionNumber('-' + '9' * 399))
+        self.assertFalse(AdvancedPrecisionNumber('1.00000000000000000001') == self.one)
+        self.assertTrue(AdvancedPrecisionNumber('1.00000000000000000001') > self.one)
+        self.assertTrue(AdvancedPrecisionNumber('0.10') == AdvancedPrecisionNumber('0.1'))
+        self.assertTrue(AdvancedPrecisionNumber('0b1010') == AdvancedPrecisionNumber('10'))
+        self.assertTrue(self.negative < self.zero <= self.zero < self.b)
+        # Plain numbers are coerced; anything else is simply unequal and unordered
+        self.assertTrue(self.one == 1 and self.one < 1.5 and self.one > fractions.Fraction(2, 3))
+        self.assertTrue(self.one < float('inf') and not self.one == float('nan'))
+        self.assertFalse(self.one == None)
+        self.assertTrue(self.one != 'x')
+        self.assertNotIn(self.one, [None, 'x'])
+        self.assertIn(self.one, [None, 1])
+        with self.assertRaises(TypeError):
+            self.one < None
+
+    def test_chudnovsky_pi(self):
+        """Test pi digits and that lower precisions are served from the cache"""
+        pi = AdvancedPrecisionNumber._get_pi(120)
+        self.assertEqual(str(pi)[:52], '3.14159265358979323846264338327950288419716939937510')
+        self.assertEqual(str(pi)[-10:], '3282306647')
+        self.assertEqual(str(AdvancedPrecisionNumber._get_pi(30)), '3.141592653589793238462643383279')
+        self.assertIn(120, AdvancedPrecisionNumber._constant_cache['pi'])
+
+    def test_constant_engine(self):
+        """Test e, ln 2, ln 10, Euler gamma and sqrt 2 beyond the old 100-term limit"""
+        from decimal import Decimal, localcontext
+        with localcontext() as ctx:
+            ctx.prec = 420
+            expected = {'e': Decimal(1).exp(), 'ln2': Decimal(2).ln(),
+                        'ln10': Decimal(10).ln(), 'sqrt2': Decimal(2).sqrt()}
+        for name, value in expected.items():
+            digits = str(AdvancedPrecisionNumber._get_constant(name, 400))
+            self.assertEqual(digits, str(value)[:len(digits)], name)
+        self.assertEqual(str(AdvancedPrecisionNumber._get_euler_gamma(40)),
+                         '0.5772156649015328606065120900824024310421')
+
+    def test_log_exp_full_precision(self):
+        """Test log and exp are correct to the working precision and beyond float range"""
+        from decimal import Decimal, localcontext
+        x = AdvancedPrecisionNumber('3.7', 10, 'high')
+        with localcontext() as ctx:
+            ctx.prec = 250
+            self.assertLess(abs(Decimal(str(x.log())) - Decimal('3.7').ln()), Decimal(10) ** -199)
+            self.assertLess(abs(Decimal(str(x.exp())) - Decimal('3.7').exp()), Decimal(10) ** -199)
+            big = AdvancedPrecisionNumber('800').exp()
+            self.assertEqual(str(big)[:20], str(Decimal(800).exp())[:21].replace('.', ''))
+        self.assertEqual(str(AdvancedPrecisionNumber('1000').log(10)), '3')
+        self.assertEqual(str(AdvancedPrecisionNumber('8').log('0.5')), '-3')
+        self.assertEqual(str(self.zero.exp()), '1')
+
+    def test_sin_cos_kernel(self):
+        """Test the joint sin/cos kernel at high precision and for large arguments"""
+        x = AdvancedPrecisionNumber('1', 10, 'high')
+        sin_x, cos_x = x._sin_cos()
+        self.assertEqual(str(sin_x)[:52], '0.84147098480789650665250232163029899962256306079837')
+        self.assertEqual(str(cos_x)[:52], '0.54030230586813971740093660744297660373231042061792')
+        self.assertEqual(str(x.sin()), str(sin_x))
+        self.assertEqual(str(x.tan())[:40], str(sin_x / cos_x)[:40])
+
+        # One reduction step, however large the argument
+        big = AdvancedPrecisionNumber('1000000')
+        self.assertAlmostEqual(float(big.sin()._base_to_decimal()), math.sin(1000000), places=12)
+        self.assertEqual(str(self.zero.cos()), '1')
+
+    def test_arctan_engine(self):
+        """Test arctan at full precision, beyond |x| = 1, and the inverse functions built on it"""
+        one = AdvancedPrecisionNumber('1', 10, 'high')
+        self.assertEqual(str(one.arctan())[:60], str(AdvancedPrecisionNumber._get_pi(200) / 4)[:60])
+        self.assertAlmostEqual(float(AdvancedPrecisionNumber('-1000').arctan()._base_to_decimal()),
+                               math.atan(-1000), places=14)
+        self.assertAlmostEqual(float(AdvancedPrecisionNumber('0.5').arcsin()._base_to_decimal()),
+                               math.asin(0.5), places=14)
+        self.assertAlmostEqual(float(AdvancedPrecisionNumber('-0.3').arccos()._base_to_decimal()),
+                               math.acos(-0.3), places=14)
+        with self.assertRaises(ValueError):
+            AdvancedPrecisionNumber('1.5').arcsin()
+
 class TestComplexNumber(unittest.TestCase):
     def setUp(self):
         """Set up method to create complex number instances for testing"""
@@ -425,6 +894,19 @@ class TestComplexNumber(unittest.TestCase):
         import math
         self.assertAlmostEqual(float(arg._base_to_decimal()), math.pi/4, places=5)
 
+        # The argument keeps its quadrant
+        arg = ComplexNumber('-1', '-1').arg()
+        self.assertAlmostEqual(float(arg._base_to_decimal()), -3 * math.pi / 4, places=14)
+
+        # Mixed precisions give the argument at the higher one, whichever part carries it
+        standard = AdvancedPrecisionNumber('1', precision_mode='standard')
+        high = AdvancedPrecisionNumber('1', precision_mode='high')
+        quarter_pi = (AdvancedPrecisionNumber._get_pi(200) / AdvancedPrecisionNumber('4', precision_mode='high'))
+        for z in (ComplexNumber(standard, high), ComplexNumber(high, standard)):
+            arg = z.arg()
+            self.assertEqual(arg.precision, 200)
+            self.assertEqual(str(arg)[:190], str(quarter_pi)[:190])
+
     def test_exponential_and_logarithm(self):
         """Test complex exponential and logarithm functions"""
         # Test Euler's identity: e^(i*pi) = -1